@@ -0,0 +1,332 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import cached_property
+
+import numpy as np
+import pyarrow as pa
+
+from corpus import CorpusAnalysis
+from query import FilterIndex
+from sampling import sample_pool, sampling_seed
+from story_order import StoryOrder
+from tokenizer import tokenizer_fingerprint
+
+
+# 미리 계산한 대시보드 집계 파일 (Arrow IPC, 앱에서 memory-map으로 읽음)
+AGGREGATES_PATH = os.environ.get("FASHION_AGGREGATES_PATH", "./resource/corpus/aggregates.arrow")
+AGGREGATES_FORMAT_VERSION = "4"
+
+# 필터를 적용하지 않는 선택값
+ALL_VALUE = "All"
+
+# 조합마다 저장하는 개수
+TOP_KEYWORDS = 50
+TOP_BIGRAM_WORDS = 5
+TOP_BIGRAMS = 3
+EXAMPLES_PER_ELEMENT = 10
+EXAMPLES_PER_SUB_ELEMENT = 3
+STORY_ORDERS = 10
+
+# 조회 결과(AggregateView) 캐시 크기 (필터 조합 수 기준)
+VIEW_CACHE_SIZE = 64
+
+# Product detail treemap 키워드 (dashboard.build_treemap_figure의 keyword 컬럼과 같은 목록)
+TREEMAP_KEYWORDS = ["레귤러", "타이트", "오버사이즈", "코튼", "폴리에스터", "레이온", "미니멀", "로맨틱", "캐주얼"]
+
+# 집계 테이블 스키마 (kind별 한 행 = 집계 값 하나)
+#   element_order : label=요소, rank=순서 (대표 스토리 구성 순서)
+#   story_order   : label=요소 목록(탭 구분), value=캠페인 수, rank
+#   story_support : label=요소, value=등장 캠페인 수
+#   story_start   : label=요소, value=첫 요소로 등장한 캠페인 수
+#   story_transition : label=이전 요소, related=다음 요소, value=캠페인 수
+#   story_campaigns  : value=분석한 캠페인 수
+#   keyword       : element, label=키워드, value=빈도, rank
+#   bigram        : element, label=키워드, related=bigram, rank
+#   sub_element   : element, label=세부 요소, value=문장 수
+#   sub_example   : element, label=세부 요소, related=예시 문장, rank
+#   example       : element, related=예시 문장, rank
+#   mention       : element, label=키워드, value=언급 수, related=첫 예시 문장
+AGGREGATES_SCHEMA = pa.schema([
+    ("kind", pa.string()),
+    ("element", pa.string()),
+    ("label", pa.string()),
+    ("related", pa.string()),
+    ("value", pa.float64()),
+    ("rank", pa.int32()),
+])
+
+
+def aggregate_key(item, season, gender):
+    return "|".join(value or ALL_VALUE for value in (item, season, gender))
+
+
+# 사이드바에서 선택 가능한 모든 필터 조합 (코퍼스에 있는 값 + "All")
+def filter_combinations(corpus):
+    def values(col):
+        return list(corpus.categories.get(col, [])) + [ALL_VALUE]
+    return [(item, season, gender)
+            for item in values("item")
+            for season in values("season")
+            for gender in values("gender")]
+
+
+# 캠페인 (item, season, gender)이 포함되는 필터 조합 키 (각 값 또는 "All")
+def campaign_aggregate_keys(item, season, gender):
+    return {aggregate_key(i, s, g)
+            for i in {item, ALL_VALUE}
+            for s in {season, ALL_VALUE}
+            for g in {gender, ALL_VALUE}}
+
+
+# 이전 집계 이후 추가 / 변경 / 삭제된 캠페인이 포함되는 필터 조합 키
+# manifest: 캠페인 ID → [내용 해시, item, season, gender] (Corpus.campaign_manifest)
+def affected_aggregate_keys(previous_manifest, manifest):
+    keys = set()
+    for campaigns, others in ((previous_manifest, manifest), (manifest, previous_manifest)):
+        for campaign_id, (digest, *values) in campaigns.items():
+            other = others.get(campaign_id)
+            if other is None or other[0] != digest:
+                keys |= campaign_aggregate_keys(*values)
+    return keys
+
+
+# 필터 조합 하나의 집계 → 컬럼별 리스트
+def compute_aggregates(analysis, elements):
+    rows = {name: [] for name in AGGREGATES_SCHEMA.names}
+
+    def add(kind, element=None, label=None, related=None, value=None, rank=None):
+        for name, v in zip(AGGREGATES_SCHEMA.names, (kind, element, label, related, value, rank)):
+            rows[name].append(v)
+
+    story = analysis.story_order(STORY_ORDERS)
+    for rank, element in enumerate(story.consensus):
+        add("element_order", label=element, rank=rank)
+    for rank, (order, count) in enumerate(story.orders):
+        add("story_order", label="\t".join(order), value=count, rank=rank)
+    for element, support, starts in zip(story.elements, story.support, story.starts):
+        add("story_support", label=element, value=support)
+        add("story_start", label=element, value=starts)
+    for a, b in zip(*np.nonzero(story.transitions)):
+        add("story_transition", label=story.elements[a], related=story.elements[b], value=story.transitions[a, b])
+    add("story_campaigns", value=story.n_campaigns)
+
+    for element in elements:
+        for rank, (word, count) in enumerate(analysis.keyword_counts(element, TOP_KEYWORDS).items()):
+            add("keyword", element, word, value=count, rank=rank)
+        for word, bigrams in analysis.top_bigrams(element, TOP_BIGRAM_WORDS, TOP_BIGRAMS).items():
+            for rank, bigram in enumerate(bigrams):
+                add("bigram", element, word, bigram, rank=rank)
+        for label, count in analysis.sub_element_counts(element).items():
+            add("sub_element", element, label, value=count)
+        for label, sentences in analysis.sub_element_examples(element, EXAMPLES_PER_SUB_ELEMENT).items():
+            for rank, sentence in enumerate(sentences):
+                add("sub_example", element, label, sentence, rank=rank)
+        for rank, sentence in enumerate(analysis.example_sentences(element, EXAMPLES_PER_ELEMENT)):
+            add("example", element, related=sentence, rank=rank)
+
+    counts, examples = analysis.keyword_mentions("Product detail", TREEMAP_KEYWORDS)
+    for keyword, count, example in zip(TREEMAP_KEYWORDS, counts, examples):
+        add("mention", "Product detail", keyword, example, value=count)
+    return rows
+
+
+# 모든 필터 조합의 집계를 Arrow IPC 파일 하나로 저장
+# 조합별 (시작 행, 행 수)는 스키마 메타데이터의 index에, 캠페인 manifest는 manifest에 기록한다
+# previous(이전 Aggregates)를 주면 바뀐 캠페인이 포함되지 않는 조합은 이전 집계를 그대로 복사한다
+def write_aggregates(corpus, path=AGGREGATES_PATH, analysis_factory=None, progress=None, previous=None):
+    filter_index = FilterIndex(corpus)
+    analysis_factory = analysis_factory or (lambda view: CorpusAnalysis(view))
+    combinations = filter_combinations(corpus)
+    manifest = corpus.campaign_manifest
+
+    reusable = set()
+    if previous is not None and previous.elements == corpus.elements:
+        reusable = set(previous.keys()) - affected_aggregate_keys(previous.manifest, manifest)
+
+    batches, index, offset, recomputed = [], {}, 0, 0
+    for i, (item, season, gender) in enumerate(combinations):
+        key = aggregate_key(item, season, gender)
+        if key in reusable:
+            batch = previous.rows(key)
+        else:
+            analysis = analysis_factory(filter_index.query(item, season, gender))
+            batch = pa.RecordBatch.from_pydict(compute_aggregates(analysis, corpus.elements), schema=AGGREGATES_SCHEMA)
+            recomputed += 1
+        index[key] = [offset, batch.num_rows]
+        offset += batch.num_rows
+        batches.append(batch)
+        if progress:
+            progress(i + 1, len(combinations))
+
+    metadata = {
+        "format_version": AGGREGATES_FORMAT_VERSION,
+        "corpus_version": corpus.version,
+        "tokenizer": tokenizer_fingerprint(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "elements": json.dumps(corpus.elements, ensure_ascii=False),
+        "index": json.dumps(index, ensure_ascii=False),
+        "manifest": json.dumps(manifest, ensure_ascii=False),
+        "recomputed": str(recomputed),
+    }
+    schema = AGGREGATES_SCHEMA.with_metadata(metadata)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in batches:
+            writer.write(batch)
+    os.replace(tmp_path, path)
+    return metadata
+
+
+# 집계 파일 (memory-map, 필터 조합 조회는 index로 O(1) 슬라이스)
+class Aggregates:
+    def __init__(self, path=AGGREGATES_PATH):
+        self.path = path
+        source = pa.memory_map(path, 'r')
+        self.table = pa.ipc.open_file(source).read_all()
+        metadata = {k.decode(): v.decode() for k, v in (self.table.schema.metadata or {}).items()}
+        if metadata.get("format_version") != AGGREGATES_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 집계 파일 형식입니다: {metadata.get('format_version')}")
+        # 다른 토큰 설정(조사 제거 여부 등)으로 만든 집계는 키워드가 달라지므로 사용하지 않는다
+        if metadata.get("tokenizer") != tokenizer_fingerprint():
+            raise ValueError(f"토큰 설정이 다른 집계 파일입니다: {metadata.get('tokenizer')}")
+        self.metadata = metadata
+        # 렌더링 캐시 키용 버전 (코퍼스 버전 + 토큰 설정)
+        self.version = f"{metadata['corpus_version']}-{metadata['tokenizer']}"
+        self.elements = json.loads(metadata["elements"])
+        self._index = json.loads(metadata["index"])
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    @cached_property
+    def manifest(self):
+        return json.loads(self.metadata["manifest"])
+
+    def keys(self):
+        return self._index.keys()
+
+    # 필터 조합 하나의 집계 행 (memory-map 슬라이스)
+    def rows(self, key):
+        offset, length = self._index.get(key, (0, 0))
+        return self.table.slice(offset, length)
+
+    # 필터 조합 → AggregateView (to_pandas + groupby는 조합당 한 번, rerun은 캐시된 view를 그대로 쓴다)
+    # get_aggregates로 모든 세션 스레드가 같은 객체를 쓰므로 캐시는 lock 안에서만 읽고 쓴다
+    def lookup(self, item=None, season=None, gender=None):
+        key = aggregate_key(item, season, gender)
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return view
+
+        view = AggregateView(self.rows(key), [self.version, key], self.elements)
+        with self._lock:
+            self._views[key] = view
+            if len(self._views) > VIEW_CACHE_SIZE:
+                self._views.popitem(last=False)
+        return view
+
+
+# 집계 파일 로딩 (파일이 없거나 형식 / 토큰 설정이 다르면 None → 코퍼스에서 직접 계산)
+def load_aggregates(path=AGGREGATES_PATH):
+    if not os.path.exists(path):
+        return None
+    try:
+        return Aggregates(path)
+    except ValueError:
+        return None
+
+
+# 필터 조합 하나의 집계 조회 결과 (corpus.CorpusAnalysis와 같은 메서드 제공)
+class AggregateView:
+    def __init__(self, table, cache_key, elements=()):
+        self.cache_key = cache_key
+        self.elements = list(elements)
+        self._df = table.to_pandas()
+        self._groups = {key: group for key, group in self._df.groupby(["kind", "element"], dropna=False, sort=False)}
+
+    def _group(self, kind, element=None):
+        group = self._groups.get((kind, element))
+        return group if group is not None else self._df.iloc[0:0]
+
+    # 요소와 무관한 집계 행
+    def _kind(self, kind):
+        return self._df[self._df["kind"] == kind]
+
+    def element_order(self):
+        rows = self._kind("element_order").sort_values("rank")
+        return list(rows["label"])
+
+    def story_order(self, top_k=5):
+        index = {element: i for i, element in enumerate(self.elements)}
+        n = len(self.elements)
+
+        def per_element(kind):
+            values = np.zeros(n, dtype=np.int64)
+            rows = self._kind(kind)
+            for label, value in zip(rows["label"], rows["value"]):
+                if label in index:
+                    values[index[label]] = int(value)
+            return values
+
+        transitions = np.zeros((n, n), dtype=np.int64)
+        rows = self._kind("story_transition")
+        for a, b, value in zip(rows["label"], rows["related"], rows["value"]):
+            if a in index and b in index:
+                transitions[index[a], index[b]] = int(value)
+        orders = self._kind("story_order").sort_values("rank").head(top_k)
+        campaigns = self._kind("story_campaigns")["value"]
+        return StoryOrder(
+            self.elements,
+            int(campaigns.iloc[0]) if len(campaigns) else 0,
+            per_element("story_support"),
+            per_element("story_start"),
+            transitions,
+            [(label.split("\t"), int(value)) for label, value in zip(orders["label"], orders["value"])],
+            self.element_order(),
+        )
+
+    def keyword_counts(self, element, n=None):
+        rows = self._group("keyword", element).sort_values("rank")
+        if n is not None:
+            rows = rows.head(n)
+        return {label: int(value) for label, value in zip(rows["label"], rows["value"])}
+
+    def top_bigrams(self, element, top_n_words=5, top_n_bigrams=3):
+        result = {}
+        for label, related, rank in zip(*(self._group("bigram", element)[col] for col in ("label", "related", "rank"))):
+            bigrams = result.setdefault(label, [])
+            if rank < top_n_bigrams:
+                bigrams.append(related)
+        return dict(list(result.items())[:top_n_words])
+
+    # 저장된 예시 문장 중 n개 (세션 시드 + 필터 조건 + 요소가 같으면 같은 문장)
+    def example_sentences(self, element, n=3, seed=None):
+        examples = np.asarray(self._group("example", element).sort_values("rank")["related"], dtype=object)
+        return list(examples[sample_pool(np.arange(len(examples)), n, sampling_seed(seed, self.cache_key, element))])
+
+    def sub_element_counts(self, element):
+        rows = self._group("sub_element", element)
+        return {label: int(value) for label, value in zip(rows["label"], rows["value"])}
+
+    def sub_element_examples(self, element, n=3):
+        examples = {}
+        for label, related in zip(*(self._group("sub_example", element).sort_values(["label", "rank"])[col]
+                                    for col in ("label", "related"))):
+            sentences = examples.setdefault(label, [])
+            if len(sentences) < n:
+                sentences.append(related)
+        return examples
+
+    # 미리 계산된 treemap 키워드만 조회 가능 (그 외 키워드는 0)
+    def keyword_mentions(self, element, keywords):
+        rows = self._group("mention", element)
+        mentions = {label: (int(value), related) for label, value, related in zip(rows["label"], rows["value"], rows["related"])}
+        counts = [mentions.get(keyword, (0, None))[0] for keyword in keywords]
+        examples = [mentions.get(keyword, (0, None))[1] for keyword in keywords]
+        return counts, examples
@@ -0,0 +1,125 @@
+import pytest
+
+from corpus import (Corpus, get_element_order, get_example_sentences, get_keyword_counts, get_keywords,
+                    get_story_order, get_top_bigrams, read_sentence_table)
+from draft_analysis import DraftAnalyzer
+from font_utils import get_korean_fonts, scan_korean_fonts
+from query import CorpusView, FilterIndex
+from search_index import SearchIndex
+from similarity import SimilarityIndex
+from text_stats import KeywordStats
+from tokenizer import tokenize
+
+
+# 대시보드 데이터 경로 벤치마크 (Streamlit 없이 헬퍼 함수만 호출)
+# 필터 결과 뷰는 매 라운드 새로 만들어서 필터를 바꾼 직후의 첫 렌더링 비용을 잰다
+
+ELEMENT = "Product detail"
+KEYWORD = "코튼"
+DRAFT_SENTENCES = 300
+
+
+def fresh_view(filter_index, **filters):
+    view = filter_index.query(**filters)
+    return CorpusView(view.base, view.mask, view.filters)
+
+
+def test_corpus_load(measure, corpus, tmp_path_factory):
+    path = tmp_path_factory.mktemp("corpus") / "corpus.parquet"
+    corpus.df.to_parquet(path, index=False)
+    measure(lambda: Corpus(read_sentence_table(str(path))))
+
+
+def test_keyword_stats_build(measure, corpus, corpus_size):
+    measure(lambda: KeywordStats.build(corpus), rounds=1 if corpus_size >= 1_000_000 else 3, probe="rss")
+
+
+def test_story_order(measure, corpus):
+    measure(lambda: get_story_order(corpus))
+
+
+def test_element_order(measure, filter_index):
+    measure(get_element_order, setup=lambda: ((fresh_view(filter_index, item="Top"),), {}))
+
+
+def test_filter_query(measure, corpus):
+    # 인덱스를 매번 새로 만들어서 키워드 비트맵 생성까지 포함
+    measure(lambda index: index.query(item="Top", season="Winter", keywords=(KEYWORD,)),
+            setup=lambda: ((FilterIndex(corpus),), {}))
+
+
+def test_search_index_build(measure, corpus):
+    stats = corpus.keyword_stats
+    measure(lambda: SearchIndex.from_counts(stats.sentence_unigrams, stats.unigram_vocab, corpus.campaign_starts),
+            rounds=3)
+
+
+# 한 단어 / 접두어 (어휘 구간 여러 개) / 한 글자 접두어 / 두 단어 AND, 검색 캐시는 매 라운드 비운다
+@pytest.mark.parametrize("terms", [(KEYWORD,), ("레귤",), ("코",), (KEYWORD, "편안함")],
+                         ids=["term", "prefix", "initial", "and"])
+def test_search(measure, corpus, terms):
+    def setup():
+        corpus.search_index._cache.clear()
+        return (), {}
+    measure(lambda: corpus.search_index.search(terms), setup=setup)
+
+
+def test_similarity_build(measure, corpus, corpus_size):
+    measure(lambda: SimilarityIndex.build(corpus), rounds=1 if corpus_size >= 1_000_000 else 3)
+
+
+# 캠페인 하나의 앞 문장들을 초안으로 사용 (캠페인 전체 / 요소 문서, 정확 / champion list 근사)
+@pytest.mark.parametrize("element", [None, ELEMENT], ids=["campaign", "element"])
+@pytest.mark.parametrize("approximate", [False, True], ids=["exact", "approximate"])
+def test_similarity_query(measure, corpus, similarity_index, element, approximate):
+    draft = " ".join(corpus.sentences[corpus.campaign_starts[0]:corpus.campaign_starts[1]][:5])
+    measure(lambda: similarity_index.similar_campaigns(draft, 5, element, approximate))
+
+
+def test_draft_analyzer_fit(measure, corpus):
+    measure(lambda: DraftAnalyzer.fit(corpus), rounds=3)
+
+
+# 코퍼스 문장 300개를 이어 붙인 초안 (문장 분리 + 분류 + 코퍼스 비교 전체)
+def test_draft_analysis(measure, corpus):
+    analyzer = DraftAnalyzer.fit(corpus)
+    step = max(len(corpus) // DRAFT_SENTENCES, 1)
+    draft = "\n".join(corpus.sentences[::step][:DRAFT_SENTENCES])
+    measure(lambda: analyzer.analyze(draft))
+
+
+def test_keywords_tokenize(measure, filter_index):
+    def setup():
+        tokenize.cache_clear()
+        return (fresh_view(filter_index, item="Top"), ELEMENT), {}
+    measure(get_keywords, setup=setup)
+
+
+@pytest.mark.parametrize("keywords", [(), (KEYWORD,)], ids=["cells", "keyword-rows"])
+def test_keyword_counts(measure, filter_index, keywords):
+    measure(lambda view: get_keyword_counts(view, ELEMENT, 30),
+            setup=lambda: ((fresh_view(filter_index, item="Top", keywords=keywords),), {}))
+
+
+def test_top_bigrams(measure, filter_index):
+    measure(lambda view: get_top_bigrams(view, ELEMENT),
+            setup=lambda: ((fresh_view(filter_index, item="Top"),), {}))
+
+
+def test_example_sentences(measure, filter_index):
+    measure(lambda view: get_example_sentences(view, ELEMENT, 3, seed=0),
+            setup=lambda: ((fresh_view(filter_index, item="Top"),), {}))
+
+
+def test_font_scan(measure):
+    measure(scan_korean_fonts, rounds=3)
+
+
+# 디스크 캐시가 있는 경우의 한글 폰트 목록 (프로세스 시작 시 비용)
+def test_font_cache(measure):
+    get_korean_fonts()
+
+    def setup():
+        get_korean_fonts.cache_clear()
+        return (), {}
+    measure(get_korean_fonts, setup=setup)
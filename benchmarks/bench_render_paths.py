@@ -0,0 +1,39 @@
+import pytest
+
+from charts import build_transition_figure, build_treemap_figure, wordcloud_png
+from corpus import CorpusAnalysis, get_keyword_counts, get_story_order
+from font_utils import get_font_path
+from query import CorpusView
+
+
+# 대시보드 차트 생성 벤치마크 (figure / PNG 생성과 브라우저로 보내는 JSON 직렬화)
+
+
+def fresh_analysis(filter_index, **filters):
+    view = filter_index.query(**filters)
+    return CorpusAnalysis(CorpusView(view.base, view.mask, view.filters))
+
+
+@pytest.fixture(scope="session")
+def keyword_freq(filter_index):
+    return get_keyword_counts(filter_index.query(), "Problem/need", 100)
+
+
+def test_wordcloud_png(measure, keyword_freq):
+    measure(lambda: wordcloud_png(keyword_freq, get_font_path()), rounds=3)
+
+
+def test_treemap_figure(measure, filter_index):
+    # plotly 지연 import가 첫 측정에 섞이지 않도록 한 번 먼저 만든다
+    build_treemap_figure(fresh_analysis(filter_index, item="Top"))
+    measure(build_treemap_figure, setup=lambda: ((fresh_analysis(filter_index, item="Top"),), {}))
+
+
+def test_treemap_json(measure, filter_index):
+    fig = build_treemap_figure(fresh_analysis(filter_index, item="Top"))
+    measure(fig.to_json)
+
+
+def test_transition_figure(measure, corpus):
+    story = get_story_order(corpus)
+    measure(lambda: build_transition_figure(story).to_json())
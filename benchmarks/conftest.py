@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+# 대시보드 모듈은 저장소 루트의 최상위 모듈
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synthetic import synthetic_corpus_frame  # noqa: E402
+
+# 코퍼스 크기 (문장 수)
+DEFAULT_CORPUS_SIZES = "1k,100k,1m"
+SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+# 메모리 최대 사용량 기준값 ({측정 방식: {테스트 ID → 바이트}})
+MEMORY_BASELINE_PATH = os.path.join(BENCH_DIR, "memory_baseline.json")
+MEMORY_TOLERANCE = 0.25
+# 작은 측정값의 잡음은 허용 (기준값과 관계없이 이만큼은 늘어나도 통과)
+MEMORY_SLACK_BYTES = 1 << 20
+
+
+# 최대 메모리 측정 방식
+#   tracemalloc: 파이썬 할당 추적 (기본값, 작은 할당까지 정확하게 잰다)
+#   rss        : 리눅스 프로세스 최대 RSS 증가분 (/proc/self/clear_refs로 초기화 후 VmHWM - 시작 RSS)
+#                할당이 아주 많은 경로(1m 규모 통계 생성 등)는 tracemalloc 추적 비용만으로 메모리가 부족해서 사용
+#                /proc를 쓸 수 없는 OS에서는 tracemalloc으로 대신 잰다
+PROC_STATUS_PATH = "/proc/self/status"
+PROC_CLEAR_REFS_PATH = "/proc/self/clear_refs"
+
+
+def _proc_status_kib(field):
+    with open(PROC_STATUS_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise OSError(f"{field} not found")
+
+
+def _reset_peak_rss():
+    with open(PROC_CLEAR_REFS_PATH, "w") as f:
+        f.write("5")
+
+
+def rss_available():
+    try:
+        _reset_peak_rss()
+        _proc_status_kib("VmHWM")
+    except OSError:
+        return False
+    return True
+
+
+def peak_memory(probe, fn, *args, **kwargs):
+    if probe == "rss":
+        _reset_peak_rss()
+        start = _proc_status_kib("VmRSS")
+        fn(*args, **kwargs)
+        return max(_proc_status_kib("VmHWM") - start, 0) * 1024
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_corpus_size(label):
+    label = label.strip().lower()
+    if label[-1:] in SIZE_SUFFIXES:
+        return int(float(label[:-1]) * SIZE_SUFFIXES[label[-1]])
+    return int(label)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fashion benchmarks")
+    group.addoption("--corpus-sizes", default=DEFAULT_CORPUS_SIZES,
+                    help=f"합성 코퍼스 문장 수 목록 (기본값: {DEFAULT_CORPUS_SIZES})")
+    group.addoption("--memory-baseline", default=MEMORY_BASELINE_PATH,
+                    help="메모리 최대 사용량 기준 파일")
+    group.addoption("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                    help=f"기준값 대비 허용 증가율 (기본값: {MEMORY_TOLERANCE})")
+    group.addoption("--save-memory-baseline", action="store_true",
+                    help="이번 실행의 메모리 최대 사용량을 기준 파일에 저장")
+
+
+def pytest_generate_tests(metafunc):
+    if "corpus_size" in metafunc.fixturenames:
+        labels = [label.strip() for label in metafunc.config.getoption("corpus_sizes").split(",") if label.strip()]
+        metafunc.parametrize("corpus_size", [parse_corpus_size(label) for label in labels],
+                             ids=labels, scope="session")
+
+
+@pytest.fixture(scope="session")
+def corpus(corpus_size):
+    from corpus import Corpus
+    from text_stats import KeywordStats
+
+    corpus = Corpus(synthetic_corpus_frame(corpus_size))
+    # 디스크 캐시(.cache/keyword_stats)를 건드리지 않도록 통계를 직접 만들어서 넣는다
+    corpus._keyword_stats = KeywordStats.build(corpus)
+    # 대시보드처럼 검색 역색인도 로딩 때 만들어 둔다
+    corpus.search_index
+    return corpus
+
+
+@pytest.fixture(scope="session")
+def filter_index(corpus):
+    from query import FilterIndex
+    return FilterIndex(corpus)
+
+
+@pytest.fixture(scope="session")
+def similarity_index(corpus):
+    from similarity import SimilarityIndex
+    return SimilarityIndex.build(corpus)
+
+
+# 메모리 기준값 비교 / 저장
+# 측정 방식이 다르면 값을 비교할 수 없으므로 방식별로 따로 저장한다
+class MemoryBaseline:
+    def __init__(self, path, tolerance, save):
+        self.path = path
+        self.tolerance = tolerance
+        self.save = save
+        self.rss_available = rss_available()
+        self.measured = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.baseline = json.load(f)
+        except (OSError, ValueError):
+            self.baseline = {}
+
+    def probe(self, requested):
+        return "rss" if requested == "rss" and self.rss_available else "tracemalloc"
+
+    def check(self, probe, test_id, peak):
+        self.measured.setdefault(probe, {})[test_id] = peak
+        expected = self.baseline.get(probe, {}).get(test_id)
+        if self.save or expected is None:
+            return
+        limit = expected * (1 + self.tolerance) + MEMORY_SLACK_BYTES
+        if peak > limit:
+            pytest.fail(f"메모리 회귀: 최대 {peak / 2**20:.2f} MiB > 기준 {expected / 2**20:.2f} MiB "
+                        f"(+{self.tolerance:.0%} 허용)")
+
+    def write(self):
+        stored = dict(self.baseline)
+        for probe, peaks in self.measured.items():
+            stored[probe] = {**stored.get(probe, {}), **peaks}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(request):
+    config = request.config
+    baseline = MemoryBaseline(config.getoption("memory_baseline"), config.getoption("memory_tolerance"),
+                              config.getoption("save_memory_baseline"))
+    yield baseline
+    if baseline.save and baseline.measured:
+        baseline.write()
+
+
+# fn 한 번 실행의 메모리 최대 사용량을 잰 뒤 pytest-benchmark로 시간 측정
+# setup: 매 라운드 전에 호출되어 (args, kwargs)를 돌려준다 (캐시 비우기 등, 측정 시간에서 제외)
+@pytest.fixture
+def measure(benchmark, request, memory_baseline):
+    def run(fn, setup=None, rounds=5, probe="tracemalloc"):
+        args, kwargs = setup() if setup else ((), {})
+        probe = memory_baseline.probe(probe)
+        peak = peak_memory(probe, fn, *args, **kwargs)
+        benchmark.extra_info["memory_probe"] = probe
+        benchmark.extra_info["peak_memory_bytes"] = peak
+        memory_baseline.check(probe, request.node.nodeid, peak)
+
+        if setup is None:
+            return benchmark.pedantic(fn, rounds=rounds)
+        return benchmark.pedantic(fn, setup=setup, rounds=rounds)
+    return run
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+
+# 벤치마크용 합성 코퍼스 (resource/corpus 문장 테이블과 같은 컬럼)
+# 실제 캠페인처럼 요소 순서는 대체로 비슷하지만 캠페인마다 조금씩 섞이고,
+# 단어 빈도는 Zipf 분포를 따르도록 만든다
+
+ELEMENTS = {
+    "Problem/need": [None],
+    "Product value": ["Functional", "Expressive", "Aesthetic"],
+    "Product detail": ["Fit", "Material", "Color"],
+    "Brand": ["Brand identity", "Creator profile/history", "Project goal", "Funding usage"],
+    "External evaluation": ["Third-party evaluations", "Certificate", "Award"],
+    "Request to funders": ["Discounts", "Early bird benefits", "Special offers"],
+    "FAQ": ["Shipping/return/exchange", "Washing/care", "Customer concerns", "Product usage"],
+}
+ITEMS = ["Top", "Jacket", "Jumper", "Padding", "Vest", "Cardigan", "Coat", "Blouse", "T-shirt", "Pants", "Skirt", "Dress"]
+SEASONS = ["Summer", "Winter", "Spring", "Autumn"]
+GENDERS = ["Female", "Male", "Unisex"]
+
+# 대시보드에서 찾는 키워드 (treemap / 사이드바 키워드 포함)
+BASE_WORDS = (
+    "레귤러 타이트 오버사이즈 코튼 폴리에스터 레이온 미니멀 로맨틱 캐주얼 트렌디 편안함 고급스러움 러블리 유니크 "
+    "시크 페미닌 보온성 통기성 신축성 경량성 흡습속건 방수 내구성 착용감 소재 핏 세탁 형태 유지 얼리버드 할인 혜택 "
+    "배송 인증 수상 브랜드 철학 불편함 가성비 계절감 디자인 컬러 제품 사이즈 원단 스타일 데일리 여름 겨울"
+).split()
+SYLLABLES = list("가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히")
+SENTENCES_PER_CAMPAIGN = 14
+VOCAB_SIZE = 5000
+
+
+def _vocabulary(rng):
+    words = list(BASE_WORDS)
+    seen = set(words)
+    while len(words) < VOCAB_SIZE:
+        word = "".join(rng.choice(SYLLABLES, size=rng.integers(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return np.asarray(words, dtype=object)
+
+
+# 문장 n개짜리 코퍼스 DataFrame
+def synthetic_corpus_frame(n_sentences, seed=0):
+    rng = np.random.default_rng(seed)
+    vocab = _vocabulary(rng)
+    n_campaigns = max(1, n_sentences // SENTENCES_PER_CAMPAIGN)
+
+    campaign = np.sort(rng.integers(0, n_campaigns, size=n_sentences))
+    elements = list(ELEMENTS)
+    element = rng.integers(0, len(elements), size=n_sentences)
+    # 요소 기본 순서 + 잡음으로 캠페인 안의 문장 순서 정하기
+    order = np.lexsort((element + rng.normal(0, 0.8, size=n_sentences), campaign))
+    element = element[order]
+
+    sub_element = np.empty(n_sentences, dtype=object)
+    for code, subs in enumerate(ELEMENTS.values()):
+        rows = np.flatnonzero(element == code)
+        sub_element[rows] = np.asarray(subs, dtype=object)[rng.integers(0, len(subs), size=len(rows))]
+
+    # Zipf 분포 단어 (앞쪽 단어일수록 자주 등장)
+    lengths = rng.integers(4, 13, size=n_sentences)
+    word_ids = np.minimum(rng.zipf(1.3, size=(n_sentences, 12)) - 1, VOCAB_SIZE - 1)
+    words = vocab[word_ids]
+    sentences = [" ".join(row[:length]) + "." for row, length in zip(words, lengths)]
+
+    campaign_item = rng.integers(0, len(ITEMS), size=n_campaigns)
+    campaign_season = rng.integers(0, len(SEASONS), size=n_campaigns)
+    campaign_gender = rng.integers(0, len(GENDERS), size=n_campaigns)
+    return pd.DataFrame({
+        "campaign_id": campaign,
+        "element": np.asarray(elements, dtype=object)[element],
+        "sub_element": sub_element,
+        "sentence": sentences,
+        "item": np.asarray(ITEMS, dtype=object)[campaign_item[campaign]],
+        "season": np.asarray(SEASONS, dtype=object)[campaign_season[campaign]],
+        "gender": np.asarray(GENDERS, dtype=object)[campaign_gender[campaign]],
+    })
@@ -0,0 +1,211 @@
+import io
+import random
+from functools import lru_cache
+
+import pandas as pd
+import plotly.express as px
+from wordcloud import WordCloud
+
+
+# 대시보드 차트 생성 함수 (Streamlit 없이 figure / 이미지만 만든다)
+
+# 스토리 요소 → 구성 순서 안내 문구
+STORY_ELEMENT_LABELS = {
+    "Problem/need": "문제 제기 및 솔루션 제시",
+    "Product value": "제품 전달 가치",
+    "Product detail": "제품 상세 설명",
+    "Brand": "브랜드 소개",
+    "External evaluation": "제품 및 브랜드 외부 평가",
+    "Request to funders": "펀딩 참여 유도",
+    "FAQ": "자주 묻는 질문",
+}
+
+def story_label(element):
+    return STORY_ELEMENT_LABELS.get(element, element)
+
+# 요소 간 전이 heatmap (행: 이전 요소, 열: 다음 요소)
+def build_transition_figure(story):
+    labels = [story_label(element) for element in story.elements]
+    fig = px.imshow(
+        story.transitions,
+        x=labels, y=labels,
+        color_continuous_scale="Blues",
+        labels=dict(x="다음 요소", y="이전 요소", color="캠페인 수"),
+        text_auto=True,
+    )
+    fig.update_layout(height=420, margin=dict(t=20, l=10, r=10, b=10))
+    return fig
+
+# 초안 vs 코퍼스 요소별 문장 비중 (가로 막대, 요소마다 두 막대)
+def build_element_share_figure(comparisons):
+    df = pd.DataFrame(
+        [{"요소": story_label(c.element), "구분": "내 초안", "비중": c.draft_share} for c in comparisons]
+        + [{"요소": story_label(c.element), "구분": "성공 캠페인", "비중": c.corpus_share} for c in comparisons]
+    )
+    fig = px.bar(df, x="비중", y="요소", color="구분", orientation="h", barmode="group",
+                 color_discrete_sequence=["#E36C75", "#6D9FB3"])
+    fig.update_layout(height=420, margin=dict(t=20, l=10, r=10, b=10), xaxis_tickformat=".0%",
+                      yaxis=dict(autorange="reversed"), legend_title_text="")
+    return fig
+
+
+# 사용자 정의 진한 색상 팔레트
+custom_colors = ["#6D9FB3", "#B1CBA1", "#F0BA89", "#E89A9A", "#E36C75"]
+
+# 워드클라우드 옵션 (배치/색상 시드를 고정해서 같은 입력이면 같은 이미지 → 캐시 가능)
+WORDCLOUD_SEED = 42
+WORDCLOUD_OPTIONS = dict(
+    background_color="white",  # 배경색
+    width=400,
+    height=300,
+    max_font_size=40,
+    min_font_size=10,
+    scale=2  # 레이아웃은 400x300, 출력은 2배 해상도
+)
+
+# 컬러 펑션 정의 (WordCloud가 넘겨주는 시드 고정 random_state 사용)
+def multicolor_func(*args, random_state=None, **kwargs):
+    return (random_state or random).choice(custom_colors)
+
+# 워드클라우드 PNG 생성 (matplotlib 없이 WordCloud 이미지를 바로 인코딩)
+def wordcloud_png(keyword_freq: dict, font_path, seed: int = WORDCLOUD_SEED) -> bytes:
+    wc = WordCloud(
+        font_path=font_path,
+        color_func=multicolor_func,
+        random_state=seed,
+        **WORDCLOUD_OPTIONS
+    ).generate_from_frequencies(keyword_freq)
+
+    buffer = io.BytesIO()
+    wc.to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# treemap 기본 데이터 (프로세스당 한 번 만들어 모든 세션이 공유, 수정하지 않고 필요하면 새 DataFrame을 만든다)
+@lru_cache(maxsize=1)
+def treemap_base_frame():
+    df = pd.DataFrame({
+        "category": [
+            "핏(fit)", "핏(fit)", "핏(fit)", "핏(fit)",
+            # "색상(hue)", "색상(hue)", "색상(hue)",
+            "원단 종류(material)", "원단 종류(material)", "원단 종류(material)",
+            "스타일(style)", "스타일(style)", "스타일(style)"
+        ],
+        "type": [
+            "베스트(vest)","티셔츠(tee)", "셔츠(shirt)", "셔츠(shirt)",
+            # "B계열", "RP계열", "R계열",
+            "천연 소재", "합성 소재", "재생소재",
+            "모던(modern)", "페미닌(feminine)", "스포티(sporty)"
+        ],
+        "keyword": [
+            "레귤러","레귤러", "타이트", "오버사이즈",
+            # "블루", "라벤더", "레드",
+            "코튼", "폴리에스터", "레이온",
+            "미니멀", "로맨틱", "캐주얼"
+        ],
+        "count": [
+            35, 25, 15, 20,
+            # 30, 18, 15,
+            28, 22, 10,
+            18, 21, 27
+        ]
+    })
+    df["root"] = " "
+    
+    # 호버 시 표시할 추가 정보
+    df["percentage"] = (df["count"] / df["count"].sum() * 100).round(1)
+    df["description"] = [
+        "편안한 일상 착용감", "우아한 실루엣", "몸에 맞는 핏", "여유로운 착용감",
+        # "시원하고 차분한 느낌", "로맨틱하고 부드러운 색감", "열정적이고 강렬한 인상",
+        "자연스럽고 친환경적", "내구성이 뛰어남", "지속가능한 소재",
+        "깔끔하고 세련된 스타일", "우아하고 여성스러운 분위기", "활동적이고 편안한 룩"
+    ]
+    
+    # 각 키워드별 예시 문장 추가
+    df["example_sentence"] = [
+        "몸에 무리가 없는 레귤러 핏으로 편안한 착용감을 제공합니다.",
+        "여성스러운 A라인 실루엣으로 우아한 분위기를 연출해요.",
+        "슬림한 타이트 핏으로 몸매가 돋보이는 스타일링이 가능합니다.",
+        "넉넉한 오버사이즈로 트렌디하고 편안한 룩을 완성할 수 있어요.",
+        # "차분하고 시원한 블루 컬러로 깔끔한 코디가 가능합니다.",
+        # "로맨틱한 라벤더 색상으로 부드러운 매력을 표현해보세요.",
+        # "강렬한 레드 컬러로 포인트를 주어 시선을 사로잡습니다.",
+        "100% 순면 코튼으로 부드럽고 통기성이 뛰어납니다.",
+        "폴리에스터 소재로 내구성이 좋고 관리가 간편해요.",
+        "부드러운 레이온 소재로 실키한 터치감이 특징입니다.",
+        "미니멀한 디자인으로 어떤 스타일링에도 잘 어울려요.",
+        "로맨틱한 디테일로 여성스러운 무드를 완성합니다.",
+        "캐주얼한 스타일로 데일리 룩에 완벽한 아이템이에요."
+    ]
+    return df
+
+
+# Product detail treemap (analysis가 있으면 선택한 필터의 키워드 언급 수, 데이터가 없으면 None)
+def build_treemap_figure(analysis=None):
+    df = treemap_base_frame()
+
+    # 분석 데이터가 있으면 선택한 필터의 Product detail 문장에서 키워드 빈도/예시 문장 사용
+    # 기본 데이터에는 같은 키워드가 여러 type 아래에 있으므로(레귤러), 코퍼스 수치는 키워드당 첫 행 하나에만 넣는다
+    if analysis is not None:
+        df = df.drop_duplicates("keyword", ignore_index=True)
+        counts, examples = analysis.keyword_mentions("Product detail", df["keyword"])
+        df = df.assign(count=counts,
+                       example_sentence=[ex or default for ex, default in zip(examples, df["example_sentence"])])
+        df = df[df["count"] > 0].reset_index(drop=True)
+        df["percentage"] = (df["count"] / df["count"].sum() * 100).round(1)
+
+    if df.empty:
+        return None
+
+    fig = px.treemap(
+        df,
+        path=['root','category', 'type', 'keyword'],
+        values='count',
+        color='count',
+        color_continuous_scale=[
+            "#FFF0F5", "#FFD1DC", "#FFECB3",
+            "#D1F2EB", "#D6EAF8", "#E8DAEF",
+            "#FADBD8", "#FDEDEC"
+        ],
+        template="plotly_white",
+        # 호버 시 표시할 추가 데이터
+        custom_data=['percentage', 'description', 'example_sentence']
+    )   
+
+    fig.update_traces(
+        root_color="white",
+        marker=dict(
+            colorscale=None,
+            line=dict(color="white", width=2)
+        ),
+        selector=dict(type='treemap'),
+        # 호버 템플릿 커스터마이징 (예시 문장만 표시)
+        hovertemplate="""<b>%{label}</b><br>- 예시 문장: %{customdata[2]}<br><b>클릭하여 성공 사례 보기</b><extra></extra>"""
+    )
+
+    # 호버 박스 스타일 조정
+    fig.update_layout(
+        margin=dict(t=0, l=0, r=0, b=0),
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        font=dict(color="black"),
+        treemapcolorway=[
+            "#FFFFFF",  # 루트용 흰색
+            "#FFD1DC",  # 파스텔 핑크
+            "#AEC6CF",  # 파스텔 블루
+            "#FFFACD",  # 파스텔 옐로우
+            "#BFD8B8",  # 파스텔 민트
+            "#E0BBE4",  # 라일락
+            "#FFB347",  # 피치 오렌지
+            "#B2EBF2",  # 밝은 아쿠아
+            "#F5CBA7"   # 크림 베이지
+        ],
+        hoverlabel=dict(
+            bgcolor="rgba(255,255,255,0.9)",
+            bordercolor="gray",
+            font_size=12,
+            font_family="Arial",
+            align="left"
+        )
+    )
+    return fig
@@ -0,0 +1,315 @@
+import hashlib
+import os
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from sampling import dedup_rows, sample_pool, sampling_seed
+from search_index import SearchIndex, normalize_term, sorted_member
+from story_order import mine_story_order
+from success_cases import CASE_FIELDS
+from text_stats import KeywordStats, STATS_WORKERS
+from tokenizer import tokenize
+
+
+# 문장 단위 캠페인 코퍼스 경로 (Parquet 또는 Arrow/Feather)
+CORPUS_PATH = os.environ.get("FASHION_CORPUS_PATH", "./resource/corpus/sentences.parquet")
+
+REQUIRED_COLUMNS = ["campaign_id", "element", "sentence"]
+# 반복되는 문자열 컬럼은 categorical로 저장 (코드 배열 + 카테고리 목록)
+# (성공 사례 필드는 캠페인 단위라 문장 행마다 같은 값이 반복된다)
+CATEGORICAL_COLUMNS = ["element", "sub_element", "item", "season", "gender"] + CASE_FIELDS
+
+_EMPTY_ROWS = np.empty(0, dtype=np.int64)
+
+
+# 문장 테이블 읽기 (확장자에 따라 Parquet / Arrow 선택, 디렉터리면 Parquet 파트 전체)
+def read_sentence_table(path=CORPUS_PATH):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".arrow", ".feather", ".ipc"):
+        df = pd.read_feather(path)
+    elif os.path.isdir(path):
+        df = _read_parquet_parts(path)
+    else:
+        df = pd.read_parquet(path)
+
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"코퍼스에 필수 컬럼이 없습니다: {missing}")
+    return df
+
+
+# Parquet 파트 디렉터리 (컬럼이 추가되기 전에 적재한 파트는 없는 컬럼을 null로 채운다)
+# 스키마를 합치지 않으면 첫 파트의 스키마만 사용해서 나중에 추가된 컬럼이 빠진다
+def _read_parquet_parts(path):
+    parts = [os.path.join(path, name) for name in sorted(os.listdir(path))
+             if name.endswith(".parquet") and not name.startswith((".", "_"))]
+    if not parts:
+        return pd.read_parquet(path)
+    schema = pa.unify_schemas([pq.read_schema(part) for part in parts])
+    return pq.read_table(parts, schema=schema).to_pandas()
+
+
+# 코드 배열 → 코드별 행 번호 인덱스 (정렬된 행 번호 + 코드별 시작/끝 offset)
+def build_offset_index(codes, n_codes):
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(n_codes + 1))
+    return order, bounds
+
+
+class Corpus:
+    def __init__(self, df):
+        # 캠페인 내 문장 순서는 유지한 채 캠페인별로 모으기
+        df = df.sort_values("campaign_id", kind="stable").reset_index(drop=True)
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        self.df = df
+        self.base = self
+
+        # categorical 컬럼별 코드 배열과 카테고리 목록
+        self.codes = {col: df[col].cat.codes.to_numpy() for col in CATEGORICAL_COLUMNS if col in df.columns}
+        self.categories = {col: list(df[col].cat.categories) for col in CATEGORICAL_COLUMNS if col in df.columns}
+
+        self.sentences = df["sentence"].to_numpy(dtype=object)
+        self.campaign_ids = df["campaign_id"].to_numpy()
+        # 캠페인 경계 (각 캠페인의 첫 행 번호, 마지막에 전체 길이)
+        self.campaign_starts = np.concatenate((
+            [0],
+            np.flatnonzero(self.campaign_ids[1:] != self.campaign_ids[:-1]) + 1,
+            [len(df)],
+        )) if len(df) else np.zeros(1, dtype=np.int64)
+
+        self.elements = self.categories["element"]
+        self.element_codes = self.codes["element"]
+        self._element_code = {name: code for code, name in enumerate(self.elements)}
+        self._element_order, self._element_bounds = build_offset_index(self.element_codes, len(self.elements))
+        self._keyword_stats = None
+        self._example_pools = {}
+
+    @classmethod
+    def from_path(cls, path=CORPUS_PATH):
+        return cls(read_sentence_table(path))
+
+    def __len__(self):
+        return len(self.sentences)
+
+    # 요소별 행 번호 (전체 스캔 없이 offset 인덱스 슬라이스)
+    def element_rows(self, element):
+        code = self._element_code.get(element)
+        if code is None:
+            return _EMPTY_ROWS
+        return self._element_order[self._element_bounds[code]:self._element_bounds[code + 1]]
+
+    def element_sentences(self, element):
+        return self.sentences[self.element_rows(element)]
+
+    # 문장 → 정수 코드 (같은 문장은 같은 코드, 예시 문장 중복 제거용)
+    @cached_property
+    def sentence_codes(self):
+        return pd.factorize(pd.Series(self.sentences, dtype=object))[0]
+
+    # 요소별 중복 없는 예시 문장 후보 (행 번호 배열)
+    def example_pool(self, element):
+        pool = self._example_pools.get(element)
+        if pool is None:
+            pool = self._example_pools[element] = dedup_rows(self.sentence_codes, self.element_rows(element))
+        return pool
+
+    @cached_property
+    def row_hashes(self):
+        return pd.util.hash_pandas_object(self.df, index=False).to_numpy()
+
+    # 코퍼스 내용 해시 (통계 캐시 무효화 키)
+    @cached_property
+    def version(self):
+        return hashlib.sha1(self.row_hashes.tobytes()).hexdigest()[:16]
+
+    # 캠페인 ID 목록 (캠페인 순서, 문자열)
+    @cached_property
+    def campaign_keys(self):
+        return np.asarray([str(cid) for cid in self.campaign_ids[self.campaign_starts[:-1]]], dtype=str)
+
+    # 캠페인별 내용 해시 (증분 갱신 시 새 캠페인 / 바뀐 캠페인 판별)
+    @cached_property
+    def campaign_hashes(self):
+        starts = self.campaign_starts
+        return np.asarray([
+            hashlib.sha1(self.row_hashes[start:end].tobytes()).hexdigest()[:16]
+            for start, end in zip(starts[:-1], starts[1:])
+        ], dtype=str)
+
+    # 캠페인 ID → [내용 해시, item, season, gender] (증분 갱신 시 영향받는 필터 조합 계산)
+    @cached_property
+    def campaign_manifest(self):
+        starts = self.campaign_starts[:-1]
+        attributes = []
+        for col in ("item", "season", "gender"):
+            if col in self.codes:
+                codes = self.codes[col][starts]
+                values = np.asarray(list(self.categories[col]) + [None], dtype=object)
+                attributes.append(values[codes])
+            else:
+                attributes.append([None] * len(starts))
+        return {key: [digest, *values]
+                for key, digest, *values in zip(self.campaign_keys, self.campaign_hashes, *attributes)}
+
+    # 셀별 키워드 통계 (처음 사용할 때 디스크 캐시에서 읽거나 계산)
+    @property
+    def keyword_stats(self):
+        if self._keyword_stats is None:
+            self.load_keyword_stats()
+        return self._keyword_stats
+
+    # workers > 1 이면 토큰화/카운트를 프로세스 풀에서 병렬 처리
+    def load_keyword_stats(self, workers=STATS_WORKERS):
+        self._keyword_stats = KeywordStats.load_or_build(self, workers=workers)
+        return self._keyword_stats
+
+    @property
+    def bigram_engine(self):
+        return self.keyword_stats.bigrams
+
+    # 문장 전문 검색 역색인 (키워드 통계의 문장 × unigram 행렬에서 만든다)
+    @cached_property
+    def search_index(self):
+        stats = self.keyword_stats
+        return SearchIndex.from_counts(stats.sentence_unigrams, stats.unigram_vocab, self.campaign_starts)
+
+
+# 데이터 파일(또는 파트 디렉터리) 변경 확인용 버전 (수정 시각, 파일을 교체하거나 파트를 추가하면 바뀜, 없으면 None)
+def data_version(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# 코퍼스 로딩 (파일이 없으면 None → 대시보드는 기본 데이터 사용)
+def load_corpus(path=CORPUS_PATH):
+    if not os.path.exists(path):
+        return None
+    return Corpus.from_path(path)
+
+
+# 스토리 구성 순서 분석 (요소 간 전이, 상위 순서와 캠페인 수, 대표 순서)
+def get_story_order(corpus, top_k=5):
+    return mine_story_order(corpus.element_codes, corpus.campaign_starts, corpus.elements, top_k)
+
+# 대표 스토리 구성 순서 (요소 이름 목록)
+def get_element_order(corpus):
+    return get_story_order(corpus, top_k=0).consensus
+
+def get_keywords(corpus, element):
+    return [token for sentence in corpus.element_sentences(element) for token in tokenize(sentence)]
+
+# 요소 예시 문장 n개 (seed가 같으면 같은 문장)
+def get_example_sentences(corpus, element, n=3, seed=0):
+    return list(corpus.base.sentences[sample_pool(corpus.example_pool(element), n, seed)])
+
+# 요소별 unigram / bigram 빈도 벡터
+# 사이드바 필터만 있으면 미리 합산된 셀을 더하고, 키워드 필터가 있으면 해당 문장 행을 더한다
+def _keyword_count_vectors(corpus, element):
+    stats = corpus.base.keyword_stats
+    filters = getattr(corpus, "filters", {})
+    if filters.get("keywords") or filters.get("search"):
+        return stats.row_counts(corpus.element_rows(element))
+    cells = stats.select_cells(element, filters.get("item"), filters.get("season"), filters.get("gender"))
+    return stats.cell_counts(cells)
+
+# 요소별 키워드 빈도 {키워드: 빈도} (빈도 내림차순, 최대 n개)
+def get_keyword_counts(corpus, element, n=None):
+    unigram_counts, _ = _keyword_count_vectors(corpus, element)
+    return corpus.base.keyword_stats.top_keywords(unigram_counts, n)
+
+def get_top_bigrams(corpus, element, top_n_words=5, top_n_bigrams=3):
+    stats = corpus.base.keyword_stats
+    unigram_counts, bigram_counts = _keyword_count_vectors(corpus, element)
+    top_words = list(stats.top_keywords(unigram_counts, top_n_words))
+    return stats.bigrams.related_bigrams(top_words, bigram_counts, top_n_bigrams)
+
+# 요소 내 세부 요소별 문장 수
+def get_sub_element_counts(corpus, element):
+    base = corpus.base
+    if "sub_element" not in base.codes:
+        return {}
+    codes = base.codes["sub_element"][corpus.element_rows(element)]
+    counts = np.bincount(codes[codes >= 0], minlength=len(base.categories["sub_element"]))
+    return {label: int(count) for label, count in zip(base.categories["sub_element"], counts) if count > 0}
+
+# 요소 내 세부 요소별 예시 문장 (중복 제거, 세부 요소당 최대 n개)
+def get_sub_element_examples(corpus, element, n=3):
+    base = corpus.base
+    if "sub_element" not in base.codes:
+        return {}
+    rows = corpus.element_rows(element)
+    codes = base.codes["sub_element"][rows]
+    examples = {}
+    for code, label in enumerate(base.categories["sub_element"]):
+        sentences = pd.unique(base.sentences[rows[codes == code]])
+        if len(sentences):
+            examples[label] = list(sentences[:n])
+    return examples
+
+# 검색어(접두어 AND)에 일치하는 문장 / 캠페인 (필터 결과 안에서, 검색어 등장 횟수 / 일치 문장 수 순서)
+# → (일치 문장 수, 일치 캠페인 수, 예시 문장 목록, [(캠페인 ID, 일치 문장 수), ...])
+def get_search_results(corpus, terms, n_sentences=5, n_campaigns=5):
+    base = corpus.base
+    result = base.search_index.search(terms, getattr(corpus, "rows", None), n_sentences, n_campaigns)
+    campaigns = [(str(base.campaign_keys[campaign]), count) for campaign, count in result.top_campaigns]
+    return len(result), result.n_campaigns, list(base.sentences[result.top_rows]), campaigns
+
+# 요소 문장에서 키워드별 언급 횟수와 첫 예시 문장
+# 언급 = 키워드로 시작하는 토큰 (키워드 필터 / 검색과 같은 역색인 posting을 요소 행으로 좁혀서 센다)
+def count_keyword_mentions(corpus, element, keywords):
+    base = corpus.base
+    rows = corpus.element_rows(element)
+    counts, examples = [], []
+    for keyword in keywords:
+        term = normalize_term(keyword)
+        term_rows, term_counts = base.search_index.term_postings(term) if term else (_EMPTY_ROWS, _EMPTY_ROWS)
+        inside = sorted_member(rows, term_rows)
+        matched = term_rows[inside]
+        counts.append(int(term_counts[inside].sum()))
+        examples.append(base.sentences[matched[0]] if len(matched) else None)
+    return counts, examples
+
+
+# 필터 결과(Corpus / CorpusView)에서 대시보드 집계를 직접 계산
+# aggregates.AggregateView와 같은 메서드를 제공한다
+class CorpusAnalysis:
+    def __init__(self, view):
+        self.view = view
+        # 렌더링 캐시 키 (코퍼스 버전 + 필터 조건)
+        self.cache_key = [view.base.version, getattr(view, "filters", {})]
+
+    def element_order(self):
+        return get_element_order(self.view)
+
+    def story_order(self, top_k=5):
+        return get_story_order(self.view, top_k)
+
+    def keyword_counts(self, element, n=None):
+        return get_keyword_counts(self.view, element, n)
+
+    def top_bigrams(self, element, top_n_words=5, top_n_bigrams=3):
+        return get_top_bigrams(self.view, element, top_n_words, top_n_bigrams)
+
+    # seed: 세션 시드 (필터 조건 / 요소와 합쳐서 샘플링 시드를 만든다)
+    def example_sentences(self, element, n=3, seed=None):
+        return get_example_sentences(self.view, element, n, sampling_seed(seed, self.cache_key, element))
+
+    def sub_element_counts(self, element):
+        return get_sub_element_counts(self.view, element)
+
+    def sub_element_examples(self, element, n=3):
+        return get_sub_element_examples(self.view, element, n)
+
+    def keyword_mentions(self, element, keywords):
+        return count_keyword_mentions(self.view, element, keywords)
+
+    def search_results(self, terms, n_sentences=5, n_campaigns=5):
+        return get_search_results(self.view, terms, n_sentences, n_campaigns)
@@ -7,68 +7,37 @@ st.set_page_config(
 
 import pandas as pd
 import numpy as np
-import json
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
-from collections import Counter
-import random
+from collections.abc import Mapping
+import secrets
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.feature_extraction.text import CountVectorizer
-import matplotlib.font_manager as fm
 import streamlit.components.v1 as components
 import os
-
-
-# 폰트 경로를 찾는 함수
-def get_font_path():
-    # 프로젝트 내 폰트 경로 먼저 확인
-    project_font_path = os.path.join(os.path.dirname(__file__), 'fonts', 'NotoSansKR.ttf')
-    if os.path.exists(project_font_path):
-        return project_font_path
-    
-    # 시스템 폰트 경로들 확인
-    font_paths = [
-        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
-        "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-        "/usr/share/fonts/truetype/noto/NotoSansKR-Regular.ttf",
-        "/System/Library/Fonts/Helvetica.ttc",  # macOS
-        "C:/Windows/Fonts/malgun.ttf",  # Windows
-    ]
-    
-    for path in font_paths:
-        if os.path.exists(path):
-            return path
-    
-    # 한글 폰트를 찾지 못한 경우 None 반환 (기본 폰트 사용)
-    return None
-
-
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['axes.unicode_minus'] = False
-
-# 한글 폰트 설정 시도
-try:
-    # 시스템에 설치된 한글 폰트 찾기
-    font_list = fm.findSystemFonts()
-    korean_fonts = []
-    for font_path in font_list:
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        if any(keyword in font_name.lower() for keyword in ['noto', 'nanum', 'malgun', 'gulim', 'dotum']):
-            korean_fonts.append(font_name)
-    
-    if korean_fonts:
-        plt.rcParams['font.family'] = korean_fonts[0]
-    else:
-        # 대체 폰트 설정
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Noto Sans CJK KR', 'NanumGothic', 'Malgun Gothic', 'DejaVu Sans']
-except:
-    # 폰트 설정 실패 시 기본 설정 유지
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['font.sans-serif'] = ['Noto Sans CJK KR', 'NanumGothic', 'Malgun Gothic', 'DejaVu Sans']
+from font_utils import get_font_path, configure_matplotlib_fonts
+from corpus import CORPUS_PATH, data_version, CorpusAnalysis
+from data_store import get_corpus, get_thumbnail_cases
+from static_data import (ELEMENT_ANALYSIS_INFO, ELEMENT_EXAMPLE_SENTENCES, EMOTIONAL_KEYWORD_EXAMPLES, FEA_DATA,
+                         FUNCTIONAL_KEYWORD_EXAMPLES)
+from aggregates import AGGREGATES_PATH, TREEMAP_KEYWORDS, load_aggregates
+from query import FilterIndex, parse_keyword_input
+from render_cache import render_cache_key, wordcloud_cache, figure_cache
+from thumbnails import THUMBNAIL_JSON_PATH, thumbnail_file, thumbnail_src
+from sampling import placeholder_values
+from success_cases import SuccessCaseIndex
+from charts import (WORDCLOUD_OPTIONS, WORDCLOUD_SEED, build_transition_figure, build_treemap_figure,
+                    story_label, wordcloud_png)
+from profiler import profiler
+
+# rerun 구간별 시간 측정 시작 (FASHION_METRICS_PORT가 있으면 /metrics 엔드포인트도 시작)
+profiler.start_rerun()
+profiler.serve_metrics()
+
+
+# 한글 폰트 설정 (스캔 결과는 프로세스/디스크에 캐시됨)
+profiler.stage("font_setup")
+configure_matplotlib_fonts()
+
+profiler.stage("sidebar")
 
 # 사이드바 입력 영역 추가
 st.sidebar.header("Crowdfunding Fashion Storytelling Dashboard")
@@ -83,41 +52,64 @@ functional_keywords = ["보온성", "통기성", "신축성", "경량성", "흡
 all_keywords = emotional_keywords + functional_keywords
 selected_keywords = st.sidebar.multiselect("Keyword (준비된 키워드 중 선택하게 하고 싶을 때)", all_keywords)
 
-def get_element_order(df):
-    element_orders = df.groupby("campaign_id")["element"].apply(list)
-    order_counts = Counter(tuple(order) for order in element_orders)
-    return list(order_counts.most_common(1)[0][0]) if order_counts else []
-
-def get_keywords(df, element):
-    sentences = df[df["element"] == element]["sentence"]
-    words = " ".join(sentences).replace("\n", " ").split()
-    words = [w.strip(".,!\"'()[]") for w in words if len(w) > 1]
-    return words
-
-def get_example_sentences(df, element, n=3):
-    examples = df[df["element"] == element]["sentence"].unique()
-    return random.sample(list(examples), min(n, len(examples)))
-
-def get_top_bigrams(df, element, top_n_words=5, top_n_bigrams=3):
-    sentences = df[df["element"] == element]["sentence"]
-    text = " ".join(sentences).replace("\n", " ")
-
-    vectorizer = CountVectorizer(ngram_range=(2, 2))
-    X = vectorizer.fit_transform([text])
-    bigram_counts = X.toarray().sum(axis=0)
-    bigram_vocab = vectorizer.get_feature_names_out()
-    bigram_freq = dict(zip(bigram_vocab, bigram_counts))
-
-    words = get_keywords(df, element)
-    word_counter = Counter(words)
-    top_words = [w for w, _ in word_counter.most_common(top_n_words)]
-
-    result = {}
-    for word in top_words:
-        related_bigrams = [bg for bg in bigram_freq if word in bg.split()]
-        sorted_bigrams = sorted(related_bigrams, key=lambda x: bigram_freq[x], reverse=True)
-        result[word] = sorted_bigrams[:top_n_bigrams]
-    return result
+profiler.stage("data_load")
+# 데이터 파일 버전 (수정 시각) → 증분 갱신으로 파일이 바뀌면 다음 rerun에서 다시 로딩
+corpus_version = data_version(CORPUS_PATH)
+aggregates_version = data_version(AGGREGATES_PATH)
+
+# 사이드바 필터용 비트맵 인덱스 (코퍼스가 있을 때만)
+@st.cache_resource(max_entries=1)
+def get_filter_index(version):
+    corpus = get_corpus(version)
+    return FilterIndex(corpus, all_keywords) if corpus is not None else None
+
+# treemap 키워드 → 달성률 순 성공 사례 (코퍼스가 있을 때만, treemap 키워드는 인덱스를 만들 때 미리 정렬)
+@st.cache_resource(max_entries=1)
+def get_success_cases(version):
+    corpus = get_corpus(version)
+    return SuccessCaseIndex(corpus, TREEMAP_KEYWORDS) if corpus is not None else None
+
+# 미리 계산된 필터 조합별 집계 (python -m dashboard_precompute, 파일이 없으면 None)
+@st.cache_resource(max_entries=1)
+def get_aggregates(version):
+    return load_aggregates()
+
+# 세션별 예시 문장 샘플링 시드 (같은 세션 + 같은 필터면 rerun해도 같은 예시)
+sample_seed = st.session_state.setdefault("sample_seed", secrets.randbits(32))
+
+# 선택한 필터의 분석 데이터 (없으면 None → 기본 데이터 사용)
+# 키워드 필터 / 검색어가 없으면 집계 파일 조회만 하고, 있으면 코퍼스에서 직접 계산
+# 선택한 키워드끼리는 OR, 자유 입력 검색어는 모두가 한 문장에 (접두어로) 나와야 일치
+search_terms = parse_keyword_input(keyword_input)
+aggregates = get_aggregates(aggregates_version)
+analysis = None
+if aggregates is not None and not selected_keywords and not search_terms:
+    analysis = aggregates.lookup(item, season, gender)
+else:
+    filter_index = get_filter_index(corpus_version)
+    if filter_index is not None:
+        analysis = CorpusAnalysis(filter_index.query(item, season, gender, selected_keywords, search_terms))
+    elif aggregates is not None:
+        st.sidebar.caption("⚠️ 코퍼스 파일이 없어 키워드 필터는 적용되지 않습니다.")
+        analysis = aggregates.lookup(item, season, gender)
+
+# 검색어 일치 문장 / 캠페인 (필터 결과 안에서)
+if search_terms and isinstance(analysis, CorpusAnalysis):
+    with profiler.section("search"):
+        n_sentences, n_campaigns, search_sentences, search_campaigns = analysis.search_results(search_terms)
+    st.sidebar.caption(f"🔍 '{' '.join(search_terms)}' 일치: 문장 {n_sentences:,}개 / 캠페인 {n_campaigns:,}개")
+    if n_sentences:
+        with st.sidebar.expander("검색 결과 보기"):
+            st.markdown("**자주 언급한 문장**")
+            for sentence in search_sentences:
+                st.markdown(f"- {sentence}")
+            st.markdown("**일치 문장이 많은 캠페인**")
+            for campaign, count in search_campaigns:
+                st.markdown(f"- {campaign} ({count}문장)")
+# 분석 메서드 호출을 "data.메서드" 구간으로 기록
+analysis = profiler.wrap_methods(analysis, "data")
+
+profiler.stage("header")
 
 # 📌 CSS 스타일 정의
 st.markdown("""
@@ -163,15 +155,47 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 st.markdown("---")
+profiler.stage("story_order")
 st.markdown("## 스토리 구성 순서")
 
-# 📊 구성 요소 순서 안내
-st.markdown("""
-<div class="description-box">
-    문제 제기 및 솔루션 제시 → 제품 전달 가치 → 제품 상세 설명 → 브랜드 소개 →  
-    제품 및 브랜드 외부 평가 → 펀딩 참여 유도 → 자주 묻는 질문
-</div>
-""", unsafe_allow_html=True)
+# 구성 순서 상세에 표시할 상위 순서 개수
+STORY_TOP_ORDERS = 5
+
+# 📊 구성 요소 순서 안내 (필터 조건의 캠페인에서 계산, 데이터가 없으면 기본 순서)
+story = analysis.story_order(STORY_TOP_ORDERS) if analysis is not None else None
+if story is None or story.n_campaigns == 0:
+    st.markdown("""
+    <div class="description-box">
+        문제 제기 및 솔루션 제시 → 제품 전달 가치 → 제품 상세 설명 → 브랜드 소개 →  
+        제품 및 브랜드 외부 평가 → 펀딩 참여 유도 → 자주 묻는 질문
+    </div>
+    """, unsafe_allow_html=True)
+else:
+    st.markdown(f"""
+    <div class="description-box">
+        {" → ".join(story_label(element) for element in story.consensus)}
+        <div style="margin-top:8px; font-size: 13px; color: #555;">캠페인 {story.n_campaigns:,}개의 요소 등장 순서 기준</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    with st.expander("구성 순서 상세 (상위 순서 / 요소 간 전이)"):
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.markdown("**자주 쓰인 구성 순서**")
+            st.dataframe(pd.DataFrame([
+                {
+                    "순서": " → ".join(story_label(element) for element in order),
+                    "캠페인 수": count,
+                    "비율": f"{count / story.n_campaigns:.1%}",
+                }
+                for order, count in story.orders
+            ]), hide_index=True, use_container_width=True)
+        with col2:
+            st.markdown("**요소 간 전이 (바로 다음에 나온 요소)**")
+            fig = figure_cache.get_or_build(render_cache_key("story-transitions", analysis.cache_key),
+                                            lambda: build_transition_figure(story))
+            with profiler.section("plotly_chart"):
+                st.plotly_chart(fig, use_container_width=True)
 
 
 
@@ -224,36 +248,20 @@ th {
 .stTabs [data-baseweb="tab"] {
     font-weight: 600;
 }
-</style>
-""", unsafe_allow_html=True)
 
-
-# 키워드 및 예시 데이터
-functional_keywords = {
-    "실용성": "복잡한세상 편하게 살자! 실용성, 효율성 없으면 말짱 꽝이죠.",
-    "고정력": "목둘레가 쉽게 늘어나지 않도록 헤리 테이프를 추가 봉제하여 탄탄하게 고정.",
-    "휴대": "가방 한켠에 쏘옥-, 주머니에 쏘옥- 간편한 휴대성!",
-    "디테일": "사소한 디테일까지 고심하여 제작하였습니다.",
-    "착용감": "입은 듯 안 입은 듯 착용감이 뛰어납니다.",
-    "구김": "구김이 적어 관리가 쉽습니다.",
-    "사이즈": "사이즈 선택 고민을 줄이는 가이드 제공!",
-    "내구성": "프리미엄 소재와 내구성 있는 자재로 제작.",
-    "편안함": "무엇 하나 거슬리지 않는 편안함을 위해 연구.",
-    "효율성": "효율성을 위해 작은 구조까지 개선.",
-    "원단": "톡톡한 두께감의 원단으로 선택."
+/* 요소 선택 라디오 (지연 렌더링 탭) */
+.st-key-active_element [role="radiogroup"] label {
+    font-weight: 600;
+    border-bottom: 2px solid transparent;
+    padding: 4px 8px;
 }
-
-emotional_keywords = {
-    "자유로움": "자유로움과 개성을 느낄 수 있게 해줍니다.",
-    "나만의": "나만의 공간과 감성을 담아낸 디자인.",
-    "자존심": "10년간의 자존심을 걸고 만든 맨투맨.",
-    "첫인상": "좋은 첫인상을 위한 포인트 아이템.",
-    "색다른 느낌": "색다른 느낌을 주고 싶은 날 스타일링하기 좋습니다.",
-    "섹시함": "커프스로 섹시함 3cm 더 키워보세요!",
-    "고급스러움": "고급스러움을 자랑하는 디테일.",
-    "트렌디함": "트렌디하고 스마트한 무드를 담았습니다.",
-    "디자인": "캐주얼한 디자인과 클래식함의 조화."
+.st-key-active_element [role="radiogroup"] label:has(input:checked) {
+    border-bottom-color: #3C77FF;
+    color: #3C77FF;
 }
+</style>
+""", unsafe_allow_html=True)
+
 
 # 도넛 차트용 값
 emotional_ratio = 32.7
@@ -293,6 +301,7 @@ box_style = """
 </style>
 """
 
+@profiler.profiled()
 def render_hover_box(title, keywords_dict):
     html = f"""
     {box_style}
@@ -339,9 +348,9 @@ st.markdown("---")
 #     with right:
 #         tabs = st.tabs(["기능적 키워드", "감성적 키워드"])
 #         with tabs[0]:
-#             render_hover_box("기능적 키워드", functional_keywords)
+#             render_hover_box("기능적 키워드", FUNCTIONAL_KEYWORD_EXAMPLES)
 #         with tabs[1]:
-#             render_hover_box("감성적 키워드", emotional_keywords)
+#             render_hover_box("감성적 키워드", EMOTIONAL_KEYWORD_EXAMPLES)
 
 # render_emotion_function_donut_chart()
 
@@ -350,143 +359,17 @@ st.markdown("---")
 # st.markdown("---")
 st.markdown("## 핵심 요소별 주요 키워드 & 예시 문장")
 
-problem_keywords = {
-    "불편함": 60,
-    "세탁 용이": 55,
-    "맞춤형 추천": 50,
-    "합리적 가격": 48,
-    "착용감": 45,
-    "스타일 다양성": 43,
-    "높은 비용": 40,
-    "다양한 사이즈": 36,
-    "체형 보완": 35,
-    "TPO": 33,
-    "가성비": 31,
-    "계절감": 28,
-    "친환경": 15,
-    "코디 고민": 24,
-    "디테일 강조": 22,
-    "고급 원단": 15,
-    "기능 제한": 12,
-    "기능성 원단" : 18,
-    "활용도" : 20
-}
-
-element_example_sentences = {
-    # 파이차트용 요소 (세부 분류 O)
-    "Brand": {
-        "Brand identity": [
-            "우리는 옷을 통해 삶의 가치를 높인다는 철학을 가지고 있습니다.",
-            "모두가 입을 수 있고 소중한 삶의 보탬이 되어줄 제품을 만드는 것이 유니핏의 신념이자 추구하는 방향입니다."
-        ],
-        "Creator profile/history": [
-            "학창시절부터 패션을 사랑해온 디자이너의 열정이 담겼습니다.",
-            "직접 겪은 실패와 회복의 경험이 이 프로젝트의 출발점이었습니다."
-        ],
-        "Project goal": [
-            "초기 제작 실패를 딛고 수차례 개선을 거쳐 완성했습니다.",
-            "고객 피드백을 반영하여 핏과 소재를 전면 수정했습니다."
-        ],
-        "Funding usage": [
-            "초기 제작 실패를 딛고 수차례 개선을 거쳐 완성했습니다.",
-            "고객 피드백을 반영하여 핏과 소재를 전면 수정했습니다."
-        ]
-    },
-
-    "External evaluation": {
-        "Third-party evaluations": [
-            "1,500개 이상의 구매 후기에서 4.9점의 평점을 기록했습니다.",
-            "후기 대부분이 '핏이 좋다', '재질이 고급스럽다'는 반응입니다."
-        ],
-        "Certificate": [
-            "KC 인증과 함께 OEKO-TEX 친환경 인증을 획득했습니다.",
-            "안심하고 착용하실 수 있도록 국가 품질 인증을 완료했습니다.",
-            "철저한 안전관리 및 프로세스 검침은 기본! 거기에 더해, 기본적으로행복한 직원이 훌륭한 제품을 만든다고 생각하기 때문에 받은WRAP 인증까지!"
-        ],
-        "Award": [
-            "국제 섬유 디자인 대회인 IFDA 2022에서 본 제품의 원단 배색과 패턴 디자인이 심사위원 만장일치로 우수상을 수상했습니다.",
-            "소비자가 뽑은 브랜드 대상 2년 연속 수상'은 저희 제품을 직접 경험하신 수많은 고객분들의 평가 덕분이었습니다.",
-            "저희 브랜드는 2023 K패션 어워즈에서 '올해의 혁신 디자인' 부문을 수상하며 제품력과 디자인 모두를 인정받았습니다."
-        ]
-    },
-
-    "Request to funders": {
-        "Discounts": [
-            "얼리버드 한정 수량으로 20% 할인 혜택을 드립니다.",
-            "재고 소진 시 추가 구매가 불가합니다."
-        ],
-        "Early bird benefits": [
-            "펀딩 초반 참여자에게만 제공되는 스페셜 리워드입니다.",
-            "48시간 이내 얼리버드 참여자에겐 특별 패키지를 드립니다."
-        ],
-        "Special offers": [
-            "목표 금액 달성 시 추가 리워드를 드립니다.",
-            "펀딩 참여자 전용 한정판 굿즈를 제공합니다."
-        ]
-    },
-
-    "FAQ": {
-        "Shipping/return/exchange": [
-            "리워드 수령으로부터 14일 이내에 발생한 초기 하자에 대해서는 본 A/S정책이 적용되지 않습니다.",
-            "세탁, 사용, 택 제거, 오염, 수선 등 이후 발생한 문제는 유상수리 및 왕복 택배비는 서포터님 부담으로 진행되며, 경우에 따라 (유상 수리가 불가할 정도로 심각한 훼손의 경우) 수리가 불가할 수 있습니다.",
-            "단순 변심에 의한 환불 및 교환은 불가합니다.(해당 상품은 네팔에서 직접 만들어서 오는 펀딩 상품으로 반품이나 교환이 쉽지 않습니다. 상품 자체의 문제일 경우 환불이 가능하지만, 그렇지 않은 경우 환불 및 교환이 불가함을 미리 공지드립니다."
-        ],
-        "Washing/care": [
-            "Q. 세탁 방법은 어떻게 되나요? 상세 페이지 하단에 상세한 세탁 방법을 안내드립니다. 드라이클리닝을 권장하며, 손세탁일 경우, 미온수와 중성세제를 사용하여 가볍게 세탁하시고 그늘진 곳에서 자연건조 하시기 바랍니다.",
-            "Q. 세탁시 주의사항이 있을까요? A. 세탁기에 30도 이하로 세탁하시면 됩니다. 면은 뜨거운 열을 가하면 줄어드는 게 필연이라, 건조기에는 절대 돌리지 마세요~ 축률을 최소화한 공정을 거쳤기 때문에 찬물로 빠시면 3% 이내로 축률을 막을 수 있습니다. 세탁기에서 꺼내신 후 널어서 말리시는 게 제일 좋습니다.",
-            "Q. 세탁은 어떻게 하나요?A. 세탁은 드라이 크리닝 하시길 권장합니다."
-        ],
-        "Customer concerns": [
-            "펀딩 마감 이후, 불가피한 사유로 배송지 변경이 필요하시다면 해당 페이지 내 '메이커에게 문의하기'를 통해 문의 부탁드립니다.",
-            "배송은 언제 시작되나요? A. 결제는 펀딩 기간이 종료 된 후 다음날부터 4일 동안 진행이 됩니다.",
-            "펀딩 기간 종료와 동시에 배송이 시작됩니다. 일반 배송은 4일동안 진행되며, 제주/도서산간 지역 배송은 최대 7일이 걸릴 수 있습니다."
-        ],
-        "Product usage": [
-            "펀딩 마감 이후, 불가피한 사유로 배송지 변경이 필요하시다면 해당 페이지 내 '메이커에게 문의하기'를 통해 문의 부탁드립니다.",
-            "배송은 언제 시작되나요? A. 결제는 펀딩 기간이 종료 된 후 다음날부터 4일 동안 진행이 됩니다.",
-            "펀딩 기간 종료와 동시에 배송이 시작됩니다. 일반 배송은 4일동안 진행되며, 제주/도서산간 지역 배송은 최대 7일이 걸릴 수 있습니다."
-        ]
-    },
-
-    # 워드클라우드용 요소 (단일 리스트)
-    "Problem/need": [
-        # "캐시미어는 정말 좋은 소재지만 좋은 소재에 가려져 원단만 강조되고 알게 모르게 옷이라면 지녀야 할 편안함, 디자인성들이 뒷전으로 가있는 소재이기도 합니다.",
-        # "기존의 점퍼 공식인, 30데니아 - 3레이어로도 샘플 테스트를 해봤는데, 역시 예상대로 리버서블에겐 너무 두껍고, 거슬리고, 움직임마저 편하지 않았어요.",
-        "여름 티셔츠는 비침이 심하거나 땀이 배어 불편합니다. 특수 가공 원단으로 땀 배임 없이 쾌적함을 유지합니다.",
-        "핏이 어정쩡하거나, 세탁 후 변형이 심한 옷이 많습니다. 세탁 후에도 형태 유지력이 뛰어난 소재를 사용했습니다.",
-        "매번 어울리는 옷 찾기가 어려워 스트레스를 받습니다. 베이직하면서도 고급스러운 핏으로 어떤 상황에서도 활용도 높습니다.",
-    ],
-
-    "Product detail": [
-        "핏은 레귤러 핏으로, 슬림하지도 벙벙하지도 않아 누구에게나 잘 어울립니다.",
-        "소재는 100% 코튼이며, 피부에 자극 없이 부드럽게 닿습니다.",
-        "컬러는 블랙, 아이보리, 그레이 등 데일리로 활용하기 좋습니다."
-    ],
-
-    "Product value": [
-        "기능적(F): 복잡한세상편하게살자! 바쁘고 바쁜 우리네 삶 실용성, 효율성 없으면 말짱 꽝이죠. [단정함]을 필요로 할 때 입을 수 있도록 휴대하기 쉽게! 가방 한켠에 쏘옥-, 주머니에 쏘옥- 정신없고답 없는 상황에서해답은 셔츠토시 뿐!",
-        "표현적(E): 도시적인 세련미를 표현할 수 있습니다.",
-        "심미적(A): 트렌드에 얽메이지 않는 유니크한 디자인 꽈배기, 와플, 베이직 니트 등등 베이직 디자인으로 식상했다면 유니크의 차별화된 디자인으로 매년 유니크하게 연출할 수 있습니다."
-    ]
-}
-
-
-element_analysis_info = [
-    {"name": "Brand", "method": "세부 카테고리 요소 추출", "examples": ["Brand identity", "Creator profile/history", "Project goal", "Funding usage"], "chart_type": "pie"},
-    {"name": "Problem/need", "method": "키워드 빈도 분석", "examples": problem_keywords, "chart_type": "wordcloud"},
-    {"name": "Product detail", "method": "TTA 기반 키워드 분석", "examples": ["소재: 면", "핏: 루즈", "컬러: 블랙"], "chart_type": "treemap"},
-    {"name": "Product value", "method": "FEA 기반 추출", "examples": ["Functional: practical", "Expressive: emotional", "Aesthetic: aesthetic"], "chart_type": "radar"},
-    {"name": "External evaluation", "method": "세부 요소 추출", "examples": ["Third-party evaluations", "Certificate", "Award"], "chart_type": "pie"},
-    {"name": "Request to funders", "method": "세부 요소 추출", "examples": ["Discounts", "Early bird benefits", "Special offers"], "chart_type": "pie"},
-    {"name": "FAQ", "method": "세부 요소 추출", "examples": ["Shipping/return/exchange", "Washing/care", "Customer concerns", "Product usage"], "chart_type": "pie"}
-]
-
-def render_pie_chart(title, labels):
+@profiler.profiled()
+def render_pie_chart(title, labels, analysis=None):
     st.markdown(f"### {title}")
     left, right = st.columns([1.1, 1.9])
 
     with left:
-        values = [random.randint(10, 30) for _ in labels]
+        # 데이터가 없을 때 예시 값 (rerun마다 바뀌지 않도록 요소 이름으로 고정)
+        values = placeholder_values(len(labels), "pie", title)
+        if analysis is not None:
+            sub_counts = analysis.sub_element_counts(title)
+            values = [sub_counts.get(label, 0) for label in labels]
 
         # 🎨 파스텔/네온 컬러 (필요시 바꿔도 OK)
         pastel_colors = [
@@ -494,26 +377,35 @@ def render_pie_chart(title, labels):
         ]
         color_seq = pastel_colors[:len(labels)]
 
-        fig = px.pie(
-            names=labels,
-            values=values,
-            hole=0.4,
-            color_discrete_sequence=color_seq
-        )
-        fig.update_layout(
-            margin=dict(l=10, r=10, t=10, b=10),
-            height=300,
-            paper_bgcolor="white",     # 전체 배경 흰색
-            plot_bgcolor="white",
-            font_color="black",         # 텍스트 색상
-            legend=dict(font=dict(color="black"))
-        )
-        fig.update_traces(
-            textinfo='percent',
-            textfont_size=14,
-            textfont_color='black'     # 퍼센트 텍스트 색상 🔽 여기!
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def build_figure():
+            fig = px.pie(
+                names=labels,
+                values=values,
+                hole=0.4,
+                color_discrete_sequence=color_seq
+            )
+            fig.update_layout(
+                margin=dict(l=10, r=10, t=10, b=10),
+                height=300,
+                paper_bgcolor="white",     # 전체 배경 흰색
+                plot_bgcolor="white",
+                font_color="black",         # 텍스트 색상
+                legend=dict(font=dict(color="black"))
+            )
+            fig.update_traces(
+                textinfo='percent',
+                textfont_size=14,
+                textfont_color='black'     # 퍼센트 텍스트 색상 🔽 여기!
+            )
+            return fig
+
+        if sum(values) > 0:
+            # 같은 라벨/값이면 캐시된 figure 사용
+            fig = figure_cache.get_or_build(render_cache_key("pie", title, labels, values), build_figure)
+            with profiler.section("plotly_chart"):
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("선택한 조건에 해당하는 데이터가 없습니다.")
 
     # 오른쪽: 예시 문장
     with right:
@@ -523,9 +415,11 @@ def render_pie_chart(title, labels):
         unsafe_allow_html=True
     )
 
-        example_data = element_example_sentences.get(title, {})
+        example_data = ELEMENT_EXAMPLE_SENTENCES.get(title, {})
+        if analysis is not None:
+            example_data = analysis.sub_element_examples(title)
 
-        if isinstance(example_data, dict):
+        if isinstance(example_data, Mapping) and example_data:
             for sub_elem, sentences in example_data.items():
                 with st.expander(f"{sub_elem}"):
                     for s in sentences:
@@ -533,38 +427,32 @@ def render_pie_chart(title, labels):
         else:
             st.info("예시 문장이 없습니다.")
 
-# 사용자 정의 진한 색상 팔레트
-custom_colors = ["#6D9FB3", "#B1CBA1", "#F0BA89", "#E89A9A", "#E36C75"]
+# 요소 분석 탭 지연 렌더링 (DASHBOARD_LAZY_TABS=0 이면 기존 st.tabs로 모두 렌더링)
+LAZY_ELEMENT_TABS = os.environ.get("DASHBOARD_LAZY_TABS", "1") != "0"
 
-# 컬러 펑션 정의
-def multicolor_func(*args, **kwargs):
-    return random.choice(custom_colors)
+# 워드클라우드에 표시할 최대 키워드 수
+WORDCLOUD_MAX_WORDS = 50
 
 # ✅ 함수 정의
+@profiler.profiled()
 def render_wordcloud(title: str, keyword_freq: dict, problem_example_sentences: list):
-    # 워드클라우드 객체 생성
-    wc = WordCloud(
-        font_path = get_font_path(),
-        background_color="white",  # 배경색
-        width=400,
-        color_func=multicolor_func,
-        height=300,
-        max_font_size=40,
-        min_font_size=10
-    ).generate_from_frequencies(keyword_freq)
-
-    # 워드클라우드 시각화
-    fig, ax = plt.subplots(figsize=(4, 3))
-    ax.imshow(wc, interpolation="bilinear")
-    ax.axis("off")
-    fig.patch.set_facecolor('white')
+    if not keyword_freq:
+        st.markdown(f"### {title}")
+        st.info("선택한 조건에 해당하는 데이터가 없습니다.")
+        return
+
+    # 워드클라우드 이미지 (빈도/폰트/크기/시드가 같으면 캐시된 PNG 사용)
+    font_path = get_font_path()
+    cache_key = render_cache_key("wordcloud-image", keyword_freq, font_path, WORDCLOUD_OPTIONS, WORDCLOUD_SEED)
+    png = wordcloud_cache.get_or_render(cache_key, profiler.profiled("wordcloud_layout")(
+        lambda: wordcloud_png(keyword_freq, font_path)))
 
     # 레이아웃: 왼쪽 워드클라우드 / 오른쪽 문장
     st.markdown(f"### {title}")
     left, right = st.columns([1.2, 1.8])
 
     with left:
-        st.pyplot(fig)
+        st.image(png, use_container_width=True)
 
     with right:
         # st.markdown("**예시 문장:**")
@@ -574,35 +462,6 @@ def render_wordcloud(title: str, keyword_freq: dict, problem_example_sentences:
         for sentence in problem_example_sentences:
             st.markdown(f"- {sentence}")
 
-# 썸네일 데이터 로딩 함수 추가
-@st.cache_data
-def load_thumbnail_data():
-    try:
-        with open('./resource/thumbnail/thumbnail.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except:
-        # 기본 데이터 반환
-        return [
-            {
-                "url": "https://www.wadiz.kr/web/campaign/detail/362523?_refer_section_st=PREORDER_3",
-                "project_name": "3만원대ㅣ6억메이커의 팔뚝 얇아보이는 여름가디건! 냉감소재&워셔블",
-                "approach": "658%",
-                "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/06/27/3e41a96e-fca4-489b-ade3-e486174c5768.jpeg/wadiz/resize/800/format/jpg/quality/85/"
-            },
-            {
-                "url": "https://www.wadiz.kr/web/campaign/detail/356858?_refer_section_st=PREORDER_8",
-                "project_name": "[7억 | 소매치기 방지] 신박한 도포 재킷, 일상도 여행도 완벽히",
-                "approach": "1,142%",
-                "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/05/16/8bce2f7e-320c-4259-b989-262e15dd3fc3.jpeg/wadiz/resize/800/format/jpg/quality/85/"
-            },
-            {
-                "url": "https://www.wadiz.kr/web/campaign/detail/343743?_refer_section_st=PREORDER_29",
-                "project_name": "[빠른배송] 실크같은 부드러움, 한여름까지 쾌적하게 2기장 5사이즈",
-                "approach": "18,225%",
-                "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/03/05/123356de-6992-4733-891f-e790ba679213.jpeg/wadiz/resize/800/format/jpg/quality/85/"
-            }
-        ]
-
 # 성공 사례 카드 표시 함수
 def display_success_cases(keyword, thumbnail_data):
     st.markdown(f"### 🎯 '{keyword}' 관련 성공 사례")
@@ -627,7 +486,7 @@ def display_success_cases(keyword, thumbnail_data):
             
             with col_img:
                 try:
-                    st.image(case['project_thumbnail_url'], width=120)
+                    st.image(thumbnail_file(case), width=120)
                 except:
                     st.image("https://via.placeholder.com/120x80?text=No+Image", width=120)
             
@@ -644,7 +503,9 @@ def display_success_cases(keyword, thumbnail_data):
             st.markdown("</div>", unsafe_allow_html=True)
             st.markdown("")  # 간격
 
-def render_treemap():
+# Product detail treemap figure 생성 (선택한 필터에 데이터가 없으면 None)
+@profiler.profiled()
+def render_treemap(analysis=None):
     st.markdown("""
     <h3 style='margin-bottom: -5px;'>Product detail</h3>
     <style>
@@ -657,176 +518,92 @@ def render_treemap():
     """, unsafe_allow_html=True)
     
     # 썸네일 데이터 로드
-    thumbnail_data = load_thumbnail_data()
+    thumbnail_data = get_thumbnail_cases(data_version(THUMBNAIL_JSON_PATH))
     
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        df = pd.DataFrame({
-            "category": [
-                "핏(fit)", "핏(fit)", "핏(fit)", "핏(fit)",
-                # "색상(hue)", "색상(hue)", "색상(hue)",
-                "원단 종류(material)", "원단 종류(material)", "원단 종류(material)",
-                "스타일(style)", "스타일(style)", "스타일(style)"
-            ],
-            "type": [
-                "베스트(vest)","티셔츠(tee)", "셔츠(shirt)", "셔츠(shirt)",
-                # "B계열", "RP계열", "R계열",
-                "천연 소재", "합성 소재", "재생소재",
-                "모던(modern)", "페미닌(feminine)", "스포티(sporty)"
-            ],
-            "keyword": [
-                "레귤러","레귤러", "타이트", "오버사이즈",
-                # "블루", "라벤더", "레드",
-                "코튼", "폴리에스터", "레이온",
-                "미니멀", "로맨틱", "캐주얼"
-            ],
-            "count": [
-                35, 25, 15, 20,
-                # 30, 18, 15,
-                28, 22, 10,
-                18, 21, 27
-            ]
-        })
-        df["root"] = " "
-        
-        # 호버 시 표시할 추가 정보
-        df["percentage"] = (df["count"] / df["count"].sum() * 100).round(1)
-        df["description"] = [
-            "편안한 일상 착용감", "우아한 실루엣", "몸에 맞는 핏", "여유로운 착용감",
-            # "시원하고 차분한 느낌", "로맨틱하고 부드러운 색감", "열정적이고 강렬한 인상",
-            "자연스럽고 친환경적", "내구성이 뛰어남", "지속가능한 소재",
-            "깔끔하고 세련된 스타일", "우아하고 여성스러운 분위기", "활동적이고 편안한 룩"
-        ]
-        
-        # 각 키워드별 예시 문장 추가
-        df["example_sentence"] = [
-            "몸에 무리가 없는 레귤러 핏으로 편안한 착용감을 제공합니다.",
-            "여성스러운 A라인 실루엣으로 우아한 분위기를 연출해요.",
-            "슬림한 타이트 핏으로 몸매가 돋보이는 스타일링이 가능합니다.",
-            "넉넉한 오버사이즈로 트렌디하고 편안한 룩을 완성할 수 있어요.",
-            # "차분하고 시원한 블루 컬러로 깔끔한 코디가 가능합니다.",
-            # "로맨틱한 라벤더 색상으로 부드러운 매력을 표현해보세요.",
-            # "강렬한 레드 컬러로 포인트를 주어 시선을 사로잡습니다.",
-            "100% 순면 코튼으로 부드럽고 통기성이 뛰어납니다.",
-            "폴리에스터 소재로 내구성이 좋고 관리가 간편해요.",
-            "부드러운 레이온 소재로 실키한 터치감이 특징입니다.",
-            "미니멀한 디자인으로 어떤 스타일링에도 잘 어울려요.",
-            "로맨틱한 디테일로 여성스러운 무드를 완성합니다.",
-            "캐주얼한 스타일로 데일리 룩에 완벽한 아이템이에요."
-        ]
+        # 필터 상태가 같으면 캐시된 figure 사용 (pandas / plotly express 처리 생략)
+        filter_state = None if analysis is None else analysis.cache_key
+        with profiler.section("treemap_figure"):
+            fig = figure_cache.get_or_build(render_cache_key("treemap", filter_state), lambda: build_treemap_figure(analysis))
 
-        fig = px.treemap(
-            df,
-            path=['root','category', 'type', 'keyword'],
-            values='count',
-            color='count',
-            color_continuous_scale=[
-                "#FFF0F5", "#FFD1DC", "#FFECB3",
-                "#D1F2EB", "#D6EAF8", "#E8DAEF",
-                "#FADBD8", "#FDEDEC"
-            ],
-            template="plotly_white",
-            # 호버 시 표시할 추가 데이터
-            custom_data=['percentage', 'description', 'example_sentence']
-        )   
-
-        fig.update_traces(
-            root_color="white",
-            marker=dict(
-                colorscale=None,
-                line=dict(color="white", width=2)
-            ),
-            selector=dict(type='treemap'),
-            # 호버 템플릿 커스터마이징 (예시 문장만 표시)
-            hovertemplate="""<b>%{label}</b><br>- 예시 문장: %{customdata[2]}<br><b>클릭하여 성공 사례 보기</b><extra></extra>"""
-        )
-
-        # 호버 박스 스타일 조정
-        fig.update_layout(
-            margin=dict(t=0, l=0, r=0, b=0),
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            font=dict(color="black"),
-            treemapcolorway=[
-                "#FFFFFF",  # 루트용 흰색
-                "#FFD1DC",  # 파스텔 핑크
-                "#AEC6CF",  # 파스텔 블루
-                "#FFFACD",  # 파스텔 옐로우
-                "#BFD8B8",  # 파스텔 민트
-                "#E0BBE4",  # 라일락
-                "#FFB347",  # 피치 오렌지
-                "#B2EBF2",  # 밝은 아쿠아
-                "#F5CBA7"   # 크림 베이지
-            ],
-            hoverlabel=dict(
-                bgcolor="rgba(255,255,255,0.9)",
-                bordercolor="gray",
-                font_size=12,
-                font_family="Arial",
-                align="left"
-            )
-        )
-        
-        # CSS를 추가하여 hover 시 테두리 효과 적용
-        st.markdown("""
-        <style>
-        .js-plotly-plot .plotly .treemap-trace path:hover {
-            stroke: white !important;
-            stroke-width: 4px !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        if fig is None:
+            st.info("선택한 조건에 해당하는 데이터가 없습니다.")
+        else:
+            # CSS를 추가하여 hover 시 테두리 효과 적용
+            st.markdown("""
+            <style>
+            .js-plotly-plot .plotly .treemap-trace path:hover {
+                stroke: white !important;
+                stroke-width: 4px !important;
+            }
+            </style>
+            """, unsafe_allow_html=True)
 
-        # streamlit-plotly-events를 사용한 클릭 이벤트 처리
-        try:
-            from streamlit_plotly_events import plotly_events
+            # streamlit-plotly-events를 사용한 클릭 이벤트 처리
+            try:
+                from streamlit_plotly_events import plotly_events
             
-            # 이전 클릭 상태 확인을 위한 session state 초기화
-            if 'last_clicked_point' not in st.session_state:
-                st.session_state.last_clicked_point = None
+                # 이전 클릭 상태 확인을 위한 session state 초기화
+                if 'last_clicked_point' not in st.session_state:
+                    st.session_state.last_clicked_point = None
             
-            # plotly_events로 클릭 감지
-            selected_points = plotly_events(
-                fig,
-                click_event=True,
-                hover_event=False,
-                select_event=False,
-                key="treemap_events"
-            )
+                # plotly_events로 클릭 감지
+                with profiler.section("plotly_events"):
+                    selected_points = plotly_events(
+                        fig,
+                        click_event=True,
+                        hover_event=False,
+                        select_event=False,
+                        key="treemap_events"
+                    )
             
-            # 클릭된 포인트가 있고, 이전 클릭과 다를 때만 처리
-            if selected_points and len(selected_points) > 0:
-                clicked_data = selected_points[0]
-                current_point = f"{clicked_data.get('curveNumber', '')}-{clicked_data.get('pointNumber', '')}"
+                # 클릭된 포인트가 있고, 이전 클릭과 다를 때만 처리
+                if selected_points and len(selected_points) > 0:
+                    clicked_data = selected_points[0]
+                    current_point = f"{clicked_data.get('curveNumber', '')}-{clicked_data.get('pointNumber', '')}"
                 
-                # 새로운 클릭인지 확인
-                if st.session_state.last_clicked_point != current_point:
-                    st.session_state.last_clicked_point = current_point
+                    # 새로운 클릭인지 확인
+                    if st.session_state.last_clicked_point != current_point:
+                        st.session_state.last_clicked_point = current_point
                     
-                    # pointNumber를 통해 키워드 추출
-                    if 'pointNumber' in clicked_data:
-                        point_number = clicked_data['pointNumber']
-                        if 0 <= point_number < len(df):
-                            clicked_keyword = df.iloc[point_number]['keyword']
+                        # pointNumber를 통해 키워드 추출 (잎 노드 root/category/type/keyword만 처리)
+                        if 'pointNumber' in clicked_data:
+                            point_number = clicked_data['pointNumber']
+                            trace = fig.data[0]
+                            if 0 <= point_number < len(trace.ids) and trace.ids[point_number].count("/") == 3:
+                                clicked_keyword = trace.labels[point_number]
                             
-                            # 키워드 update
-                            if clicked_keyword and clicked_keyword != " ":
-                                st.session_state.selected_keyword = clicked_keyword
-                                st.success(f"✅ '{clicked_keyword}' 선택됨")
+                                # 키워드 update
+                                if clicked_keyword and clicked_keyword != " ":
+                                    st.session_state.selected_keyword = clicked_keyword
+                                    st.success(f"✅ '{clicked_keyword}' 선택됨")
                         
-        except ImportError:
-            st.error("streamlit-plotly-events가 설치되지 않았습니다.")
-            st.plotly_chart(fig, use_container_width=True, theme=None)
-        except Exception as e:
-            st.info(f"클릭 기능에 문제가 있습니다: {str(e)}")
-            st.plotly_chart(fig, use_container_width=True, theme=None)
+            except ImportError:
+                st.error("streamlit-plotly-events가 설치되지 않았습니다.")
+                with profiler.section("plotly_chart"):
+                    st.plotly_chart(fig, use_container_width=True, theme=None)
+            except Exception as e:
+                st.info(f"클릭 기능에 문제가 있습니다: {str(e)}")
+                with profiler.section("plotly_chart"):
+                    st.plotly_chart(fig, use_container_width=True, theme=None)
 
     with col2:
         if 'selected_keyword' in st.session_state and st.session_state.selected_keyword:
             st.markdown(f"### 🎯 '{st.session_state.selected_keyword}' 관련 성공 사례")
 
-            for case in thumbnail_data[:3]:
+            # 키워드가 Product detail 문장에 나오는 캠페인 중 달성률 상위 3개 (없으면 전체 성공 사례)
+            success_cases = get_success_cases(corpus_version)
+            cases = success_cases.lookup(st.session_state.selected_keyword, 3) if success_cases is not None else []
+            if not cases:
+                st.caption("키워드 관련 사례가 없어 전체 성공 사례를 보여줍니다.")
+                cases = thumbnail_data[:3]
+
+            for case in cases:
+                image_src = thumbnail_src(case)
+                image_html = f'<img src="{image_src}" width="100" style="border-radius: 8px; margin-right: 15px;">' \
+                    if image_src else ""
                 st.markdown(f"""
                     <div style="
                         background-color: white;
@@ -838,11 +615,11 @@ def render_treemap():
                         align-items: center;
                         box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
                     ">
-                        <img src="{case['project_thumbnail_url']}" width="100" style="border-radius: 8px; margin-right: 15px;">
+                        {image_html}
                         <div style="flex: 1;">
                             <p style="margin: 0; font-size: 14px;"><strong>🎯 성공률:</strong> {case['approach']}</p>
                             <p style="margin: 4px 0 10px 0; font-size: 15px;">📝 {case['project_name']}</p>
-                            <a href="{case['url']}" target="_blank" style="
+                            <a href="{case.get('url') or '#'}" target="_blank" style="
                                 background-color: #4099ff;
                                 color: white;
                                 padding: 6px 12px;
@@ -940,53 +717,41 @@ def render_treemap():
 #             st.markdown("- 트렌드에 얽메이지 않는 유니크한 디자인 ... 유니크하게 연출할 수 있습니다.")
 #             st.markdown("- 티셔츠 자체의 핏을 흐리지 않는 얇지않고 ... 결국 그러한 원단을 찾았습니다.")
 
-# FEA 하위 속성과 예시 문장 사전
-fea_data = {
-    "Functional": {
-        "Fit": "핏이 잘 맞아서 활동하기 편했어요.",
-        "Material": "고급 원단을 사용해서 착용감이 좋습니다.",
-        "Comfort": "몸에 닿는 촉감이 부드럽고 편안합니다.",
-        "Utility": "소매가 길이 조절이 되어 실용적입니다.",
-        "Durability": "여러 번 세탁해도 형태가 유지돼요."
-    },
-    "Expressive": {
-        "Brand Identity": "이 브랜드는 언제나 나의 스타일을 대변해요.",
-        "Symbolism": "해당 로고는 저에게 의미가 있어요.",
-        "Cultural Code": "요즘 트렌드와 잘 맞는 감성이네요.",
-        "Social Message": "이 옷은 사회적 메시지를 담고 있어서 좋아요."
-    },
-    "Aesthetic": {
-        "Color": "톤다운된 그린 컬러가 마음에 들어요.",
-        "Style": "캐주얼한 스타일이라 자주 입을 수 있어요.",
-        "Silhouette": "핏이 전체적으로 예쁘게 떨어져요.",
-        "Details": "소매 단추 디테일이 고급스러워요.",
-        "Trends": "지금 유행하는 스타일이라서 선택했어요."
-    }
-}
-
-def render_radar_chart():
+@profiler.profiled()
+def render_radar_chart(analysis=None):
     st.markdown("### Product value")
 
+    # 분석 데이터가 있으면 선택한 필터에서 F/E/A 세부 요소 비중 표시
+    shares = {}
+    if analysis is not None:
+        fea_counts = analysis.sub_element_counts("Product value")
+        total = sum(fea_counts.values())
+        if total:
+            shares = {fea: count / total * 100 for fea, count in fea_counts.items()}
+
+    def fea_header(fea):
+        return f"#### {fea} ({shares[fea]:.0f}%)" if fea in shares else f"#### {fea}"
+
     # 썸네일 데이터 로
-    # thumbnail_data = load_thumbnail_data()
+    # thumbnail_data = get_thumbnail_cases(data_version(THUMBNAIL_JSON_PATH))
 
     col_f, col_e, col_a = st.columns(3)
 
     with col_f:
-        st.markdown("#### Functional")
-        for attr, ex in fea_data["Functional"].items():
+        st.markdown(fea_header("Functional"))
+        for attr, ex in FEA_DATA["Functional"].items():
             if st.button(attr, key=f"f_{attr}"):
                 st.info(f"예시: {ex}")
 
     with col_e:
-        st.markdown("#### Expressive")
-        for attr, ex in fea_data["Expressive"].items():
+        st.markdown(fea_header("Expressive"))
+        for attr, ex in FEA_DATA["Expressive"].items():
             if st.button(attr, key=f"e_{attr}"):
                 st.info(f"예시: {ex}")
 
     with col_a:
-        st.markdown("#### Aesthetic")
-        for attr, ex in fea_data["Aesthetic"].items():
+        st.markdown(fea_header("Aesthetic"))
+        for attr, ex in FEA_DATA["Aesthetic"].items():
             if st.button(attr, key=f"a_{attr}"):
                 st.info(f"예시: {ex}")
 
@@ -1047,41 +812,66 @@ def render_radar_chart():
     #         """, unsafe_allow_html=True)
 
 
-# 🔻 요소별 분석 탭 레이아웃
-element_tabs = st.tabs([info["name"] for info in element_analysis_info])
-
-for i, info in enumerate(element_analysis_info):
+# 요소 하나의 분석 화면 렌더링
+@profiler.profiled()
+def render_element(info):
     name = info["name"]
     chart_type = info["chart_type"]
     examples = info["examples"]
 
-    with element_tabs[i]:
-        #st.markdown(f"### 🔸 {name}")
-        
-        if chart_type == "pie":
-            render_pie_chart(name, examples)
+    #st.markdown(f"### 🔸 {name}")
 
-        elif chart_type == "wordcloud":
-            example_sentences = element_example_sentences.get(name, [])
+    if chart_type == "pie":
+        render_pie_chart(name, examples, analysis)
 
-            if name == "솔루션 제시":
-                render_wordcloud(name, solution_keywords, example_sentences)
-            else:
-                keyword_freq = {kw: random.randint(10, 30) for kw in examples}
-                render_wordcloud(name, keyword_freq, example_sentences)
+    elif chart_type == "wordcloud":
+        example_sentences = ELEMENT_EXAMPLE_SENTENCES.get(name, [])
+
+        if name == "솔루션 제시":
+            render_wordcloud(name, solution_keywords, example_sentences)
+        elif analysis is not None:
+            keyword_freq = analysis.keyword_counts(name, WORDCLOUD_MAX_WORDS)
+            render_wordcloud(name, keyword_freq, analysis.example_sentences(name, seed=sample_seed))
+        else:
+            keyword_freq = dict(zip(examples, placeholder_values(len(examples), "wordcloud", name)))
+            render_wordcloud(name, keyword_freq, example_sentences)
 
-        elif chart_type == "treemap":
-            render_treemap()
+    elif chart_type == "treemap":
+        render_treemap(analysis)
 
-        elif chart_type == "radar":
-            render_radar_chart()
-            # # 👉 버튼 클릭 후 성공 사례 표시
-            # if "selected_keyword" in st.session_state:
-            #     display_success_cases(st.session_state.selected_keyword, load_thumbnail_data())
+    elif chart_type == "radar":
+        render_radar_chart(analysis)
+        # # 👉 버튼 클릭 후 성공 사례 표시
+        # if "selected_keyword" in st.session_state:
+        #     display_success_cases(st.session_state.selected_keyword, get_thumbnail_cases(data_version(THUMBNAIL_JSON_PATH)))
+
+
+# 🔻 요소별 분석 탭 레이아웃
+profiler.stage("element_tabs")
+element_names = [info["name"] for info in ELEMENT_ANALYSIS_INFO]
+
+if LAZY_ELEMENT_TABS:
+    # st.tabs는 보이지 않는 탭까지 매번 모두 실행하므로
+    # 탭 모양의 가로 라디오로 선택한 요소 하나만 렌더링
+    active_element = st.radio(
+        "요소 선택",
+        element_names,
+        horizontal=True,
+        key="active_element",
+        label_visibility="collapsed"
+    )
+    render_element(ELEMENT_ANALYSIS_INFO[element_names.index(active_element)])
+else:
+    element_tabs = st.tabs(element_names)
+    for tab, info in zip(element_tabs, ELEMENT_ANALYSIS_INFO):
+        with tab:
+            render_element(info)
 
 
 st.markdown("---")
+profiler.stage("keyword_overview")
 # 감성 vs 기능 도넛 차트 레이아웃 (plotly + 오른쪽 탭)
+@profiler.profiled()
 def render_emotion_function_donut_chart():
     st.markdown("## 전체 키워드 분석(미팅 후 수정 예정)")
 
@@ -1090,32 +880,71 @@ def render_emotion_function_donut_chart():
     with left:
         pastel_colors = ["#FFB3C6", "#B3D9FF"]
 
-        fig = px.pie(
-            names=labels,
-            values=sizes,
-            hole=0.4,
-            color_discrete_sequence=pastel_colors
-        )
-        fig.update_layout(
-            margin=dict(l=10, r=10, t=10, b=10),
-            height=300,
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            font_color="black",
-            legend=dict(font=dict(color="black"))
-        )
-        fig.update_traces(
-            textinfo='percent',
-            textfont_size=14,
-            textfont_color='black'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def build_figure():
+            fig = px.pie(
+                names=labels,
+                values=sizes,
+                hole=0.4,
+                color_discrete_sequence=pastel_colors
+            )
+            fig.update_layout(
+                margin=dict(l=10, r=10, t=10, b=10),
+                height=300,
+                paper_bgcolor="white",
+                plot_bgcolor="white",
+                font_color="black",
+                legend=dict(font=dict(color="black"))
+            )
+            fig.update_traces(
+                textinfo='percent',
+                textfont_size=14,
+                textfont_color='black'
+            )
+            return fig
+
+        fig = figure_cache.get_or_build(render_cache_key("donut", labels, sizes), build_figure)
+        with profiler.section("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
 
     with right:
         tabs = st.tabs(["기능적 키워드", "감성적 키워드"])
         with tabs[0]:
-            render_hover_box("기능적 키워드", functional_keywords)
+            render_hover_box("기능적 키워드", FUNCTIONAL_KEYWORD_EXAMPLES)
         with tabs[1]:
-            render_hover_box("감성적 키워드", emotional_keywords)
+            render_hover_box("감성적 키워드", EMOTIONAL_KEYWORD_EXAMPLES)
+
+render_emotion_function_donut_chart()
 
-render_emotion_function_donut_chart()
\ No newline at end of file
+
+# 이번 rerun 측정 종료 (디버그 패널 렌더링 시간은 포함하지 않음)
+rerun_profile = profiler.finish_rerun()
+
+# ⏱️ 디버그 패널: 주소에 ?debug=1 을 붙이거나 FASHION_PROFILER_PANEL=1 이면 사이드바에 토글 표시
+PROFILER_PANEL = os.environ.get("FASHION_PROFILER_PANEL", "0") == "1"
+
+def render_profiler_panel(profile):
+    st.sidebar.markdown(f"**rerun {profile.wall * 1000:.0f}ms** (CPU {profile.cpu * 1000:.0f}ms)"
+                        + (f" · 최대 할당 {profile.alloc_peak / 2**20:.1f}MiB" if profile.alloc_peak is not None else ""))
+    rows = []
+    for section in profile.sections:
+        row = {
+            "구간": "\u00a0\u00a0" * section.depth + section.name,
+            "wall(ms)": round(section.wall * 1000, 1),
+            "CPU(ms)": round(section.cpu * 1000, 1),
+        }
+        if section.alloc is not None:
+            row["할당(KiB)"] = round(section.alloc / 1024, 1)
+        rows.append(row)
+    st.sidebar.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+    with st.sidebar.expander("누적 (프로세스 전체)"):
+        st.dataframe(pd.DataFrame([
+            {"구간": name, "호출": count, "평균 wall(ms)": round(wall * 1000, 1), "평균 CPU(ms)": round(cpu * 1000, 1)}
+            for name, count, wall, cpu in profiler.summary()
+        ]), hide_index=True, use_container_width=True)
+    with st.sidebar.expander("Prometheus"):
+        st.code(profiler.prometheus_text(), language="text")
+
+if PROFILER_PANEL or st.query_params.get("debug") == "1":
+    if st.sidebar.toggle("⏱️ 렌더링 시간 (디버그)", key="profiler_panel") and rerun_profile is not None:
+        render_profiler_panel(rerun_profile)
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+
+from aggregates import AGGREGATES_PATH, load_aggregates, write_aggregates
+from corpus import CORPUS_PATH, load_corpus
+from similarity import SIMILARITY_PATH, SimilarityIndex
+
+
+# 대시보드 집계 일괄 계산
+# python -m dashboard_precompute [--corpus sentences.parquet] [--output aggregates.arrow] [--workers N] [--update]
+#                                [--similarity DIR | --no-similarity]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="모든 사이드바 필터 조합의 대시보드 집계를 미리 계산합니다.")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="문장 코퍼스 (Parquet/Arrow)")
+    parser.add_argument("--output", default=AGGREGATES_PATH, help="집계 파일 (Arrow IPC)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="토큰화/카운트 병렬 프로세스 수 (1이면 순차 처리)")
+    parser.add_argument("--update", action="store_true",
+                        help="기존 집계 파일에서 바뀐 캠페인이 포함된 필터 조합만 다시 계산")
+    parser.add_argument("--similarity", default=SIMILARITY_PATH, help="유사 캠페인 검색 인덱스 디렉터리")
+    parser.add_argument("--no-similarity", action="store_true", help="유사 캠페인 검색 인덱스를 만들지 않음")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    corpus = load_corpus(args.corpus)
+    if corpus is None:
+        parser.error(f"코퍼스 파일이 없습니다: {args.corpus}")
+    print(f"코퍼스 로딩: {len(corpus):,}문장 ({time.perf_counter() - started:.1f}s)")
+
+    corpus.load_keyword_stats(workers=args.workers)
+    print(f"키워드 통계: workers={args.workers} ({time.perf_counter() - started:.1f}s)")
+
+    def progress(done, total):
+        print(f"\r필터 조합 집계: {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    previous = load_aggregates(args.output) if args.update else None
+    metadata = write_aggregates(corpus, args.output, progress=progress, previous=previous)
+    print(file=sys.stderr)
+    print(f"저장: {args.output} (corpus_version={metadata['corpus_version']}, "
+          f"다시 계산한 조합 {metadata['recomputed']}개, {time.perf_counter() - started:.1f}s)")
+
+    if not args.no_similarity:
+        index = SimilarityIndex.build(corpus)
+        index.save(args.similarity)
+        print(f"유사도 인덱스: {args.similarity} (문서 {index.documents.shape[0]:,}개, "
+              f"{time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import json
+
+import streamlit as st
+
+from corpus import load_corpus
+from draft_analysis import DraftAnalyzer
+from similarity import SIMILARITY_PATH, load_similarity
+from static_data import DEFAULT_THUMBNAIL_CASES, freeze
+from success_cases import parse_achievement
+from thumbnails import THUMBNAIL_JSON_PATH
+
+
+# 여러 페이지(dashboard.py, pages/)가 함께 쓰는 데이터 로더
+# st.cache_resource라서 프로세스당 한 번 만들고 모든 세션이 같은 객체를 공유한다 (읽기 전용으로만 사용)
+# 인자로 받는 version은 데이터 파일 수정 시각 → 파일이 바뀌면 다음 rerun에서 다시 로딩
+# st.cache_data와 달리 조회할 때마다 pickle 복사본을 만들지 않으므로, 세션이 늘어도 메모리는 한 벌만 쓴다
+# 대신 세션이 값을 바꾸면 다른 세션에도 보이므로 dict / list 결과는 freeze로 읽기 전용으로 만들어 돌려준다
+
+
+# 문장 단위 코퍼스 (버전당 한 번 로딩, 파일이 없으면 None)
+@st.cache_resource(max_entries=1)
+def get_corpus(version):
+    return load_corpus()
+
+
+# 스토리 초안 분석기 (요소 분류기 + 코퍼스 비교 기준, 코퍼스가 있을 때만)
+@st.cache_resource(max_entries=1)
+def get_draft_analyzer(version):
+    corpus = get_corpus(version)
+    return DraftAnalyzer.fit(corpus) if corpus is not None else None
+
+
+# 유사 캠페인 검색 인덱스 (python -m similarity로 만든 것, 없거나 코퍼스 버전이 다르면 None)
+@st.cache_resource(max_entries=1)
+def get_similarity_index(version):
+    corpus = get_corpus(version)
+    return load_similarity(SIMILARITY_PATH, corpus) if corpus is not None else None
+
+
+# 성공 사례 목록 (thumbnail.json, 없거나 읽을 수 없으면 기본 사례)
+# 달성률은 로딩할 때 숫자(approach_value)로 한 번만 바꾸고 달성률 내림차순으로 정렬
+@st.cache_resource(max_entries=1)
+def get_thumbnail_cases(version):
+    try:
+        with open(THUMBNAIL_JSON_PATH, 'r', encoding='utf-8') as f:
+            cases = json.load(f)
+    except (OSError, ValueError):
+        cases = DEFAULT_THUMBNAIL_CASES
+    cases = [dict(case) for case in cases]
+    for case in cases:
+        try:
+            case['approach_value'] = parse_achievement(case.get('approach'))
+        except ValueError:
+            case['approach_value'] = None
+    return freeze(sorted(cases, key=lambda case: -(case['approach_value'] or 0)))
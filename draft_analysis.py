@@ -0,0 +1,168 @@
+import re
+
+import numpy as np
+import scipy.sparse as sp
+
+from charts import STORY_ELEMENT_LABELS
+from corpus import get_element_order, get_keyword_counts
+from story_order import mine_story_order
+from text_stats import vocab_count_matrix
+from tokenizer import tokenize
+
+
+# 스토리 초안 분석
+# 초안을 문장으로 나누고, 코퍼스 문장으로 학습한 나이브 베이즈 분류기로 7개 스토리 요소를 한 번의 행렬 곱으로 예측한 뒤
+# 요소별로 코퍼스 키워드 통계와, 요소 첫 등장 순서를 코퍼스의 대표 스토리 구성 순서와 비교한다
+
+# 분류 대상 요소 (대시보드 요소 탭과 같은 7개)
+STORY_ELEMENTS = list(STORY_ELEMENT_LABELS)
+# 라플라스 평활 (학습 문장에 없던 토큰도 확률 0이 되지 않게)
+SMOOTHING = 0.5
+# 요소별로 비교하는 코퍼스 상위 키워드 수
+COMPARE_TOP_N = 20
+
+# 문장 끝 부호 뒤의 공백 또는 줄바꿈에서 나눈다
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+# 초안 → 문장 목록 (빈 문장 제외)
+def split_sentences(text):
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text or "") if sentence.strip()]
+
+
+# 문장 → 스토리 요소 (다항 나이브 베이즈, 키워드 통계의 문장 × 토큰 카운트 행렬로 학습)
+class ElementClassifier:
+    def __init__(self, elements, vocab, log_prior, log_likelihood):
+        self.elements = elements
+        self.vocab = vocab
+        self.log_prior = log_prior
+        # (어휘 수 × 요소 수) → 문장 카운트 행렬과 곱하면 (문장 수 × 요소 수) 점수
+        self.log_likelihood = log_likelihood
+
+    @classmethod
+    def fit(cls, corpus, elements=STORY_ELEMENTS, smoothing=SMOOTHING):
+        elements = [element for element in elements if len(corpus.element_rows(element))]
+        stats = corpus.keyword_stats
+        n_vocab = len(stats.unigram_vocab)
+        rows = [corpus.element_rows(element) for element in elements]
+        labels = np.repeat(np.arange(len(elements)), [len(r) for r in rows])
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        indicator = sp.csr_matrix((np.ones(len(rows), dtype=np.float64), (labels, rows)),
+                                  shape=(len(elements), stats.sentence_unigrams.shape[0]))
+        token_counts = np.asarray((indicator @ stats.sentence_unigrams).todense(), dtype=np.float64)
+        log_likelihood = np.log(token_counts + smoothing) \
+            - np.log(token_counts.sum(axis=1, keepdims=True) + smoothing * n_vocab)
+        log_prior = np.log(np.bincount(labels, minlength=len(elements)) / max(len(rows), 1))
+        return cls(elements, stats.unigram_vocab, log_prior, np.ascontiguousarray(log_likelihood.T))
+
+    # 문장 목록 → (요소 번호 배열, 문장별 요소 확률 (문장 수 × 요소 수))
+    # 어휘에 있는 토큰이 하나도 없는 문장은 사전 확률만으로 정해진다
+    def predict(self, sentences):
+        counts = vocab_count_matrix([tokenize(sentence) for sentence in sentences], self.vocab)
+        scores = counts @ self.log_likelihood + self.log_prior
+        scores = np.asarray(scores) - np.max(scores, axis=1, keepdims=True) if len(sentences) else \
+            np.empty((0, len(self.elements)))
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities.argmax(axis=1), probabilities, np.diff(counts.indptr) > 0
+
+
+# 요소 하나의 비교 결과
+#   corpus_keywords : 코퍼스 요소 상위 키워드 {키워드: 빈도}
+#   used / missing  : 그중 초안에 나온 키워드 / 나오지 않은 키워드
+class ElementComparison:
+    def __init__(self, element, n_sentences, draft_share, corpus_share, corpus_keywords, draft_tokens):
+        self.element = element
+        self.n_sentences = n_sentences
+        self.draft_share = draft_share
+        self.corpus_share = corpus_share
+        self.corpus_keywords = corpus_keywords
+        self.used = [keyword for keyword in corpus_keywords if keyword in draft_tokens]
+        self.missing = [keyword for keyword in corpus_keywords if keyword not in draft_tokens]
+
+    @property
+    def coverage(self):
+        return len(self.used) / len(self.corpus_keywords) if self.corpus_keywords else 0.0
+
+
+class DraftAnalysis:
+    def __init__(self, sentences, elements, labels, probabilities, known, comparisons, order, corpus_order):
+        self.sentences = sentences
+        self.elements = elements
+        self.labels = labels
+        self.probabilities = probabilities
+        # 어휘에 있는 토큰이 있는 문장 (False면 분류 근거가 없음)
+        self.known = known
+        self.comparisons = comparisons
+        # 초안의 요소 첫 등장 순서 / 코퍼스 대표 순서 (요소 이름 목록)
+        self.order = order
+        self.corpus_order = corpus_order
+
+    def __len__(self):
+        return len(self.sentences)
+
+    @property
+    def sentence_elements(self):
+        return [self.elements[label] for label in self.labels]
+
+    @property
+    def confidence(self):
+        return self.probabilities.max(axis=1) if len(self.sentences) else np.empty(0)
+
+    # 코퍼스 대표 순서에는 있지만 초안에 없는 요소
+    @property
+    def missing_elements(self):
+        return [element for element in self.corpus_order if element not in self.order]
+
+    # 초안과 코퍼스 대표 순서에 모두 있는 요소 쌍 중 선후 관계가 같은 비율 (쌍이 없으면 None)
+    @property
+    def order_agreement(self):
+        rank = {element: i for i, element in enumerate(self.corpus_order)}
+        shared = [rank[element] for element in self.order if element in rank]
+        pairs = len(shared) * (len(shared) - 1) // 2
+        if not pairs:
+            return None
+        shared = np.asarray(shared)
+        agree = int(np.triu(shared[:, None] < shared[None, :], k=1).sum())
+        return agree / pairs
+
+
+# 초안 분석기 = 분류기 + 초안과 무관한 코퍼스 쪽 비교 기준 (요소 비중 / 상위 키워드 / 대표 순서)
+# 코퍼스 버전당 한 번 만들어 두면 초안마다 하는 일은 초안 문장 수에만 비례한다
+class DraftAnalyzer:
+    def __init__(self, classifier, corpus_shares, corpus_keywords, corpus_order):
+        self.classifier = classifier
+        self.elements = classifier.elements
+        self.corpus_shares = corpus_shares
+        self.corpus_keywords = corpus_keywords
+        self.corpus_order = corpus_order
+
+    @classmethod
+    def fit(cls, corpus, elements=STORY_ELEMENTS, top_n=COMPARE_TOP_N):
+        classifier = ElementClassifier.fit(corpus, elements)
+        elements = classifier.elements
+        # 요소별 코퍼스 문장 비중 (분류 대상 요소 문장 기준)
+        counts = np.asarray([len(corpus.element_rows(element)) for element in elements])
+        corpus_shares = counts / max(counts.sum(), 1)
+        corpus_keywords = [get_keyword_counts(corpus, element, top_n) for element in elements]
+        corpus_order = [element for element in get_element_order(corpus) if element in elements]
+        return cls(classifier, corpus_shares, corpus_keywords, corpus_order)
+
+    # 초안 텍스트 → DraftAnalysis
+    def analyze(self, text):
+        sentences = split_sentences(text)
+        labels, probabilities, known = self.classifier.predict(sentences)
+        elements = self.elements
+        draft_counts = np.bincount(labels, minlength=len(elements))
+        draft_shares = draft_counts / max(len(sentences), 1)
+
+        comparisons = []
+        for code, element in enumerate(elements):
+            tokens = {token for i in np.flatnonzero(labels == code) for token in tokenize(sentences[i])}
+            comparisons.append(ElementComparison(element, int(draft_counts[code]), float(draft_shares[code]),
+                                                 float(self.corpus_shares[code]), self.corpus_keywords[code], tokens))
+
+        # 초안 = 캠페인 하나로 보고 코퍼스와 같은 방식으로 요소 첫 등장 순서 계산
+        story = mine_story_order(labels, np.array([0, len(labels)]), elements, top_k=1)
+        order = story.orders[0][0] if story.orders else []
+        return DraftAnalysis(sentences, elements, labels, probabilities, known, comparisons, order, self.corpus_order)
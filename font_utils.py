@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+
+import matplotlib
+import matplotlib.font_manager as fm
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 폰트 스캔 결과를 저장하는 디스크 캐시 (폰트 디렉터리 mtime이 바뀌면 다시 스캔)
+FONT_CACHE_PATH = os.path.join(BASE_DIR, '.cache', 'font_cache.json')
+FONT_CACHE_VERSION = 1
+
+KOREAN_FONT_KEYWORDS = ['noto', 'nanum', 'malgun', 'gulim', 'dotum']
+FALLBACK_SANS_SERIF = ['Noto Sans CJK KR', 'NanumGothic', 'Malgun Gothic', 'DejaVu Sans']
+
+# 워드클라우드용 폰트 후보 (프로젝트 폰트 → 시스템 폰트 순서)
+PROJECT_FONT_PATH = os.path.join(BASE_DIR, 'fonts', 'NotoSansKR.ttf')
+SYSTEM_FONT_PATHS = [
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/noto/NotoSansKR-Regular.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "C:/Windows/Fonts/malgun.ttf",  # Windows
+]
+
+
+# matplotlib이 폰트를 찾는 디렉터리 목록
+def _font_directories():
+    if sys.platform == 'win32':
+        dirs = [fm.win32FontDirectory(),
+                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+    elif sys.platform == 'darwin':
+        dirs = [*fm.X11FontDirectories, *fm.OSXFontDirectories]
+    else:
+        dirs = list(fm.X11FontDirectories)
+    dirs.append(os.path.dirname(PROJECT_FONT_PATH))
+    return dirs
+
+
+# 폰트 디렉터리(하위 디렉터리 포함)의 mtime으로 캐시 키 생성
+# 폰트 파일을 열지 않고 디렉터리 stat만 하므로 스캔보다 훨씬 가볍다
+def font_cache_key():
+    entries = []
+    for root_dir in _font_directories():
+        if not os.path.isdir(root_dir):
+            continue
+        for dirpath, _, _ in os.walk(root_dir):
+            try:
+                entries.append(f"{dirpath}:{os.stat(dirpath).st_mtime_ns}")
+            except OSError:
+                continue
+    entries.sort()
+    digest = hashlib.sha1("\n".join(entries).encode('utf-8')).hexdigest()
+    return f"{FONT_CACHE_VERSION}-{digest}"
+
+
+# 시스템 폰트 전체를 스캔해서 한글 폰트 (이름, 경로) 목록 반환
+def scan_korean_fonts():
+    korean_fonts = []
+    for font_path in sorted(fm.findSystemFonts()):
+        try:
+            font_name = fm.FontProperties(fname=font_path).get_name()
+        except Exception:
+            continue
+        if any(keyword in font_name.lower() for keyword in KOREAN_FONT_KEYWORDS):
+            korean_fonts.append({"name": font_name, "path": font_path})
+    return korean_fonts
+
+
+def _read_font_cache(key):
+    try:
+        with open(FONT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != key:
+        return None
+    # 캐시 이후 삭제된 폰트 파일은 제외
+    return [font for font in cached.get("korean_fonts", []) if os.path.exists(font["path"])]
+
+
+def _write_font_cache(key, korean_fonts):
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{FONT_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "korean_fonts": korean_fonts}, f, ensure_ascii=False)
+        os.replace(tmp_path, FONT_CACHE_PATH)
+    except OSError:
+        # 캐시 저장 실패는 무시 (다음 프로세스에서 다시 스캔)
+        pass
+
+
+# 한글 폰트 목록 (프로세스당 한 번만 계산, 디스크 캐시 우선 사용)
+@lru_cache(maxsize=1)
+def get_korean_fonts():
+    key = font_cache_key()
+    korean_fonts = _read_font_cache(key)
+    if korean_fonts is None:
+        korean_fonts = scan_korean_fonts()
+        _write_font_cache(key, korean_fonts)
+    return tuple((font["name"], font["path"]) for font in korean_fonts)
+
+
+# 워드클라우드용 폰트 경로를 찾는 함수
+@lru_cache(maxsize=1)
+def get_font_path():
+    # 프로젝트 내 폰트 경로 먼저 확인
+    if os.path.exists(PROJECT_FONT_PATH):
+        return PROJECT_FONT_PATH
+
+    # 시스템 폰트 경로들 확인
+    for path in SYSTEM_FONT_PATHS:
+        if os.path.exists(path):
+            return path
+
+    # 스캔으로 찾은 한글 폰트 사용
+    korean_fonts = get_korean_fonts()
+    if korean_fonts:
+        return korean_fonts[0][1]
+
+    # 한글 폰트를 찾지 못한 경우 None 반환 (기본 폰트 사용)
+    return None
+
+
+# matplotlib 한글 폰트 설정
+def configure_matplotlib_fonts():
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    try:
+        korean_fonts = get_korean_fonts()
+    except Exception:
+        korean_fonts = ()
+
+    if korean_fonts:
+        matplotlib.rcParams['font.family'] = korean_fonts[0][0]
+    else:
+        # 대체 폰트 설정
+        matplotlib.rcParams['font.family'] = 'sans-serif'
+        matplotlib.rcParams['font.sans-serif'] = FALLBACK_SANS_SERIF
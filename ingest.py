@@ -0,0 +1,336 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from success_cases import CASE_FIELDS, parse_achievement
+
+
+# 캠페인 JSONL → 문장 코퍼스 Parquet 파트 디렉터리
+# 한 줄 = 캠페인 하나:
+#   {"campaign_id": "362523", "item": "Cardigan", "season": "Summer", "gender": "Female",
+#    "sentences": [{"element": "Brand", "sub_element": "Brand identity", "sentence": "..."}, ...]}
+# 성공 사례 카드용 선택 필드: project_name, url, project_thumbnail_path, project_thumbnail_url,
+#   approach (펀딩 달성률, "18,225%" 또는 숫자 → 적재할 때 숫자로 변환해서 저장)
+# 출력 디렉터리는 FASHION_CORPUS_PATH로 그대로 읽을 수 있다 (pd.read_parquet이 파트를 합쳐 읽음)
+
+INGEST_BATCH_ROWS = 50_000
+CHECKPOINT_NAME = "_checkpoint.json"
+# 파트 파일 이름 (part-00000.parquet, 번호는 파트 순서)
+PART_NAME = re.compile(r"part-(\d+)\.parquet")
+# 원본 파일 식별용으로 해시하는 구간 크기 (파일 앞부분 + 체크포인트 offset 직전)
+SOURCE_HASH_BYTES = 64 * 1024
+
+# 캠페인 단위 속성 (문장 행마다 복사)
+CAMPAIGN_FIELDS = ["item", "season", "gender"]
+# 문장 단위 속성
+SENTENCE_FIELDS = ["element", "sub_element", "sentence"]
+
+# 모든 파트가 같은 스키마를 쓰도록 고정 (campaign_id는 문자열로 저장)
+SENTENCE_SCHEMA = pa.schema(
+    [("campaign_id", pa.string())]
+    + [(name, pa.string()) for name in SENTENCE_FIELDS]
+    + [(name, pa.string()) for name in CAMPAIGN_FIELDS]
+    + [(name, pa.string()) for name in CASE_FIELDS]
+    + [("approach", pa.float64())]
+)
+
+
+def _optional_str(record, field, context):
+    value = record.get(field)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{context}: {field} 값이 문자열이 아닙니다")
+    return value
+
+
+# 캠페인 레코드 스키마 검사 → 정규화된 레코드 (문제가 있으면 ValueError)
+def validate_campaign(record):
+    if not isinstance(record, dict):
+        raise ValueError("캠페인 레코드가 JSON 객체가 아닙니다")
+    campaign_id = record.get("campaign_id")
+    if campaign_id is None or isinstance(campaign_id, (dict, list, bool)) or str(campaign_id) == "":
+        raise ValueError("campaign_id가 없습니다")
+    campaign_id = str(campaign_id)
+
+    sentences = record.get("sentences")
+    if not isinstance(sentences, list) or not sentences:
+        raise ValueError(f"{campaign_id}: sentences 목록이 비어 있습니다")
+
+    rows = []
+    for i, sentence in enumerate(sentences):
+        context = f"{campaign_id}: sentences[{i}]"
+        if not isinstance(sentence, dict):
+            raise ValueError(f"{context}가 JSON 객체가 아닙니다")
+        row = {field: _optional_str(sentence, field, context) for field in SENTENCE_FIELDS}
+        if not row["element"] or not row["sentence"]:
+            raise ValueError(f"{context}에 element / sentence가 없습니다")
+        rows.append(row)
+
+    campaign = {field: _optional_str(record, field, campaign_id) for field in CAMPAIGN_FIELDS}
+    # 성공 사례 필드는 있을 때만 넣는다 (필드가 없는 캠페인의 내용 해시는 이전과 같게)
+    for field in CASE_FIELDS:
+        if record.get(field) is not None:
+            campaign[field] = _optional_str(record, field, campaign_id)
+    try:
+        approach = parse_achievement(record.get("approach"))
+    except ValueError as e:
+        raise ValueError(f"{campaign_id}: {e}") from None
+    if approach is not None:
+        campaign["approach"] = approach
+    campaign["campaign_id"] = campaign_id
+    campaign["sentences"] = rows
+    return campaign
+
+
+# JSONL 파일 → (다음 줄의 byte offset, 줄 내용) 을 한 줄씩 (offset부터 이어서 읽기)
+def iter_jsonl_lines(path, offset=0):
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            offset += len(line)
+            if line.strip():
+                yield offset, line
+
+
+# 캠페인 JSONL → (다음 줄의 byte offset, 캠페인)
+# 잘못된 줄은 on_error(offset, error) 호출 후 캠페인 자리에 None (offset은 계속 진행)
+def iter_campaigns(path, offset=0, on_error=None):
+    line_offset = offset
+    for next_offset, line in iter_jsonl_lines(path, offset):
+        try:
+            campaign = validate_campaign(json.loads(line))
+        except ValueError as e:
+            # json.JSONDecodeError / UnicodeDecodeError도 ValueError
+            if on_error:
+                on_error(line_offset, e)
+            campaign = None
+        yield next_offset, campaign
+        line_offset = next_offset
+
+
+# 캠페인 → 문장 행 (코퍼스 컬럼 순서의 dict)
+def iter_sentence_rows(campaign):
+    for sentence in campaign["sentences"]:
+        row = {"campaign_id": campaign["campaign_id"]}
+        row.update(sentence)
+        row.update((field, campaign[field]) for field in CAMPAIGN_FIELDS)
+        row.update((field, campaign.get(field)) for field in CASE_FIELDS + ["approach"])
+        yield row
+
+
+def iter_sentences(path, offset=0, on_error=None):
+    for _, campaign in iter_campaigns(path, offset, on_error):
+        if campaign is not None:
+            yield from iter_sentence_rows(campaign)
+
+
+# 체크포인트: 원본 파일, byte offset, 파트 수, 카운터, manifest(캠페인 ID → [내용 해시, 파트 번호]),
+#   원본 파일 식별 정보(source_size / source_mtime / source_hash, 파일이 교체됐는지 확인용)
+# 파트 저장 후 한 번에 교체하므로 offset과 manifest가 항상 같은 시점을 가리킨다
+def read_checkpoint(out_dir):
+    try:
+        with open(os.path.join(out_dir, CHECKPOINT_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkpoint(out_dir, checkpoint):
+    path = os.path.join(out_dir, CHECKPOINT_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# 원본 파일의 offset까지 내용 해시 (앞부분 + offset 직전 구간)
+# 파일 뒤에 줄이 추가되기만 했으면 같은 값, 파일이 다른 내용으로 교체됐으면 다른 값
+def source_hash(path, offset):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(offset, SOURCE_HASH_BYTES)))
+        f.seek(max(offset - SOURCE_HASH_BYTES, 0))
+        digest.update(f.read(offset - f.tell()))
+    return digest.hexdigest()[:16]
+
+
+def _source_identity(path, offset):
+    stat = os.stat(path)
+    return {"source_size": stat.st_size, "source_mtime": stat.st_mtime_ns, "source_hash": source_hash(path, offset)}
+
+
+# 체크포인트의 원본 파일이 그대로이거나 뒤에 줄만 추가됐는지 (offset부터 이어서 읽어도 되는지)
+# 크기와 수정 시각이 같으면 그대로, 아니면 파일이 offset보다 길고 offset까지의 내용 해시가 같아야 한다
+# 식별 정보가 없는 이전 체크포인트는 offset이 파일 크기 안에 있는지만 확인
+def source_unchanged(checkpoint, path):
+    stat = os.stat(path)
+    offset = checkpoint["offset"]
+    if stat.st_size < offset:
+        return False
+    if "source_hash" not in checkpoint:
+        return True
+    if stat.st_size == checkpoint["source_size"] and stat.st_mtime_ns == checkpoint["source_mtime"]:
+        return True
+    return source_hash(path, offset) == checkpoint["source_hash"]
+
+
+# 검사를 통과한 캠페인 레코드의 내용 해시 (키 순서와 무관)
+def campaign_hash(campaign):
+    payload = json.dumps(campaign, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _part_path(out_dir, index):
+    return os.path.join(out_dir, f"part-{index:05d}.parquet")
+
+
+# 파트 파일 저장 (임시 파일은 "."으로 시작해야 디렉터리를 읽을 때 파트로 취급되지 않는다)
+def _write_part(path, table):
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+# 체크포인트 이후에 쓰인 파트 삭제 (파트 저장 후 체크포인트 갱신 전에 중단된 경우)
+# 파트 번호는 5자리 0 채움이지만 100000번부터는 자리 수가 늘어나므로 숫자 부분 전체를 읽는다
+def _remove_uncommitted_parts(out_dir, n_parts):
+    for name in os.listdir(out_dir):
+        match = PART_NAME.fullmatch(name)
+        if match and int(match.group(1)) >= n_parts:
+            os.remove(os.path.join(out_dir, name))
+
+
+# 이전 파트에서 다시 적재된 캠페인의 문장 행 제거 (파트 하나씩 다시 쓰기)
+def _remove_replaced_campaigns(out_dir, replaced):
+    for part, campaign_ids in replaced.items():
+        path = _part_path(out_dir, part)
+        if not os.path.exists(path):
+            continue
+        table = pq.read_table(path, schema=SENTENCE_SCHEMA)
+        keep = pc.invert(pc.is_in(table["campaign_id"], value_set=pa.array(sorted(campaign_ids), pa.string())))
+        _write_part(path, table.filter(keep))
+
+
+# 캠페인 JSONL을 batch_rows 문장마다 Parquet 파트로 추가 저장
+# 파트를 저장할 때마다 체크포인트(원본 파일, byte offset, 파트 수)를 갱신하므로
+# 중단되면 같은 명령으로 마지막 체크포인트부터 이어서 처리한다 (restart=True면 처음부터)
+# manifest의 내용 해시와 같은 캠페인은 건너뛰고, 내용이 바뀐 캠페인은 이전 파트에서 지운 뒤 새 파트에 쓴다
+# update=True면 다른 원본 파일(예: 하루치 신규 캠페인)을 기존 파트 뒤에 이어서 적재한다
+# 같은 경로라도 파일이 다른 내용으로 교체됐으면(뒤에 줄만 추가된 게 아니면) 다른 원본 파일로 본다
+def ingest_jsonl(source, out_dir, batch_rows=INGEST_BATCH_ROWS, restart=False, update=False,
+                 on_error=None, progress=None):
+    os.makedirs(out_dir, exist_ok=True)
+    source_path = os.path.abspath(source)
+    checkpoint = None if restart else read_checkpoint(out_dir)
+    if checkpoint is not None and checkpoint.get("source") != source_path:
+        if not update:
+            raise ValueError(f"다른 원본 파일의 체크포인트가 있습니다: {checkpoint.get('source')} "
+                             f"(처음부터 하려면 restart, 이어서 추가하려면 update)")
+        checkpoint.update(source=source_path, offset=0)
+    elif checkpoint is not None and not source_unchanged(checkpoint, source_path):
+        if not update:
+            raise ValueError(f"체크포인트 이후 원본 파일이 교체되었습니다: {source_path} "
+                             f"(처음부터 하려면 restart, 새 내용을 이어서 추가하려면 update)")
+        checkpoint.update(offset=0)
+    if checkpoint is None:
+        checkpoint = {"source": source_path, "offset": 0, "parts": 0}
+    for name in ("campaigns", "rows", "unchanged", "replaced", "rejected"):
+        checkpoint.setdefault(name, 0)
+    manifest = checkpoint.setdefault("manifest", {})
+    _remove_uncommitted_parts(out_dir, checkpoint["parts"])
+
+    def reject(offset, error):
+        checkpoint["rejected"] += 1
+        if on_error:
+            on_error(offset, error)
+
+    # 캠페인 ID → 캠페인 (같은 배치 안에서 다시 나오면 마지막 레코드만 남김)
+    buffer, replaced = {}, {}
+    buffered_rows = 0
+
+    def flush(offset):
+        nonlocal buffer, replaced, buffered_rows
+        if buffer:
+            columns = {name: [] for name in SENTENCE_SCHEMA.names}
+            for campaign in buffer.values():
+                for row in iter_sentence_rows(campaign):
+                    for name in SENTENCE_SCHEMA.names:
+                        columns[name].append(row[name])
+            _write_part(_part_path(out_dir, checkpoint["parts"]), pa.Table.from_pydict(columns, schema=SENTENCE_SCHEMA))
+            _remove_replaced_campaigns(out_dir, replaced)
+            for campaign_id, campaign in buffer.items():
+                manifest[campaign_id] = [campaign_hash(campaign), checkpoint["parts"]]
+            checkpoint["parts"] += 1
+        checkpoint["offset"] = offset
+        checkpoint.update(_source_identity(source_path, offset))
+        checkpoint["campaigns"] += len(buffer)
+        checkpoint["rows"] += buffered_rows
+        _write_checkpoint(out_dir, checkpoint)
+        buffer, replaced = {}, {}
+        buffered_rows = 0
+        if progress:
+            progress(checkpoint)
+
+    offset = checkpoint["offset"]
+    for offset, campaign in iter_campaigns(source_path, offset, reject):
+        if campaign is None:
+            continue
+        campaign_id = campaign["campaign_id"]
+        # 같은 배치에서 이미 나온 캠페인은 manifest와 비교하지 않고 마지막 레코드로 바꾼다
+        # (manifest 해시는 버퍼의 레코드가 저장되기 전 값이라, 비교하면 이전 내용과 같은 마지막 레코드가 빠진다)
+        if campaign_id in buffer:
+            buffered_rows -= len(buffer.pop(campaign_id)["sentences"])
+        else:
+            previous = manifest.get(campaign_id)
+            if previous is not None and previous[0] == campaign_hash(campaign):
+                checkpoint["unchanged"] += 1
+                continue
+            if previous is not None:
+                replaced.setdefault(previous[1], set()).add(campaign_id)
+                checkpoint["replaced"] += 1
+        buffer[campaign_id] = campaign
+        buffered_rows += len(campaign["sentences"])
+        # 캠페인 중간에서 파트를 나누지 않는다 (체크포인트 offset = 캠페인 경계)
+        if buffered_rows >= batch_rows:
+            flush(offset)
+    flush(offset)
+    return checkpoint
+
+
+# 캠페인 JSONL 적재
+# python -m ingest campaigns.jsonl [--output ./resource/corpus/sentences] [--batch-rows N] [--restart | --update]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="캠페인 JSONL을 문장 코퍼스 Parquet 파트로 적재합니다.")
+    parser.add_argument("source", help="캠페인 JSONL (한 줄에 캠페인 하나)")
+    parser.add_argument("--output", default="./resource/corpus/sentences", help="Parquet 파트 디렉터리")
+    parser.add_argument("--batch-rows", type=int, default=INGEST_BATCH_ROWS, help="파트 하나의 최대 문장 수")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 적재")
+    parser.add_argument("--update", action="store_true",
+                        help="새 원본 파일의 새 캠페인 / 바뀐 캠페인만 기존 파트 뒤에 추가")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+
+    def on_error(offset, error):
+        print(f"건너뜀 (offset {offset}): {error}", file=sys.stderr)
+
+    def progress(checkpoint):
+        print(f"\r적재: 캠페인 {checkpoint['campaigns']:,} / 문장 {checkpoint['rows']:,} "
+              f"(offset {checkpoint['offset']:,})", end="", file=sys.stderr, flush=True)
+
+    checkpoint = ingest_jsonl(args.source, args.output, args.batch_rows, args.restart, args.update, on_error, progress)
+    print(file=sys.stderr)
+    print(f"저장: {args.output} (파트 {checkpoint['parts']}개, 변경 없음 {checkpoint['unchanged']}개, "
+          f"교체 {checkpoint['replaced']}개, 건너뜀 {checkpoint['rejected']}줄, "
+          f"{time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
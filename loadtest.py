@@ -0,0 +1,507 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlsplit
+
+import numpy as np
+from PIL import Image
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+from tornado.websocket import websocket_connect
+
+from thumbnails import THUMBNAIL_JSON_PATH
+
+
+# 동시 세션 부하 테스트
+# streamlit run으로 띄운 대시보드 서버 하나에 브라우저 대신 웹소켓 세션 N개를 붙여서
+# 사이드바 필터 / 요소 탭 / treemap 클릭을 보내고 rerun 지연 시간과 서버 CPU·RSS를 잰다
+# python -m loadtest --sessions 8 --reruns 20
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD_PATH = os.path.join(BASE_DIR, 'dashboard.py')
+
+STREAM_PATH = "/_stcore/stream"
+HEALTH_PATH = "/_stcore/health"
+SERVER_START_TIMEOUT = 120
+
+# 세션 행동 비율 (treemap 클릭은 Product detail 탭이 열려 있을 때만, 아니면 탭 이동)
+ACTION_WEIGHTS = {"filter": 0.35, "keyword": 0.1, "element": 0.35, "treemap": 0.2}
+TREEMAP_ELEMENT = "Product detail"
+SIDEBAR_FILTERS = ("Item", "Season", "Gender")
+MAX_FILTER_KEYWORDS = 2
+
+PERCENTILES = (50, 90, 95, 99)
+MONITOR_INTERVAL = 0.25
+
+# script_finished 상태 (FINISHED_SUCCESSFULLY, FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+SCRIPT_FINISHED_OK = (0, 3)
+IMG_SRC_PATTERN = re.compile(r"""<img[^>]+src=["']([^"']+)["']""")
+
+# 썸네일 CDN 대역 (CDN의 resize/800 변환본과 비슷한 크기의 JPEG 하나를 모든 경로에 응답)
+CDN_IMAGE_SIZE = (800, 600)
+
+
+def _cdn_image_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", CDN_IMAGE_SIZE, (230, 230, 235)).save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+class CdnStandIn:
+    def __init__(self):
+        body = _cdn_image_bytes()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stand_in.lock:
+                    stand_in.hits += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.hits = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# 로컬 썸네일 대신 CDN 대역 URL만 가진 성공 사례 목록 (원격 썸네일 경로 측정용)
+def write_remote_thumbnail_json(cdn_url, out_dir):
+    try:
+        with open(THUMBNAIL_JSON_PATH, 'r', encoding='utf-8') as f:
+            cases = json.load(f)
+    except (OSError, ValueError):
+        cases = []
+    remote_cases = []
+    for i, case in enumerate(cases):
+        path = urlsplit(case.get('project_thumbnail_url') or f"/thumbnail/{i}.jpg").path
+        remote_cases.append({**case, 'project_thumbnail_path': None, 'project_thumbnail_url': cdn_url + path})
+    path = os.path.join(out_dir, 'thumbnail.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(remote_cases, f, ensure_ascii=False)
+    return path
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# 서버 로그는 파일로 (파이프를 읽지 않으면 버퍼가 차서 서버가 멈춘다)
+def start_dashboard(port, env, log_file):
+    return subprocess.Popen([
+        sys.executable, "-m", "streamlit", "run", DASHBOARD_PATH,
+        "--server.headless", "true",
+        "--server.address", "127.0.0.1",
+        "--server.port", str(port),
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ], cwd=BASE_DIR, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+
+
+async def wait_for_server(base_url, process=None, log_path=None, timeout=SERVER_START_TIMEOUT):
+    client = AsyncHTTPClient()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                raise RuntimeError(f"대시보드 서버가 종료되었습니다:\n{f.read()}")
+        try:
+            await client.fetch(base_url + HEALTH_PATH)
+            return
+        except (OSError, HTTPClientError):
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"대시보드 서버가 {timeout}초 안에 뜨지 않았습니다: {base_url}")
+
+
+# 서버 프로세스 CPU / RSS 주기적 측정 (/proc, 리눅스 전용)
+class ProcessMonitor:
+    def __init__(self, pid, interval=MONITOR_INTERVAL):
+        self.pid = pid
+        self.interval = interval
+        self.ticks = os.sysconf("SC_CLK_TCK")
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _read(self):
+        with open(f"/proc/{self.pid}/stat", "r") as f:
+            # comm에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 필드를 센다 (utime, stime = 14, 15번째)
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self.ticks
+        rss = 0
+        with open(f"/proc/{self.pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1]) * 1024
+        return time.monotonic(), cpu_seconds, rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.samples.append(self._read())
+            except OSError:
+                return
+
+    def start(self):
+        self.samples.append(self._read())
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        try:
+            self.samples.append(self._read())
+        except OSError:
+            pass
+
+    def summary(self):
+        if len(self.samples) < 2:
+            return None
+        times, cpu, rss = (np.asarray(column) for column in zip(*self.samples))
+        usage = np.diff(cpu) / np.maximum(np.diff(times), 1e-9) * 100
+        return {
+            "cpu_seconds": float(cpu[-1] - cpu[0]),
+            "cpu_percent_mean": float((cpu[-1] - cpu[0]) / max(times[-1] - times[0], 1e-9) * 100),
+            "cpu_percent_max": float(usage.max()),
+            "rss_start_bytes": int(rss[0]),
+            "rss_peak_bytes": int(rss.max()),
+            "rss_end_bytes": int(rss[-1]),
+        }
+
+
+# 브라우저 한 개 (웹소켓 세션) 흉내
+# 매 rerun마다 지금까지 본 모든 위젯의 현재 값을 보내고 script_finished까지 기다린다
+class DashboardSession:
+    def __init__(self, index, base_url, cdn_url, seed, think_time, timeout, stats):
+        self.index = index
+        self.base_url = base_url
+        self.cdn_url = cdn_url
+        self.rng = random.Random(seed * 100003 + index)
+        self.think_time = think_time
+        self.timeout = timeout
+        self.stats = stats
+        self.ws = None
+        self.http = AsyncHTTPClient()
+
+        self.widgets = {}        # 라벨 → 위젯 proto (selectbox / multiselect / radio / text_input)
+        self.states = {}         # 위젯 ID → WidgetState (브라우저가 보내는 현재 값)
+        self.treemap = None      # (component ID, 잎 노드 pointNumber 목록)
+        self.fetched = set()     # 브라우저 이미지 캐시
+
+    async def connect(self):
+        url = "ws" + self.base_url[len("http"):] + STREAM_PATH
+        self.ws = await websocket_connect(url, max_message_size=1 << 30)
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    def _default_state(self, kind, widget):
+        state = WidgetState(id=widget.id)
+        if kind == "selectbox" and widget.HasField("default") and widget.options:
+            state.string_value = widget.options[widget.default]
+        elif kind == "multiselect":
+            state.string_array_value.data[:] = [widget.options[i] for i in widget.default]
+        elif kind == "radio" and widget.HasField("default"):
+            state.int_value = widget.default
+        elif kind == "text_input":
+            state.string_value = widget.default if widget.HasField("default") else ""
+        return state
+
+    def _collect(self, element, images):
+        kind = element.WhichOneof("type")
+        if kind in ("selectbox", "multiselect", "radio", "text_input"):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = (kind, widget)
+            if widget.id not in self.states:
+                self.states[widget.id] = self._default_state(kind, widget)
+        elif kind == "component_instance" and element.component_instance.component_name.endswith("plotly_events"):
+            args = json.loads(element.component_instance.json_args)
+            ids = json.loads(args["plot_obj"])["data"][0].get("ids", [])
+            leaves = [i for i, node_id in enumerate(ids) if node_id.count("/") == 3]
+            self.treemap = (element.component_instance.id, leaves)
+        elif kind == "imgs":
+            images.extend(image.url for image in element.imgs.imgs)
+        elif kind == "markdown":
+            images.extend(IMG_SRC_PATTERN.findall(element.markdown.body))
+        elif kind == "exception":
+            self.stats.record_exception(element.exception.message)
+
+    async def rerun(self, action):
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        message.rerun_script.widget_states.widgets.extend(self.states.values())
+        self.treemap = None
+
+        images = []
+        started = time.perf_counter()
+        await self.ws.write_message(message.SerializeToString(), binary=True)
+        while True:
+            raw = await asyncio.wait_for(self.ws.read_message(), self.timeout)
+            if raw is None:
+                raise ConnectionError("웹소켓 연결이 끊어졌습니다")
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                self._collect(forward.delta.new_element, images)
+            elif kind == "script_finished":
+                status = forward.script_finished
+                break
+        self.stats.record_rerun(action, time.perf_counter() - started, status in SCRIPT_FINISHED_OK)
+        await self.fetch_images(images)
+
+    # 브라우저처럼 새 이미지만 받기 (data URI 제외, 외부 호스트는 CDN 대역으로)
+    async def fetch_images(self, urls):
+        for url in urls:
+            if url.startswith("data:") or url in self.fetched:
+                continue
+            self.fetched.add(url)
+            parts = urlsplit(url)
+            if parts.scheme in ("http", "https"):
+                source, target = "cdn", self.cdn_url + parts.path + (f"?{parts.query}" if parts.query else "")
+            else:
+                source, target = "media", urljoin(self.base_url + "/", url)
+            started = time.perf_counter()
+            try:
+                await self.http.fetch(target, request_timeout=self.timeout)
+                self.stats.record_image(source, time.perf_counter() - started, True)
+            except (OSError, HTTPClientError):
+                self.stats.record_image(source, time.perf_counter() - started, False)
+
+    def _set(self, label, **value):
+        kind, widget = self.widgets[label]
+        state = WidgetState(id=widget.id, **value)
+        self.states[widget.id] = state
+
+    def next_action(self):
+        actions, weights = zip(*ACTION_WEIGHTS.items())
+        action = self.rng.choices(actions, weights)[0]
+        radio = next(((kind, widget) for kind, widget in self.widgets.values() if kind == "radio"), None)
+
+        if action == "treemap" and self.treemap and self.treemap[1]:
+            component_id, leaves = self.treemap
+            point = self.rng.choice(leaves)
+            # plotly_events 컴포넌트는 클릭한 점 목록을 JSON 문자열로 보낸다
+            value = json.dumps([{"curveNumber": 0, "pointNumber": point, "pointIndex": point}])
+            self.states[component_id] = WidgetState(id=component_id, json_value=json.dumps(value))
+            return "treemap"
+        if action == "treemap" and radio is not None and TREEMAP_ELEMENT in radio[1].options:
+            self._set(radio[1].label, int_value=list(radio[1].options).index(TREEMAP_ELEMENT))
+            return "element"
+        if action in ("element", "treemap") and radio is not None:
+            self._set(radio[1].label, int_value=self.rng.randrange(len(radio[1].options)))
+            return "element"
+        if action == "keyword":
+            multiselect = next((widget for kind, widget in self.widgets.values() if kind == "multiselect"), None)
+            if multiselect is not None:
+                k = self.rng.randint(0, min(MAX_FILTER_KEYWORDS, len(multiselect.options)))
+                self._set(multiselect.label, string_array_value={"data": self.rng.sample(list(multiselect.options), k)})
+                return "keyword"
+        labels = [label for label in SIDEBAR_FILTERS if label in self.widgets]
+        if not labels:
+            return "rerun"
+        label = self.rng.choice(labels)
+        self._set(label, string_value=self.rng.choice(list(self.widgets[label][1].options)))
+        return "filter"
+
+    async def run(self, reruns, start_delay):
+        await asyncio.sleep(start_delay)
+        await self.connect()
+        try:
+            await self.rerun("load")
+            for _ in range(reruns):
+                if self.think_time > 0:
+                    await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+                await self.rerun(self.next_action())
+        finally:
+            self.close()
+
+
+# 세션 전체의 측정값
+class LoadStats:
+    def __init__(self):
+        self.reruns = {}
+        self.failed_reruns = 0
+        self.exceptions = {}
+        self.images = {}
+        self.failed_images = 0
+        self.session_errors = []
+
+    def record_rerun(self, action, seconds, ok):
+        self.reruns.setdefault(action, []).append(seconds)
+        if not ok:
+            self.failed_reruns += 1
+
+    def record_exception(self, message):
+        self.exceptions[message] = self.exceptions.get(message, 0) + 1
+
+    def record_image(self, source, seconds, ok):
+        self.images.setdefault(source, []).append(seconds)
+        if not ok:
+            self.failed_images += 1
+
+
+def latency_summary(seconds):
+    values = np.asarray(seconds) * 1000
+    summary = {"count": len(values), "mean_ms": float(values.mean()), "max_ms": float(values.max())}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{p}_ms"] = float(value)
+    return summary
+
+
+def build_report(args, stats, elapsed, process_summary, cdn_hits):
+    all_reruns = [s for values in stats.reruns.values() for s in values]
+    return {
+        "sessions": args.sessions,
+        "reruns_per_session": args.reruns,
+        "think_time": args.think_time,
+        "elapsed_seconds": elapsed,
+        "throughput_reruns_per_second": len(all_reruns) / elapsed if elapsed > 0 else 0.0,
+        "latency": {
+            "all": latency_summary(all_reruns) if all_reruns else None,
+            **{action: latency_summary(values) for action, values in sorted(stats.reruns.items())},
+        },
+        "images": {source: latency_summary(values) for source, values in sorted(stats.images.items())},
+        "cdn_requests": cdn_hits,
+        "failed_reruns": stats.failed_reruns,
+        "failed_images": stats.failed_images,
+        "exceptions": stats.exceptions,
+        "session_errors": stats.session_errors,
+        "server": process_summary,
+    }
+
+
+def print_report(report):
+    print(f"세션 {report['sessions']}개 × rerun {report['reruns_per_session']}회 "
+          f"(평균 대기 {report['think_time']}s): {report['elapsed_seconds']:.1f}s, "
+          f"{report['throughput_reruns_per_second']:.2f} rerun/s")
+    header = f"{'':10}{'count':>7}" + "".join(f"{f'p{p}':>9}" for p in PERCENTILES) + f"{'max':>9}  (ms)"
+    print(header)
+    for name, summary in [*report["latency"].items(), *(("img:" + k, v) for k, v in report["images"].items())]:
+        if summary is None:
+            continue
+        print(f"{name:10}{summary['count']:>7}"
+              + "".join(f"{summary[f'p{p}_ms']:>9.1f}" for p in PERCENTILES) + f"{summary['max_ms']:>9.1f}")
+    server = report["server"]
+    if server:
+        print(f"서버 CPU: 평균 {server['cpu_percent_mean']:.0f}% / 최대 {server['cpu_percent_max']:.0f}% "
+              f"({server['cpu_seconds']:.1f} CPU초)")
+        print(f"서버 RSS: 시작 {server['rss_start_bytes'] / 2**20:.0f} MiB / 최대 {server['rss_peak_bytes'] / 2**20:.0f} MiB "
+              f"/ 종료 {server['rss_end_bytes'] / 2**20:.0f} MiB")
+    print(f"CDN 대역 요청 {report['cdn_requests']}회, 실패 rerun {report['failed_reruns']}회, "
+          f"실패 이미지 {report['failed_images']}회")
+    for message, count in report["exceptions"].items():
+        print(f"  예외 {count}회: {message}")
+    for error in report["session_errors"]:
+        print(f"  세션 오류: {error}")
+
+
+async def run_sessions(args, base_url, cdn_url, stats):
+    sessions = [
+        DashboardSession(i, base_url, cdn_url, args.seed, args.think_time, args.timeout, stats)
+        for i in range(args.sessions)
+    ]
+    delays = [args.ramp_up * i / max(args.sessions, 1) for i in range(args.sessions)]
+    results = await asyncio.gather(*(session.run(args.reruns, delay) for session, delay in zip(sessions, delays)),
+                                   return_exceptions=True)
+    for session, result in zip(sessions, results):
+        if isinstance(result, Exception):
+            stats.session_errors.append(f"#{session.index}: {type(result).__name__}: {result}")
+
+
+async def run_load_test(args):
+    stats = LoadStats()
+    with CdnStandIn() as cdn, tempfile.TemporaryDirectory() as tmp_dir:
+        process = None
+        log_path = os.path.join(tmp_dir, 'server.log')
+        if args.url:
+            base_url = args.url.rstrip("/")
+        else:
+            env = dict(os.environ)
+            if args.remote_thumbnails:
+                env["FASHION_THUMBNAIL_JSON"] = write_remote_thumbnail_json(cdn.url, tmp_dir)
+            port = args.port or free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            log_file = open(log_path, 'wb')
+            process = start_dashboard(port, env, log_file)
+            log_file.close()
+        try:
+            await wait_for_server(base_url, process, log_path)
+            pid = process.pid if process is not None else args.pid
+            monitor = ProcessMonitor(pid).start() if pid else None
+            started = time.perf_counter()
+            await run_sessions(args, base_url, cdn.url, stats)
+            elapsed = time.perf_counter() - started
+            if monitor is not None:
+                monitor.stop()
+        finally:
+            if process is not None:
+                process.terminate()
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+        return build_report(args, stats, elapsed, monitor.summary() if monitor else None, cdn.hits)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 서버 하나에 동시 세션을 붙여 rerun 지연 시간과 CPU/RSS를 측정합니다.")
+    parser.add_argument("--sessions", type=int, default=8, help="동시 세션 수")
+    parser.add_argument("--reruns", type=int, default=20, help="세션당 rerun 횟수 (첫 로딩 제외)")
+    parser.add_argument("--think-time", type=float, default=0.5, help="rerun 사이 평균 대기 시간(초, 지수 분포)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="모든 세션이 접속할 때까지의 시간(초)")
+    parser.add_argument("--seed", type=int, default=0, help="세션 행동 시드")
+    parser.add_argument("--timeout", type=float, default=120.0, help="rerun 하나의 최대 대기 시간(초)")
+    parser.add_argument("--port", type=int, default=0, help="대시보드 서버 포트 (기본값: 빈 포트)")
+    parser.add_argument("--url", help="이미 떠 있는 대시보드 서버 주소 (서버를 새로 띄우지 않음)")
+    parser.add_argument("--pid", type=int, help="--url 서버의 프로세스 ID (CPU/RSS 측정)")
+    parser.add_argument("--remote-thumbnails", action="store_true",
+                        help="성공 사례 썸네일을 로컬 이미지 대신 CDN 대역 URL로 제공")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+    if args.sessions < 1 or args.reruns < 0:
+        parser.error("--sessions는 1 이상, --reruns는 0 이상이어야 합니다")
+
+    report = asyncio.run(run_load_test(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if report["session_errors"] or report["failed_reruns"] or report["exceptions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
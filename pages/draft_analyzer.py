@@ -0,0 +1,118 @@
+import streamlit as st
+st.set_page_config(
+    layout="wide",
+    page_title="스토리 초안 분석",
+    page_icon="📝"
+)
+
+import pandas as pd
+
+from charts import build_element_share_figure, story_label
+from corpus import CORPUS_PATH, data_version
+from data_store import get_draft_analyzer, get_similarity_index
+from profiler import profiler
+
+
+# 메이커가 붙여 넣은 스토리 초안을 성공 캠페인 코퍼스와 비교
+# 문장 분리 → 7개 요소 분류 (모든 문장을 한 번에) → 요소별 비중 / 구성 순서 / 키워드를 코퍼스와 비교
+
+profiler.start_rerun()
+
+# 문장별 분류 결과에 표시할 최대 문장 수
+SENTENCE_TABLE_ROWS = 300
+# 요소별로 표시할 빠진 키워드 수
+MISSING_KEYWORDS_SHOWN = 10
+# 비슷한 캠페인 수
+SIMILAR_CAMPAIGNS = 5
+
+st.markdown("## 📝 스토리 초안 분석")
+st.caption("작성 중인 스토리를 붙여 넣으면 문장마다 스토리 요소를 분류하고, 성공한 패션 캠페인의 요소 비중 · 구성 순서 · 핵심 키워드와 비교합니다.")
+
+profiler.stage("data_load")
+corpus_version = data_version(CORPUS_PATH)
+analyzer = get_draft_analyzer(corpus_version)
+
+if analyzer is None:
+    st.info("코퍼스 파일이 없어 초안을 분석할 수 없습니다. `python -m ingest`로 코퍼스를 먼저 만들어 주세요.")
+    profiler.finish_rerun()
+    st.stop()
+
+draft = st.text_area("스토리 초안", height=260, key="draft_text",
+                     placeholder="예: 매일 입기 좋은 옷을 찾기 어려우셨죠? 코튼 100% 소재로 ...")
+
+if not draft.strip():
+    profiler.finish_rerun()
+    st.stop()
+
+profiler.stage("draft_analysis")
+with profiler.section("analyze_draft"):
+    result = analyzer.analyze(draft)
+
+if not len(result):
+    st.warning("문장을 찾지 못했습니다.")
+    profiler.finish_rerun()
+    st.stop()
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("문장 수", f"{len(result):,}")
+col2.metric("포함된 요소", f"{len(result.order)} / {len(result.elements)}")
+agreement = result.order_agreement
+col3.metric("구성 순서 일치도", f"{agreement:.0%}" if agreement is not None else "-",
+            help="초안과 성공 캠페인 대표 순서에 모두 있는 요소 쌍 중 선후 관계가 같은 비율")
+coverage = [c.coverage for c in result.comparisons if c.n_sentences]
+col4.metric("핵심 키워드 사용률", f"{sum(coverage) / len(coverage):.0%}" if coverage else "-",
+            help="초안에 있는 요소별로, 성공 캠페인 상위 키워드 중 초안에 나온 비율의 평균")
+
+profiler.stage("story_order")
+st.markdown("---")
+st.markdown("### 스토리 구성 순서")
+col1, col2 = st.columns([1, 1])
+with col1:
+    st.markdown("**내 초안**")
+    st.markdown(" → ".join(story_label(element) for element in result.order))
+    if result.missing_elements:
+        st.caption("빠진 요소: " + ", ".join(story_label(element) for element in result.missing_elements))
+with col2:
+    st.markdown("**성공 캠페인 대표 순서**")
+    st.markdown(" → ".join(story_label(element) for element in result.corpus_order))
+
+st.markdown("### 요소별 문장 비중")
+with profiler.section("plotly_chart"):
+    st.plotly_chart(build_element_share_figure(result.comparisons), use_container_width=True)
+
+profiler.stage("element_keywords")
+st.markdown("### 요소별 핵심 키워드")
+tabs = st.tabs([story_label(c.element) for c in result.comparisons])
+for tab, comparison in zip(tabs, result.comparisons):
+    with tab:
+        if not comparison.n_sentences:
+            st.caption("초안에 이 요소로 분류된 문장이 없습니다.")
+        st.markdown(f"**사용한 키워드** ({len(comparison.used)} / {len(comparison.corpus_keywords)})")
+        st.markdown(", ".join(comparison.used) if comparison.used else "-")
+        st.markdown("**성공 캠페인에서 자주 쓰였지만 초안에 없는 키워드**")
+        st.markdown(", ".join(comparison.missing[:MISSING_KEYWORDS_SHOWN]) if comparison.missing else "-")
+
+profiler.stage("sentences")
+with st.expander("문장별 분류 결과"):
+    st.dataframe(pd.DataFrame({
+        "문장": result.sentences[:SENTENCE_TABLE_ROWS],
+        "요소": [story_label(element) for element in result.sentence_elements[:SENTENCE_TABLE_ROWS]],
+        "확신도": result.confidence[:SENTENCE_TABLE_ROWS].round(2),
+    }), hide_index=True, use_container_width=True)
+    if not result.known.all():
+        st.caption(f"코퍼스에 없는 단어로만 된 문장 {int((~result.known).sum())}개는 요소 비중만으로 분류했습니다.")
+
+# 유사 캠페인 (python -m dashboard_precompute로 인덱스를 만든 경우만)
+similarity_index = get_similarity_index(corpus_version)
+if similarity_index is not None:
+    profiler.stage("similar_campaigns")
+    st.markdown("### 비슷한 성공 캠페인")
+    with profiler.section("similar_campaigns"):
+        similar = similarity_index.similar_campaigns(draft, SIMILAR_CAMPAIGNS)
+    if similar:
+        st.dataframe(pd.DataFrame(similar, columns=["캠페인", "유사도"]).round({"유사도": 3}),
+                     hide_index=True, use_container_width=True)
+    else:
+        st.caption("겹치는 단어가 있는 캠페인이 없습니다.")
+
+profiler.finish_rerun()
@@ -0,0 +1,292 @@
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# rerun 구간별 시간 측정
+# dashboard.py의 각 구간 / 렌더링 함수 / 데이터 헬퍼를 감싸서 rerun마다 wall / CPU 시간과 할당량을 기록하고
+# 프로세스 전체 누적값을 Prometheus 텍스트 형식으로 내보낸다
+#   FASHION_PROFILE_ALLOCATIONS=1 : tracemalloc으로 구간별 할당량도 기록 (느려지므로 기본값은 사용 안 함)
+#   FASHION_METRICS_PORT=9464     : http://127.0.0.1:9464/metrics 로 Prometheus 텍스트 제공
+#   FASHION_PROFILE_LOG=1         : rerun마다 구간별 시간을 로그로 출력
+
+PROFILE_ALLOCATIONS = os.environ.get("FASHION_PROFILE_ALLOCATIONS", "0") == "1"
+METRICS_PORT = int(os.environ.get("FASHION_METRICS_PORT", "0"))
+METRICS_HOST = os.environ.get("FASHION_METRICS_HOST", "127.0.0.1")
+PROFILE_LOG = os.environ.get("FASHION_PROFILE_LOG", "0") == "1"
+
+METRIC_PREFIX = "fashion_dashboard"
+# 구간 wall 시간 히스토그램 경계 (초)
+WALL_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger("fashion.profile")
+
+
+# 구간 하나의 측정값 (depth: 중첩 깊이, 바깥 구간 시간은 안쪽 구간을 포함)
+class SectionTiming:
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.alloc = None
+
+
+# rerun 한 번의 구간 목록
+class RerunProfile:
+    def __init__(self):
+        self.sections = []
+        self.depth = 0
+        self.started = time.perf_counter()
+        self.cpu_started = time.thread_time()
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.alloc_peak = None
+        self.stage = None
+
+
+# 구간별 누적 통계 (프로세스 전체, 모든 세션 합산)
+class SectionTotals:
+    def __init__(self):
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.alloc = 0
+        self.buckets = [0] * len(WALL_BUCKETS)
+
+    def add(self, wall, cpu, alloc):
+        self.count += 1
+        self.wall += wall
+        self.cpu += cpu
+        self.alloc += alloc or 0
+        index = bisect.bisect_left(WALL_BUCKETS, wall)
+        if index < len(WALL_BUCKETS):
+            self.buckets[index] += 1
+
+
+# Streamlit은 세션마다 다른 스레드에서 스크립트를 실행하므로
+# 진행 중인 rerun은 스레드별로 두고, CPU 시간은 스레드 CPU 시간(time.thread_time)으로 잰다
+# 할당량은 tracemalloc이 프로세스 전체를 추적하므로 동시에 실행 중인 다른 세션의 할당도 포함된다
+class Profiler:
+    def __init__(self, allocations=PROFILE_ALLOCATIONS):
+        self.allocations = allocations
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._totals = {}
+        self._reruns = SectionTotals()
+        self._metrics_server = None
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @property
+    def current(self):
+        return getattr(self._local, "profile", None)
+
+    def _traced_memory(self):
+        return tracemalloc.get_traced_memory()[0] if self.allocations and tracemalloc.is_tracing() else None
+
+    # 스크립트 맨 앞에서 호출 (이전 rerun이 중간에 끝났으면 버린다)
+    def start_rerun(self):
+        self._local.profile = RerunProfile()
+        if self.allocations and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        return self._local.profile
+
+    # 스크립트 맨 끝에서 호출 → 이번 rerun의 RerunProfile
+    def finish_rerun(self):
+        profile = self.current
+        if profile is None:
+            return None
+        self._end_stage(profile)
+        self._local.profile = None
+        profile.wall = time.perf_counter() - profile.started
+        profile.cpu = time.thread_time() - profile.cpu_started
+        if self.allocations and tracemalloc.is_tracing():
+            profile.alloc_peak = tracemalloc.get_traced_memory()[1]
+
+        with self._lock:
+            self._reruns.add(profile.wall, profile.cpu, profile.alloc_peak)
+            for section in profile.sections:
+                self._totals.setdefault(section.name, SectionTotals()).add(section.wall, section.cpu, section.alloc)
+        if PROFILE_LOG:
+            logger.info("rerun %.1fms (cpu %.1fms): %s", profile.wall * 1000, profile.cpu * 1000, ", ".join(
+                f"{section.name}={section.wall * 1000:.1f}ms" for section in profile.sections if section.depth == 0))
+        return profile
+
+    # 진행 중인 rerun이 없으면 (다른 스레드 / 스크립트 밖) 아무것도 재지 않는다
+    @contextmanager
+    def section(self, name):
+        profile = self.current
+        if profile is None:
+            yield
+            return
+        timing = SectionTiming(name, profile.depth)
+        profile.sections.append(timing)
+        profile.depth += 1
+        memory = self._traced_memory()
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            timing.wall = time.perf_counter() - wall
+            timing.cpu = time.thread_time() - cpu
+            if memory is not None:
+                timing.alloc = max(self._traced_memory() - memory, 0)
+            profile.depth -= 1
+
+    # 스크립트 최상위 구간 (다음 stage / finish_rerun까지)
+    # 스크립트 본문을 with 블록으로 들여쓰지 않고 구간을 나눌 때 사용
+    def stage(self, name):
+        profile = self.current
+        if profile is None:
+            return
+        self._end_stage(profile)
+        profile.stage = self.section(name)
+        profile.stage.__enter__()
+
+    def _end_stage(self, profile):
+        if profile.stage is not None:
+            stage, profile.stage = profile.stage, None
+            stage.__exit__(None, None, None)
+
+    # 함수 데코레이터 (이름을 생략하면 함수 이름)
+    def profiled(self, name=None):
+        def decorator(func):
+            section_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.section(section_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # 분석 객체(CorpusAnalysis / AggregateView)의 메서드 호출을 "prefix.메서드" 구간으로 기록
+    def wrap_methods(self, obj, prefix):
+        return None if obj is None else ProfiledProxy(self, obj, prefix)
+
+    def prometheus_text(self):
+        with self._lock:
+            totals = {name: _copy_totals(t) for name, t in self._totals.items()}
+            reruns = _copy_totals(self._reruns)
+
+        lines = [
+            f"# HELP {METRIC_PREFIX}_reruns_total Dashboard script reruns.",
+            f"# TYPE {METRIC_PREFIX}_reruns_total counter",
+            f"{METRIC_PREFIX}_reruns_total {reruns.count}",
+            f"# HELP {METRIC_PREFIX}_rerun_cpu_seconds_total Script thread CPU time over all reruns.",
+            f"# TYPE {METRIC_PREFIX}_rerun_cpu_seconds_total counter",
+            f"{METRIC_PREFIX}_rerun_cpu_seconds_total {reruns.cpu:.6f}",
+        ]
+        lines += _histogram_lines(f"{METRIC_PREFIX}_rerun_wall_seconds", "Wall time per rerun.", {"": reruns})
+        lines += _histogram_lines(f"{METRIC_PREFIX}_section_wall_seconds",
+                                  "Wall time per section call (inclusive of nested sections).", totals)
+        lines += [
+            f"# HELP {METRIC_PREFIX}_section_cpu_seconds_total Script thread CPU time per section.",
+            f"# TYPE {METRIC_PREFIX}_section_cpu_seconds_total counter",
+        ]
+        lines += [f'{METRIC_PREFIX}_section_cpu_seconds_total{{section="{_label(name)}"}} {t.cpu:.6f}'
+                  for name, t in sorted(totals.items())]
+        if self.allocations:
+            lines += [
+                f"# HELP {METRIC_PREFIX}_section_alloc_bytes_total Net traced allocations per section (process-wide).",
+                f"# TYPE {METRIC_PREFIX}_section_alloc_bytes_total counter",
+            ]
+            lines += [f'{METRIC_PREFIX}_section_alloc_bytes_total{{section="{_label(name)}"}} {t.alloc}'
+                      for name, t in sorted(totals.items())]
+        return "\n".join(lines) + "\n"
+
+    # 섹션별 누적 요약 [(이름, 호출 수, 평균 wall 초, 평균 CPU 초)] (평균 wall 내림차순)
+    def summary(self):
+        with self._lock:
+            rows = [(name, t.count, t.wall / t.count, t.cpu / t.count) for name, t in self._totals.items() if t.count]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    # /metrics HTTP 서버 (프로세스당 한 번만 시작, rerun마다 호출해도 된다)
+    def serve_metrics(self, port=METRICS_PORT, host=METRICS_HOST):
+        if not port:
+            return None
+        with self._lock:
+            if self._metrics_server is not None:
+                return self._metrics_server
+            profiler = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = profiler.prometheus_text().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            try:
+                server = ThreadingHTTPServer((host, port), Handler)
+            except OSError as e:
+                # 같은 포트를 이미 쓰는 프로세스가 있으면 엔드포인트 없이 계속 실행
+                logger.warning("metrics endpoint not started on %s:%s: %s", host, port, e)
+                return None
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self._metrics_server = server
+            return server
+
+
+class ProfiledProxy:
+    def __init__(self, profiler, obj, prefix):
+        self._profiler = profiler
+        self._obj = obj
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        value = getattr(self._obj, name)
+        if not callable(value):
+            return value
+        section = f"{self._prefix}.{name}"
+
+        @functools.wraps(value)
+        def wrapper(*args, **kwargs):
+            with self._profiler.section(section):
+                return value(*args, **kwargs)
+        return wrapper
+
+
+def _copy_totals(totals):
+    copy = SectionTotals()
+    copy.count, copy.wall, copy.cpu, copy.alloc, copy.buckets = \
+        totals.count, totals.wall, totals.cpu, totals.alloc, list(totals.buckets)
+    return copy
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, help_text, totals):
+    lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+    for name, t in sorted(totals.items()):
+        label = f'section="{_label(name)}",' if name else ""
+        cumulative = 0
+        for bound, count in zip(WALL_BUCKETS, t.buckets):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{label}le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{label}le="+Inf"}} {t.count}')
+        suffix = f"{{{label.rstrip(',')}}}" if label else ""
+        lines.append(f"{metric}_sum{suffix} {t.wall:.6f}")
+        lines.append(f"{metric}_count{suffix} {t.count}")
+    return lines
+
+
+# 대시보드 프로세스 공용 프로파일러 (모듈 단위라 rerun / 세션 간에 누적된다)
+profiler = Profiler()
@@ -0,0 +1,168 @@
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+
+import numpy as np
+
+from sampling import dedup_rows
+
+
+# 사이드바 필터 컬럼 (캠페인 속성)
+FILTER_COLUMNS = ["item", "season", "gender"]
+# 필터를 적용하지 않는 선택값
+ALL_VALUE = "All"
+
+QUERY_CACHE_SIZE = 64
+KEYWORD_BITMAP_CACHE_SIZE = 256
+
+
+# 자유 입력 키워드 문자열 → 키워드 목록 ("트렌디, 편안함" → ["트렌디", "편안함"])
+def parse_keyword_input(keyword_input):
+    return [term for term in re.split(r"[,\s]+", keyword_input or "") if term]
+
+
+# 필터 결과 (코퍼스 행 번호의 부분집합)
+# Corpus와 같은 인터페이스를 제공해서 corpus.py의 헬퍼를 그대로 사용할 수 있다
+class CorpusView:
+    def __init__(self, corpus, mask, filters=None):
+        self.base = corpus
+        self.mask = mask
+        # 필터 조건 (셀 단위 통계 합산에 사용)
+        self.filters = filters or {}
+        self.elements = corpus.elements
+        self._example_pools = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    @cached_property
+    def rows(self):
+        return np.flatnonzero(self.mask)
+
+    @cached_property
+    def sentences(self):
+        return self.base.sentences[self.rows]
+
+    @cached_property
+    def element_codes(self):
+        return self.base.element_codes[self.rows]
+
+    @cached_property
+    def campaign_starts(self):
+        campaign_ids = self.base.campaign_ids[self.rows]
+        return np.concatenate((
+            [0],
+            np.flatnonzero(campaign_ids[1:] != campaign_ids[:-1]) + 1,
+            [len(campaign_ids)],
+        )) if len(campaign_ids) else np.zeros(1, dtype=np.int64)
+
+    # 요소 인덱스 슬라이스 중 필터에 해당하는 행만 남기기
+    def element_rows(self, element):
+        rows = self.base.element_rows(element)
+        return rows[self.mask[rows]]
+
+    def element_sentences(self, element):
+        return self.base.sentences[self.element_rows(element)]
+
+    def example_pool(self, element):
+        pool = self._example_pools.get(element)
+        if pool is None:
+            pool = self._example_pools[element] = dedup_rows(self.base.sentence_codes, self.element_rows(element))
+        return pool
+
+
+# item / season / gender / keyword 별 비트맵 인덱스
+# 비트맵은 np.packbits로 압축해서 저장하고 AND/OR 후 한 번만 풀어서 행 번호를 만든다
+# st.cache_resource로 모든 세션 스레드가 같은 인덱스를 쓰므로 두 캐시는 lock 안에서만 읽고 쓴다
+class FilterIndex:
+    def __init__(self, corpus, keywords=()):
+        self.corpus = corpus
+        self.n_rows = len(corpus)
+        self._empty = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        self._full = np.packbits(np.ones(self.n_rows, dtype=bool))
+
+        self._bitmaps = {}
+        for col in FILTER_COLUMNS:
+            if col not in corpus.codes:
+                continue
+            codes = corpus.codes[col]
+            for code, value in enumerate(corpus.categories[col]):
+                self._bitmaps[(col, value)] = np.packbits(codes == code)
+
+        self._keyword_bitmaps = OrderedDict()
+        for keyword in keywords:
+            self._keyword_bitmaps[keyword] = self._build_keyword_bitmap(keyword)
+        self._pinned_keywords = set(keywords)
+        self._query_cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 캠페인 선택(bool, 캠페인 순번) → 해당 캠페인의 모든 행 비트맵
+    def _campaign_bitmap(self, campaign_mask):
+        if self.n_rows == 0:
+            return self._empty
+        return np.packbits(np.repeat(campaign_mask, np.diff(self.corpus.campaign_starts)))
+
+    # 키워드로 시작하는 토큰이 나오는 문장이 하나라도 있는 캠페인의 모든 행 (역색인 조회)
+    # 부분 문자열이 아니라 토큰 접두어 기준 ("방수"는 "방수력"과 일치, 복합어 "생활방수"와는 불일치)
+    # treemap 키워드 언급 수(corpus.count_keyword_mentions)와 자유 입력 검색도 같은 규칙
+    def _build_keyword_bitmap(self, keyword):
+        return self._campaign_bitmap(self.corpus.search_index.campaign_mask((keyword,)))
+
+    # 비트맵은 lock 밖에서 만든다 (두 세션이 같은 키를 동시에 만들면 나중 것이 남는다)
+    def _cached_bitmap(self, key, build):
+        with self._lock:
+            bitmap = self._keyword_bitmaps.get(key)
+        if bitmap is not None:
+            return bitmap
+
+        bitmap = build()
+        with self._lock:
+            self._keyword_bitmaps[key] = bitmap
+            # 미리 만든 키워드 외의 자유 입력 키워드 / 검색어는 개수 제한
+            free_keywords = [kw for kw in self._keyword_bitmaps if kw not in self._pinned_keywords]
+            if len(free_keywords) > KEYWORD_BITMAP_CACHE_SIZE:
+                self._keyword_bitmaps.pop(free_keywords[0], None)
+        return bitmap
+
+    def keyword_bitmap(self, keyword):
+        return self._cached_bitmap(keyword, lambda: self._build_keyword_bitmap(keyword))
+
+    # 검색어 모두가 한 문장에 나오는 캠페인의 모든 행
+    def search_bitmap(self, terms):
+        return self._cached_bitmap(("search", *terms), lambda: self._campaign_bitmap(
+            self.corpus.search_index.campaign_mask(terms)))
+
+    def column_bitmap(self, column, value):
+        if value is None or value == ALL_VALUE or column not in self.corpus.codes:
+            return self._full
+        return self._bitmaps.get((column, value), self._empty)
+
+    # 필터 조건 → CorpusView (조건끼리는 AND, 키워드끼리는 OR, 검색어끼리는 한 문장 안에서 AND)
+    def query(self, item=None, season=None, gender=None, keywords=(), search=()):
+        key = (item, season, gender, tuple(sorted(set(keywords))), tuple(sorted(set(search))))
+        with self._lock:
+            view = self._query_cache.get(key)
+            if view is not None:
+                self._query_cache.move_to_end(key)
+                return view
+
+        bitmap = self._full
+        for column, value in zip(FILTER_COLUMNS, (item, season, gender)):
+            bitmap = bitmap & self.column_bitmap(column, value)
+        if key[3]:
+            keyword_bitmap = self._empty
+            for keyword in key[3]:
+                keyword_bitmap = keyword_bitmap | self.keyword_bitmap(keyword)
+            bitmap = bitmap & keyword_bitmap
+        if key[4]:
+            bitmap = bitmap & self.search_bitmap(key[4])
+
+        mask = np.unpackbits(bitmap, count=self.n_rows).astype(bool)
+        view = CorpusView(self.corpus, mask, dict(zip(FILTER_COLUMNS, (item, season, gender)),
+                                                  keywords=key[3], search=key[4]))
+        with self._lock:
+            self._query_cache[key] = view
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return view
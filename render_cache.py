@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 워드클라우드 PNG 디스크 캐시 경로
+WORDCLOUD_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'wordcloud')
+
+
+# 렌더링 입력값 → 캐시 키 (dict는 키 순서와 무관하게 같은 키)
+def render_cache_key(*parts):
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# 렌더링 결과(bytes) LRU 캐시 + 선택적 디스크 캐시
+# 모듈 단위로 만들어 두면 Streamlit rerun / 세션 간에 공유된다
+class RenderCache:
+    def __init__(self, max_entries=128, disk_dir=None, max_disk_entries=1024, suffix=".png"):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self.suffix = suffix
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}{self.suffix}")
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        if self.disk_dir is None:
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                value = f.read()
+        except OSError:
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.disk_dir is not None:
+            self._write_disk(key, value)
+
+    def get_or_render(self, key, render):
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.put(key, value)
+        return value
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _write_disk(self, key, value):
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            tmp_path = f"{self._disk_path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(value)
+            os.replace(tmp_path, self._disk_path(key))
+
+            # 오래된 파일부터 삭제해서 디스크 캐시 크기 제한
+            files = [os.path.join(self.disk_dir, name) for name in os.listdir(self.disk_dir)
+                     if name.endswith(self.suffix)]
+            if len(files) > self.max_disk_entries:
+                files.sort(key=os.path.getmtime)
+                for path in files[:len(files) - self.max_disk_entries]:
+                    os.remove(path)
+        except OSError:
+            # 디스크 캐시 실패는 무시 (메모리 캐시만 사용)
+            pass
+
+
+# Plotly figure 캐시 (figure JSON 문자열 저장, 전체 크기 제한 LRU)
+# 캐시 적중 시 pandas / plotly express 처리 없이 JSON에서 figure만 복원한다
+class FigureCache:
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            figure_json = self._entries.get(key)
+            if figure_json is not None:
+                self._entries.move_to_end(key)
+
+        if figure_json is not None:
+            # 세션마다 새 figure 객체를 만들어서 캐시된 값이 변경되지 않도록 한다
+            return pio.from_json(figure_json)
+
+        fig = build()
+        if fig is not None:
+            self._remember(key, fig.to_json())
+        return fig
+
+    def _remember(self, key, figure_json):
+        size = len(figure_json)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self._entries[key] = figure_json
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+
+# 워드클라우드 이미지 캐시
+wordcloud_cache = RenderCache(max_entries=64, disk_dir=WORDCLOUD_CACHE_DIR)
+
+# 차트 figure 캐시
+figure_cache = FigureCache()
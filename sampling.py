@@ -0,0 +1,31 @@
+import hashlib
+import json
+
+import numpy as np
+
+
+# 샘플링 시드 (세션 시드 + 필터 조건 + 요소 등 → 64비트 정수)
+# 같은 입력이면 rerun / 프로세스와 무관하게 같은 예시를 뽑는다
+def sampling_seed(*parts):
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return int.from_bytes(hashlib.sha1(payload.encode('utf-8')).digest()[:8], "little")
+
+
+# 행 번호 목록에서 같은 문장은 처음 나온 행만 남기기 (문장 코드 정수 배열로 중복 제거)
+def dedup_rows(sentence_codes, rows):
+    _, first = np.unique(sentence_codes[rows], return_index=True)
+    return rows[np.sort(first)]
+
+
+# pool(정수 배열)에서 n개 비복원 추출 (pool보다 적으면 전부, 순서는 추출 순서)
+def sample_pool(pool, n, seed):
+    n = min(n, len(pool))
+    if n <= 0:
+        return pool[:0]
+    picks = np.random.default_rng(seed).choice(len(pool), size=n, replace=False)
+    return pool[picks]
+
+
+# 데이터가 없을 때 차트용 예시 값 (key가 같으면 항상 같은 값)
+def placeholder_values(size, *key, low=10, high=30):
+    return np.random.default_rng(sampling_seed(*key)).integers(low, high, size=size, endpoint=True).tolist()
@@ -0,0 +1,198 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+
+from tokenizer import STRIP_CHARS, normalize
+
+
+# 문장 전문 검색용 역색인 (토큰 → 그 토큰이 나오는 문장 번호의 정렬된 int32 배열)
+# 키워드 통계의 (문장 × 토큰) 카운트 행렬을 열 기준(CSC)으로 바꾼 것이므로 다시 토큰화하지 않는다
+# 어휘가 정렬되어 있어서 접두어 검색은 어휘의 연속 구간 하나가 된다
+# 한 글자 검색어는 구간이 넓어서 합치는 비용이 크므로, 토큰 첫 글자별 posting을 따로 만들어 둔다
+
+SEARCH_CACHE_SIZE = 128
+# posting이 문장 수의 1/BITMAP_RATIO 보다 길면 정렬 / 이진 탐색 대신 문장 수 크기의 배열로 합집합 / 교집합
+BITMAP_RATIO = 32
+# 유니코드 최대 문자 (접두어 구간의 끝)
+_MAX_CHAR = "\U0010ffff"
+
+
+# 검색어 → 접두어 (토큰과 같은 정규화, 앞뒤 문장 부호 제거)
+def normalize_term(term):
+    return normalize(term).strip().strip(STRIP_CHARS)
+
+
+# 검색 결과
+#   rows          : 모든 검색어가 (접두어로) 나오는 문장 번호 (정렬)
+#   top_rows      : 검색어 등장 횟수가 많은 순서의 문장 번호 (최대 n_sentences개)
+#   top_campaigns : [(캠페인 순번, 일치 문장 수), ...] 일치 문장이 많은 순서
+class SearchResult:
+    def __init__(self, terms, rows, top_rows, top_campaigns, n_campaigns):
+        self.terms = terms
+        self.rows = rows
+        self.top_rows = top_rows
+        self.top_campaigns = top_campaigns
+        self.n_campaigns = n_campaigns
+
+    def __len__(self):
+        return len(self.rows)
+
+
+# 정렬된 이름 → posting (문장 × 이름 카운트 행렬의 CSC 형태)
+class PostingLists:
+    def __init__(self, names, indptr, postings, counts):
+        self.names = names
+        self.indptr = indptr
+        self.postings = postings
+        self.counts = counts
+
+    @classmethod
+    def from_matrix(cls, matrix, names):
+        matrix = sp.csc_matrix(matrix)
+        matrix.sort_indices()
+        return cls(np.asarray(names, dtype=str), matrix.indptr.astype(np.int64),
+                   matrix.indices.astype(np.int32), matrix.data.astype(np.int32))
+
+    # 접두어에 해당하는 이름 구간 [lo, hi)
+    def prefix_range(self, prefix):
+        lo = int(np.searchsorted(self.names, prefix, side="left"))
+        hi = int(np.searchsorted(self.names, prefix + _MAX_CHAR, side="right"))
+        return lo, hi
+
+    # 이름 구간의 posting 합집합 → (문장 번호 (정렬, 중복 없음), 문장별 등장 횟수)
+    def union(self, lo, hi):
+        start, end = self.indptr[lo], self.indptr[hi]
+        rows, counts = self.postings[start:end], self.counts[start:end]
+        if hi - lo <= 1:
+            return rows, counts
+        # 이름별로 정렬된 구간을 이어 붙인 것이므로 stable 정렬(병합)로 합친다
+        order = np.argsort(rows, kind="stable")
+        rows, counts = rows[order], counts[order]
+        first = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        return rows[first], np.add.reduceat(counts, first).astype(np.int32)
+
+
+class SearchIndex:
+    def __init__(self, tokens, initials, campaign_starts):
+        self.tokens = tokens
+        self.initials = initials
+        self.n_rows = int(campaign_starts[-1]) if len(campaign_starts) else 0
+        self.n_campaigns = len(campaign_starts) - 1
+        # 문장 번호 → 캠페인 순번
+        self.row_campaigns = np.repeat(np.arange(self.n_campaigns, dtype=np.int32), np.diff(campaign_starts))
+        # 코퍼스와 함께 모든 세션 스레드가 공유하므로 검색 캐시는 lock 안에서만 읽고 쓴다
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # (문장 × 토큰) 카운트 행렬 + 정렬된 어휘 → 역색인
+    @classmethod
+    def from_counts(cls, sentence_unigrams, vocab, campaign_starts):
+        vocab = np.asarray(vocab, dtype=str)
+        # 토큰 → 첫 글자 (어휘가 정렬되어 있으므로 첫 글자 목록도 정렬)
+        first_chars = np.asarray([token[:1] for token in vocab], dtype=str)
+        initials, columns = np.unique(first_chars, return_inverse=True)
+        indicator = sp.csr_matrix((np.ones(len(vocab), dtype=np.int32), (np.arange(len(vocab)), columns)),
+                                  shape=(len(vocab), len(initials)))
+        return cls(PostingLists.from_matrix(sentence_unigrams, vocab),
+                   PostingLists.from_matrix(sentence_unigrams @ indicator, initials), campaign_starts)
+
+    # 접두어로 시작하는 토큰이 나오는 문장 번호 (정렬, 중복 없음)와 문장별 등장 횟수
+    def term_postings(self, term):
+        if len(term) == 1:
+            return self.initials.union(*self.initials.prefix_range(term))
+        return self.tokens.union(*self.tokens.prefix_range(term))
+
+    # 여러 검색어 AND → (일치 문장 번호, 문장별 검색어 등장 횟수 합)
+    # posting이 짧은 검색어부터 차례로 교집합
+    def match(self, terms):
+        terms = tuple(term for term in map(normalize_term, terms) if term)
+        with self._lock:
+            cached = self._cache.get(terms)
+            if cached is not None:
+                self._cache.move_to_end(terms)
+                return cached
+
+        postings = sorted((self.term_postings(term) for term in terms), key=lambda posting: len(posting[0]))
+        if not postings:
+            rows = np.arange(self.n_rows, dtype=np.int32)
+            scores = np.zeros(self.n_rows, dtype=np.int64)
+        else:
+            rows = postings[0][0]
+            for other, _ in postings[1:]:
+                rows = self._intersect(rows, other)
+                if not len(rows):
+                    break
+            # rows는 모든 검색어의 posting에 들어 있으므로 rows 쪽을 posting에서 찾는다
+            scores = np.zeros(len(rows), dtype=np.int64)
+            for term_rows, term_counts in postings:
+                if len(term_rows) == len(rows):
+                    scores += term_counts
+                elif len(rows):
+                    scores += term_counts[np.searchsorted(term_rows, rows)]
+
+        with self._lock:
+            self._cache[terms] = rows, scores
+            if len(self._cache) > SEARCH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return rows, scores
+
+    def search_rows(self, terms):
+        return self.match(terms)[0]
+
+    # 두 posting이 모두 길면 bool 배열로, 아니면 정렬 교집합 (a가 짧은 쪽)
+    def _intersect(self, a, b):
+        if len(a) * BITMAP_RATIO > self.n_rows:
+            return b[self._member(a, b)]
+        return intersect_sorted(a, b)
+
+    # values의 각 원소가 sorted_values에 있는지 (bool, values와 같은 길이)
+    def _member(self, sorted_values, values):
+        if len(sorted_values) * BITMAP_RATIO > self.n_rows:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[sorted_values] = True
+            return mask[values]
+        return sorted_member(sorted_values, values)
+
+    # within: 검색 범위 문장 번호 (정렬, 사이드바 필터 결과), None이면 전체
+    def search(self, terms, within=None, n_sentences=5, n_campaigns=5):
+        rows, scores = self.match(terms)
+        if within is not None:
+            inside = self._member(np.asarray(within), rows)
+            rows, scores = rows[inside], scores[inside]
+
+        top = _top_k(scores, n_sentences)
+        campaign_hits = np.bincount(self.row_campaigns[rows], minlength=self.n_campaigns)
+        n_matched = int(np.count_nonzero(campaign_hits))
+        top_campaigns = [(int(c), int(campaign_hits[c])) for c in _top_k(campaign_hits, min(n_campaigns, n_matched))]
+        return SearchResult(list(terms), rows, rows[top], top_campaigns, n_matched)
+
+    # 검색어 AND에 일치하는 문장이 하나라도 있는 캠페인 (bool, 캠페인 순번)
+    def campaign_mask(self, terms):
+        mask = np.zeros(self.n_campaigns, dtype=bool)
+        mask[self.row_campaigns[self.search_rows(terms)]] = True
+        return mask
+
+
+# values의 각 원소가 sorted_values(정렬)에 있는지 (이진 탐색)
+def sorted_member(sorted_values, values):
+    if not len(sorted_values):
+        return np.zeros(len(values), dtype=bool)
+    positions = np.searchsorted(sorted_values, values).clip(max=len(sorted_values) - 1)
+    return sorted_values[positions] == values
+
+
+# 정렬된 두 정수 배열의 교집합 (짧은 쪽을 긴 쪽에서 이진 탐색)
+def intersect_sorted(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return a[sorted_member(b, a)]
+
+
+# 값이 큰 순서의 위치 k개 (같은 값이면 앞 위치 먼저)
+def _top_k(values, k):
+    if k <= 0 or not len(values):
+        return np.empty(0, dtype=np.int64)
+    candidates = np.argpartition(-values, k - 1)[:k] if k < len(values) else np.arange(len(values))
+    return candidates[np.lexsort((candidates, -values[candidates]))]
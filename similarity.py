@@ -0,0 +1,245 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import scipy.sparse as sp
+
+from text_stats import vocab_count_matrix
+from tokenizer import tokenize
+
+
+# 스토리 초안 → 비슷한 성공 캠페인 (TF-IDF 코사인 유사도, CPU / 오프라인)
+# 문서: 캠페인 전체 문장 + (캠페인, 요소)별 문장. 키워드 통계의 (문장 × 토큰) 카운트 행렬을 합산하므로 다시 토큰화하지 않는다
+# 가중치: (1 + log tf) × idf (idf는 캠페인 문서 기준), 문서마다 L2 정규화 → 내적 = 코사인 유사도
+# 저장: 디렉터리 하나에 배열별 .npy (압축 없음) → 대시보드에서는 memory-map으로 읽는다
+# 근사 검색: 토큰마다 가중치가 가장 큰 문서 CHAMPION_LIST_SIZE개(champion list)만 후보로 두고 후보만 정확히 계산
+#   후보 수가 (검색어 토큰 수 × champion list 길이)로 제한되므로 캠페인이 늘어도 지연 시간이 거의 같다
+
+SIMILARITY_PATH = os.environ.get("FASHION_SIMILARITY_PATH", "./resource/corpus/similarity")
+SIMILARITY_FORMAT_VERSION = 1
+CHAMPION_LIST_SIZE = 64
+# 정확 검색에서 한 번에 곱하는 문서 행 수 (점수 배열 = 배치 × 질의 수 float32)
+SCORE_BATCH_ROWS = 65_536
+# 캠페인 전체 문서의 요소 번호
+CAMPAIGN_DOCUMENT = -1
+
+_ARRAYS = ["vocab", "idf", "indptr", "indices", "data", "doc_campaigns", "doc_elements", "campaign_keys",
+           "champion_indptr", "champions"]
+# 큰 배열만 memory-map (나머지는 바로 읽는다)
+_MMAP_ARRAYS = {"indptr", "indices", "data", "champions"}
+
+
+# 행 그룹별 합산 (groups: 행마다 그룹 번호)
+def _group_sum(matrix, groups, n_groups):
+    indicator = sp.csr_matrix((np.ones(len(groups), dtype=np.float32), (groups, np.arange(len(groups)))),
+                              shape=(n_groups, matrix.shape[0]))
+    return (indicator @ matrix).tocsr()
+
+
+# 카운트 행렬 → (1 + log tf) × idf, 행마다 L2 정규화 (float32)
+def tfidf_rows(counts, idf):
+    matrix = sp.csr_matrix(counts, dtype=np.float32, copy=True)
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    norms = np.sqrt(np.bincount(rows, weights=matrix.data.astype(np.float64) ** 2, minlength=matrix.shape[0]))
+    matrix.data /= norms[rows].astype(np.float32)
+    return matrix
+
+
+# 문서 구간 [lo, hi)의 토큰별 champion list (가중치 내림차순 상위 size개 문서 번호)
+def _champion_lists(documents, lo, hi, size):
+    matrix = documents[lo:hi].tocsc()
+    columns = np.repeat(np.arange(matrix.shape[1]), np.diff(matrix.indptr))
+    order = np.lexsort((-matrix.data, columns))
+    rank = np.arange(len(order)) - matrix.indptr[columns[order]]
+    keep = order[rank < size]
+    lengths = np.minimum(np.diff(matrix.indptr), size)
+    return lengths, (matrix.indices[keep] + lo).astype(np.int32)
+
+
+class SimilarityIndex:
+    def __init__(self, corpus_version, elements, arrays):
+        self.corpus_version = corpus_version
+        self.elements = list(elements)
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        self.documents = sp.csr_matrix((self.data, self.indices, self.indptr),
+                                       shape=(len(self.doc_campaigns), len(self.vocab)))
+        # 문서 종류(캠페인 전체 / 요소)별 문서 구간 (문서는 종류 순서로 저장)
+        kinds = np.arange(CAMPAIGN_DOCUMENT, len(self.elements))
+        self._bounds = np.searchsorted(self.doc_elements, np.concatenate((kinds, [len(self.elements)])))
+
+    # 코퍼스 → 인덱스 (키워드 통계가 없으면 통계부터 계산)
+    @classmethod
+    def build(cls, corpus, champion_list_size=CHAMPION_LIST_SIZE):
+        stats = corpus.keyword_stats
+        counts = sp.csr_matrix(stats.sentence_unigrams, dtype=np.float32)
+        n_campaigns = len(corpus.campaign_starts) - 1
+        n_elements = len(corpus.elements)
+        row_campaigns = np.repeat(np.arange(n_campaigns), np.diff(corpus.campaign_starts))
+
+        # (요소, 캠페인) 문서: 요소별로 캠페인 순서가 이어지도록 요소 번호를 앞에 둔다
+        valid = np.flatnonzero(corpus.element_codes >= 0)
+        groups = corpus.element_codes[valid].astype(np.int64) * n_campaigns + row_campaigns[valid]
+        element_groups, group_rows = np.unique(groups, return_inverse=True)
+        element_counts = _group_sum(counts[valid], group_rows, len(element_groups))
+        campaign_counts = _group_sum(element_counts, element_groups % n_campaigns, n_campaigns)
+
+        # idf: 토큰이 나오는 캠페인 수 기준
+        df = np.bincount(campaign_counts.indices, minlength=counts.shape[1])
+        idf = (np.log((1 + n_campaigns) / (1 + df)) + 1).astype(np.float32)
+        documents = tfidf_rows(sp.vstack([campaign_counts, element_counts], format="csr"), idf)
+        documents.sort_indices()
+        doc_campaigns = np.concatenate((np.arange(n_campaigns), element_groups % n_campaigns)).astype(np.int32)
+        doc_elements = np.concatenate((np.full(n_campaigns, CAMPAIGN_DOCUMENT),
+                                       element_groups // n_campaigns)).astype(np.int16)
+
+        # 문서 종류별 champion list (토큰 × 종류 순서로 이어 붙임)
+        kinds = np.arange(CAMPAIGN_DOCUMENT, n_elements)
+        bounds = np.searchsorted(doc_elements, np.concatenate((kinds, [n_elements])))
+        lengths, champions = zip(*(_champion_lists(documents, lo, hi, champion_list_size)
+                                   for lo, hi in zip(bounds[:-1], bounds[1:])))
+        champion_indptr = np.concatenate(([0], np.cumsum(np.concatenate(lengths)))).astype(np.int64)
+
+        arrays = {
+            "vocab": np.asarray(stats.unigram_vocab, dtype=str),
+            "idf": idf,
+            "indptr": documents.indptr.astype(np.int64),
+            "indices": documents.indices.astype(np.int32),
+            "data": documents.data.astype(np.float32),
+            "doc_campaigns": doc_campaigns,
+            "doc_elements": doc_elements,
+            "campaign_keys": np.asarray(corpus.campaign_keys, dtype=str),
+            "champion_indptr": champion_indptr,
+            "champions": np.concatenate(champions).astype(np.int32),
+        }
+        return cls(corpus.version, corpus.elements, arrays)
+
+    # 디렉터리에 배열별 .npy + meta.json 저장 (임시 디렉터리에 쓴 뒤 교체)
+    def save(self, path=SIMILARITY_PATH):
+        path = os.path.abspath(path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        for name in _ARRAYS:
+            np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(getattr(self, name)), allow_pickle=False)
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"format": SIMILARITY_FORMAT_VERSION, "corpus_version": self.corpus_version,
+                       "elements": self.elements}, f, ensure_ascii=False)
+        old_path = f"{path}.{os.getpid()}.old"
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path=SIMILARITY_PATH, mmap=True):
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != SIMILARITY_FORMAT_VERSION:
+            raise ValueError(f"유사도 인덱스 형식이 다릅니다: {meta.get('format')}")
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), allow_pickle=False,
+                                mmap_mode="r" if mmap and name in _MMAP_ARRAYS else None)
+                  for name in _ARRAYS}
+        return cls(meta["corpus_version"], meta["elements"], arrays)
+
+    # 문서 종류 (None = 캠페인 전체, 요소 이름) → 요소 번호 (모르는 요소면 None)
+    def _kind(self, element):
+        if element is None:
+            return CAMPAIGN_DOCUMENT
+        return self.elements.index(element) if element in self.elements else None
+
+    # 문서 종류의 문서 구간 [lo, hi)
+    def document_range(self, element=None):
+        kind = self._kind(element)
+        if kind is None:
+            return 0, 0
+        return int(self._bounds[kind + 1]), int(self._bounds[kind + 2])
+
+    # 텍스트 목록 → 질의 벡터 (질의 수 × 어휘, 어휘에 없는 토큰은 무시)
+    def vectorize(self, texts):
+        return tfidf_rows(vocab_count_matrix([tokenize(text or "") for text in texts], self.vocab), self.idf)
+
+    # 텍스트마다 코사인 유사도 상위 k개 [(캠페인 ID, 유사도), ...]
+    # element를 주면 그 요소 문장끼리 비교, approximate=True면 champion list 후보만 계산
+    def search(self, texts, k=5, element=None, approximate=False):
+        queries = self.vectorize(texts)
+        if approximate:
+            results = [self._search_candidates(queries[i], self._kind(element), k) for i in range(len(texts))]
+        else:
+            results = self._search_exact(queries, *self.document_range(element), k)
+        return [[(str(self.campaign_keys[self.doc_campaigns[doc]]), float(score))
+                 for doc, score in zip(docs, scores) if score > 0] for docs, scores in results]
+
+    # 문서를 SCORE_BATCH_ROWS 행씩 질의 벡터와 곱하면서 질의별 상위 k개 유지
+    def _search_exact(self, queries, lo, hi, k):
+        n_queries = queries.shape[0]
+        best_docs = np.empty((n_queries, 0), dtype=np.int64)
+        best_scores = np.empty((n_queries, 0), dtype=np.float32)
+        queries_t = queries.T.tocsr()
+        for start in range(lo, hi, SCORE_BATCH_ROWS):
+            end = min(start + SCORE_BATCH_ROWS, hi)
+            scores = (self.documents[start:end] @ queries_t).toarray().T
+            docs = np.broadcast_to(np.arange(start, end), scores.shape)
+            best_docs, best_scores = _top_k_rows(np.hstack((best_docs, docs)), np.hstack((best_scores, scores)), k)
+        return list(zip(best_docs, best_scores))
+
+    # 질의 토큰들의 champion list 합집합만 계산
+    def _search_candidates(self, query, kind, k):
+        if kind is None or not query.nnz:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        lists = (kind + 1) * len(self.vocab) + query.indices
+        starts, ends = self.champion_indptr[lists], self.champion_indptr[lists + 1]
+        candidates = np.unique(np.concatenate([self.champions[s:e] for s, e in zip(starts, ends)]))
+        scores = (self.documents[candidates] @ query.T).toarray().ravel()
+        docs, scores = _top_k_rows(candidates[None, :], scores[None, :], k)
+        return docs[0], scores[0]
+
+    # 텍스트 하나 → 비슷한 캠페인 [(캠페인 ID, 유사도), ...]
+    def similar_campaigns(self, text, k=5, element=None, approximate=False):
+        return self.search([text], k, element, approximate)[0]
+
+
+# 행마다 점수 상위 k개 (점수 내림차순, 같으면 문서 번호 순서)
+def _top_k_rows(docs, scores, k):
+    if scores.shape[1] > k:
+        keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        docs, scores = np.take_along_axis(docs, keep, axis=1), np.take_along_axis(scores, keep, axis=1)
+    order = np.lexsort((docs, -scores), axis=1) if scores.size else np.empty(scores.shape, dtype=np.int64)
+    return np.take_along_axis(docs, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+# 인덱스 읽기 (없거나 형식이 다르면 None, corpus를 주면 코퍼스 버전이 다를 때도 None)
+def load_similarity(path=SIMILARITY_PATH, corpus=None):
+    try:
+        index = SimilarityIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        return None
+    if corpus is not None and index.corpus_version != corpus.version:
+        return None
+    return index
+
+
+# python -m similarity "스토리 초안" [-k 5] [--element "Product detail"] [--approximate]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스토리 초안과 비슷한 성공 캠페인을 찾습니다.")
+    parser.add_argument("text", help="스토리 초안 (-이면 표준 입력)")
+    parser.add_argument("-k", type=int, default=5, help="결과 수")
+    parser.add_argument("--element", help="이 요소의 문장끼리 비교 (생략하면 캠페인 전체)")
+    parser.add_argument("--approximate", action="store_true", help="champion list 후보만 계산")
+    parser.add_argument("--index", default=SIMILARITY_PATH, help="유사도 인덱스 디렉터리")
+    args = parser.parse_args(argv)
+
+    index = load_similarity(args.index)
+    if index is None:
+        parser.error(f"유사도 인덱스가 없습니다: {args.index} (python -m dashboard_precompute로 생성)")
+    text = sys.stdin.read() if args.text == "-" else args.text
+    for campaign_id, score in index.similar_campaigns(text, args.k, args.element, args.approximate):
+        print(f"{score:.4f}\t{campaign_id}")
+
+
+if __name__ == "__main__":
+    main()
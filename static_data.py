@@ -0,0 +1,225 @@
+from types import MappingProxyType
+
+
+# 대시보드 기본 데이터 (코퍼스 / 집계 파일이 없을 때 표시하는 키워드 · 예시 문장 · 요소 구성)
+# dashboard.py 안에 두면 rerun마다 새로 만들어지므로 모듈로 분리해서 프로세스당 한 번만 만든다
+# 모든 세션이 같은 객체를 보므로 freeze로 읽기 전용(MappingProxyType / tuple)으로 바꿔서 공유한다
+
+
+# dict → MappingProxyType, list → tuple (중첩 구조 전체)
+def freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# 기능 / 감성 키워드 → 예시 문장 (도넛 차트 옆 hover box)
+FUNCTIONAL_KEYWORD_EXAMPLES = freeze({
+    "실용성": "복잡한세상 편하게 살자! 실용성, 효율성 없으면 말짱 꽝이죠.",
+    "고정력": "목둘레가 쉽게 늘어나지 않도록 헤리 테이프를 추가 봉제하여 탄탄하게 고정.",
+    "휴대": "가방 한켠에 쏘옥-, 주머니에 쏘옥- 간편한 휴대성!",
+    "디테일": "사소한 디테일까지 고심하여 제작하였습니다.",
+    "착용감": "입은 듯 안 입은 듯 착용감이 뛰어납니다.",
+    "구김": "구김이 적어 관리가 쉽습니다.",
+    "사이즈": "사이즈 선택 고민을 줄이는 가이드 제공!",
+    "내구성": "프리미엄 소재와 내구성 있는 자재로 제작.",
+    "편안함": "무엇 하나 거슬리지 않는 편안함을 위해 연구.",
+    "효율성": "효율성을 위해 작은 구조까지 개선.",
+    "원단": "톡톡한 두께감의 원단으로 선택."
+})
+
+EMOTIONAL_KEYWORD_EXAMPLES = freeze({
+    "자유로움": "자유로움과 개성을 느낄 수 있게 해줍니다.",
+    "나만의": "나만의 공간과 감성을 담아낸 디자인.",
+    "자존심": "10년간의 자존심을 걸고 만든 맨투맨.",
+    "첫인상": "좋은 첫인상을 위한 포인트 아이템.",
+    "색다른 느낌": "색다른 느낌을 주고 싶은 날 스타일링하기 좋습니다.",
+    "섹시함": "커프스로 섹시함 3cm 더 키워보세요!",
+    "고급스러움": "고급스러움을 자랑하는 디테일.",
+    "트렌디함": "트렌디하고 스마트한 무드를 담았습니다.",
+    "디자인": "캐주얼한 디자인과 클래식함의 조화."
+})
+
+# 문제 제기 키워드 → 기본 빈도 (워드클라우드)
+PROBLEM_KEYWORDS = freeze({
+    "불편함": 60,
+    "세탁 용이": 55,
+    "맞춤형 추천": 50,
+    "합리적 가격": 48,
+    "착용감": 45,
+    "스타일 다양성": 43,
+    "높은 비용": 40,
+    "다양한 사이즈": 36,
+    "체형 보완": 35,
+    "TPO": 33,
+    "가성비": 31,
+    "계절감": 28,
+    "친환경": 15,
+    "코디 고민": 24,
+    "디테일 강조": 22,
+    "고급 원단": 15,
+    "기능 제한": 12,
+    "기능성 원단" : 18,
+    "활용도" : 20
+})
+
+# 요소 → 기본 예시 문장 (세부 요소가 있으면 세부 요소별 목록)
+ELEMENT_EXAMPLE_SENTENCES = freeze({
+    # 파이차트용 요소 (세부 분류 O)
+    "Brand": {
+        "Brand identity": [
+            "우리는 옷을 통해 삶의 가치를 높인다는 철학을 가지고 있습니다.",
+            "모두가 입을 수 있고 소중한 삶의 보탬이 되어줄 제품을 만드는 것이 유니핏의 신념이자 추구하는 방향입니다."
+        ],
+        "Creator profile/history": [
+            "학창시절부터 패션을 사랑해온 디자이너의 열정이 담겼습니다.",
+            "직접 겪은 실패와 회복의 경험이 이 프로젝트의 출발점이었습니다."
+        ],
+        "Project goal": [
+            "초기 제작 실패를 딛고 수차례 개선을 거쳐 완성했습니다.",
+            "고객 피드백을 반영하여 핏과 소재를 전면 수정했습니다."
+        ],
+        "Funding usage": [
+            "초기 제작 실패를 딛고 수차례 개선을 거쳐 완성했습니다.",
+            "고객 피드백을 반영하여 핏과 소재를 전면 수정했습니다."
+        ]
+    },
+
+    "External evaluation": {
+        "Third-party evaluations": [
+            "1,500개 이상의 구매 후기에서 4.9점의 평점을 기록했습니다.",
+            "후기 대부분이 '핏이 좋다', '재질이 고급스럽다'는 반응입니다."
+        ],
+        "Certificate": [
+            "KC 인증과 함께 OEKO-TEX 친환경 인증을 획득했습니다.",
+            "안심하고 착용하실 수 있도록 국가 품질 인증을 완료했습니다.",
+            "철저한 안전관리 및 프로세스 검침은 기본! 거기에 더해, 기본적으로행복한 직원이 훌륭한 제품을 만든다고 생각하기 때문에 받은WRAP 인증까지!"
+        ],
+        "Award": [
+            "국제 섬유 디자인 대회인 IFDA 2022에서 본 제품의 원단 배색과 패턴 디자인이 심사위원 만장일치로 우수상을 수상했습니다.",
+            "소비자가 뽑은 브랜드 대상 2년 연속 수상'은 저희 제품을 직접 경험하신 수많은 고객분들의 평가 덕분이었습니다.",
+            "저희 브랜드는 2023 K패션 어워즈에서 '올해의 혁신 디자인' 부문을 수상하며 제품력과 디자인 모두를 인정받았습니다."
+        ]
+    },
+
+    "Request to funders": {
+        "Discounts": [
+            "얼리버드 한정 수량으로 20% 할인 혜택을 드립니다.",
+            "재고 소진 시 추가 구매가 불가합니다."
+        ],
+        "Early bird benefits": [
+            "펀딩 초반 참여자에게만 제공되는 스페셜 리워드입니다.",
+            "48시간 이내 얼리버드 참여자에겐 특별 패키지를 드립니다."
+        ],
+        "Special offers": [
+            "목표 금액 달성 시 추가 리워드를 드립니다.",
+            "펀딩 참여자 전용 한정판 굿즈를 제공합니다."
+        ]
+    },
+
+    "FAQ": {
+        "Shipping/return/exchange": [
+            "리워드 수령으로부터 14일 이내에 발생한 초기 하자에 대해서는 본 A/S정책이 적용되지 않습니다.",
+            "세탁, 사용, 택 제거, 오염, 수선 등 이후 발생한 문제는 유상수리 및 왕복 택배비는 서포터님 부담으로 진행되며, 경우에 따라 (유상 수리가 불가할 정도로 심각한 훼손의 경우) 수리가 불가할 수 있습니다.",
+            "단순 변심에 의한 환불 및 교환은 불가합니다.(해당 상품은 네팔에서 직접 만들어서 오는 펀딩 상품으로 반품이나 교환이 쉽지 않습니다. 상품 자체의 문제일 경우 환불이 가능하지만, 그렇지 않은 경우 환불 및 교환이 불가함을 미리 공지드립니다."
+        ],
+        "Washing/care": [
+            "Q. 세탁 방법은 어떻게 되나요? 상세 페이지 하단에 상세한 세탁 방법을 안내드립니다. 드라이클리닝을 권장하며, 손세탁일 경우, 미온수와 중성세제를 사용하여 가볍게 세탁하시고 그늘진 곳에서 자연건조 하시기 바랍니다.",
+            "Q. 세탁시 주의사항이 있을까요? A. 세탁기에 30도 이하로 세탁하시면 됩니다. 면은 뜨거운 열을 가하면 줄어드는 게 필연이라, 건조기에는 절대 돌리지 마세요~ 축률을 최소화한 공정을 거쳤기 때문에 찬물로 빠시면 3% 이내로 축률을 막을 수 있습니다. 세탁기에서 꺼내신 후 널어서 말리시는 게 제일 좋습니다.",
+            "Q. 세탁은 어떻게 하나요?A. 세탁은 드라이 크리닝 하시길 권장합니다."
+        ],
+        "Customer concerns": [
+            "펀딩 마감 이후, 불가피한 사유로 배송지 변경이 필요하시다면 해당 페이지 내 '메이커에게 문의하기'를 통해 문의 부탁드립니다.",
+            "배송은 언제 시작되나요? A. 결제는 펀딩 기간이 종료 된 후 다음날부터 4일 동안 진행이 됩니다.",
+            "펀딩 기간 종료와 동시에 배송이 시작됩니다. 일반 배송은 4일동안 진행되며, 제주/도서산간 지역 배송은 최대 7일이 걸릴 수 있습니다."
+        ],
+        "Product usage": [
+            "펀딩 마감 이후, 불가피한 사유로 배송지 변경이 필요하시다면 해당 페이지 내 '메이커에게 문의하기'를 통해 문의 부탁드립니다.",
+            "배송은 언제 시작되나요? A. 결제는 펀딩 기간이 종료 된 후 다음날부터 4일 동안 진행이 됩니다.",
+            "펀딩 기간 종료와 동시에 배송이 시작됩니다. 일반 배송은 4일동안 진행되며, 제주/도서산간 지역 배송은 최대 7일이 걸릴 수 있습니다."
+        ]
+    },
+
+    # 워드클라우드용 요소 (단일 리스트)
+    "Problem/need": [
+        # "캐시미어는 정말 좋은 소재지만 좋은 소재에 가려져 원단만 강조되고 알게 모르게 옷이라면 지녀야 할 편안함, 디자인성들이 뒷전으로 가있는 소재이기도 합니다.",
+        # "기존의 점퍼 공식인, 30데니아 - 3레이어로도 샘플 테스트를 해봤는데, 역시 예상대로 리버서블에겐 너무 두껍고, 거슬리고, 움직임마저 편하지 않았어요.",
+        "여름 티셔츠는 비침이 심하거나 땀이 배어 불편합니다. 특수 가공 원단으로 땀 배임 없이 쾌적함을 유지합니다.",
+        "핏이 어정쩡하거나, 세탁 후 변형이 심한 옷이 많습니다. 세탁 후에도 형태 유지력이 뛰어난 소재를 사용했습니다.",
+        "매번 어울리는 옷 찾기가 어려워 스트레스를 받습니다. 베이직하면서도 고급스러운 핏으로 어떤 상황에서도 활용도 높습니다.",
+    ],
+
+    "Product detail": [
+        "핏은 레귤러 핏으로, 슬림하지도 벙벙하지도 않아 누구에게나 잘 어울립니다.",
+        "소재는 100% 코튼이며, 피부에 자극 없이 부드럽게 닿습니다.",
+        "컬러는 블랙, 아이보리, 그레이 등 데일리로 활용하기 좋습니다."
+    ],
+
+    "Product value": [
+        "기능적(F): 복잡한세상편하게살자! 바쁘고 바쁜 우리네 삶 실용성, 효율성 없으면 말짱 꽝이죠. [단정함]을 필요로 할 때 입을 수 있도록 휴대하기 쉽게! 가방 한켠에 쏘옥-, 주머니에 쏘옥- 정신없고답 없는 상황에서해답은 셔츠토시 뿐!",
+        "표현적(E): 도시적인 세련미를 표현할 수 있습니다.",
+        "심미적(A): 트렌드에 얽메이지 않는 유니크한 디자인 꽈배기, 와플, 베이직 니트 등등 베이직 디자인으로 식상했다면 유니크의 차별화된 디자인으로 매년 유니크하게 연출할 수 있습니다."
+    ]
+})
+
+# 요소 탭 구성 (요소 이름 / 분석 방법 / 기본 키워드 · 세부 요소 / 차트 종류)
+ELEMENT_ANALYSIS_INFO = freeze([
+    {"name": "Brand", "method": "세부 카테고리 요소 추출", "examples": ["Brand identity", "Creator profile/history", "Project goal", "Funding usage"], "chart_type": "pie"},
+    {"name": "Problem/need", "method": "키워드 빈도 분석", "examples": PROBLEM_KEYWORDS, "chart_type": "wordcloud"},
+    {"name": "Product detail", "method": "TTA 기반 키워드 분석", "examples": ["소재: 면", "핏: 루즈", "컬러: 블랙"], "chart_type": "treemap"},
+    {"name": "Product value", "method": "FEA 기반 추출", "examples": ["Functional: practical", "Expressive: emotional", "Aesthetic: aesthetic"], "chart_type": "radar"},
+    {"name": "External evaluation", "method": "세부 요소 추출", "examples": ["Third-party evaluations", "Certificate", "Award"], "chart_type": "pie"},
+    {"name": "Request to funders", "method": "세부 요소 추출", "examples": ["Discounts", "Early bird benefits", "Special offers"], "chart_type": "pie"},
+    {"name": "FAQ", "method": "세부 요소 추출", "examples": ["Shipping/return/exchange", "Washing/care", "Customer concerns", "Product usage"], "chart_type": "pie"}
+])
+
+# FEA 하위 속성과 예시 문장 사전
+FEA_DATA = freeze({
+    "Functional": {
+        "Fit": "핏이 잘 맞아서 활동하기 편했어요.",
+        "Material": "고급 원단을 사용해서 착용감이 좋습니다.",
+        "Comfort": "몸에 닿는 촉감이 부드럽고 편안합니다.",
+        "Utility": "소매가 길이 조절이 되어 실용적입니다.",
+        "Durability": "여러 번 세탁해도 형태가 유지돼요."
+    },
+    "Expressive": {
+        "Brand Identity": "이 브랜드는 언제나 나의 스타일을 대변해요.",
+        "Symbolism": "해당 로고는 저에게 의미가 있어요.",
+        "Cultural Code": "요즘 트렌드와 잘 맞는 감성이네요.",
+        "Social Message": "이 옷은 사회적 메시지를 담고 있어서 좋아요."
+    },
+    "Aesthetic": {
+        "Color": "톤다운된 그린 컬러가 마음에 들어요.",
+        "Style": "캐주얼한 스타일이라 자주 입을 수 있어요.",
+        "Silhouette": "핏이 전체적으로 예쁘게 떨어져요.",
+        "Details": "소매 단추 디테일이 고급스러워요.",
+        "Trends": "지금 유행하는 스타일이라서 선택했어요."
+    }
+})
+
+# 성공 사례 목록 파일(thumbnail.json)이 없을 때의 기본 사례
+DEFAULT_THUMBNAIL_CASES = freeze([
+    {
+        "url": "https://www.wadiz.kr/web/campaign/detail/362523?_refer_section_st=PREORDER_3",
+        "project_name": "3만원대ㅣ6억메이커의 팔뚝 얇아보이는 여름가디건! 냉감소재&워셔블",
+        "approach": "658%",
+        "project_thumbnail_path": "./resource/thumbnail/cardigan.png",
+        "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/06/27/3e41a96e-fca4-489b-ade3-e486174c5768.jpeg/wadiz/resize/800/format/jpg/quality/85/"
+    },
+    {
+        "url": "https://www.wadiz.kr/web/campaign/detail/356858?_refer_section_st=PREORDER_8",
+        "project_name": "[7억 | 소매치기 방지] 신박한 도포 재킷, 일상도 여행도 완벽히",
+        "approach": "1,142%",
+        "project_thumbnail_path": "./resource/thumbnail/도포jacket.png",
+        "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/05/16/8bce2f7e-320c-4259-b989-262e15dd3fc3.jpeg/wadiz/resize/800/format/jpg/quality/85/"
+    },
+    {
+        "url": "https://www.wadiz.kr/web/campaign/detail/343743?_refer_section_st=PREORDER_29",
+        "project_name": "[빠른배송] 실크같은 부드러움, 한여름까지 쾌적하게 2기장 5사이즈",
+        "approach": "18,225%",
+        "project_thumbnail_path": "./resource/thumbnail/silkpants.png",
+        "project_thumbnail_url": "https://cdn3.wadiz.kr/studio/images/2025/03/05/123356de-6992-4733-891f-e790ba679213.jpeg/wadiz/resize/800/format/jpg/quality/85/"
+    }
+])
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+# 스토리 구성 순서 분석 결과
+#   elements    : 요소 이름 목록 (코드 순서)
+#   n_campaigns : 분석한 캠페인 수
+#   support     : 요소별 등장 캠페인 수
+#   starts      : 요소별 첫 번째 요소로 등장한 캠페인 수
+#   transitions : (요소 수 × 요소 수) a 다음에 b가 바로 이어진 캠페인 수
+#   orders      : 상위 구성 순서 [(요소 목록, 캠페인 수), ...]
+#   consensus   : 대표 순서 (요소 간 선후 관계를 가장 많이 만족하는 순서)
+class StoryOrder:
+    def __init__(self, elements, n_campaigns, support, starts, transitions, orders, consensus):
+        self.elements = elements
+        self.n_campaigns = n_campaigns
+        self.support = support
+        self.starts = starts
+        self.transitions = transitions
+        self.orders = orders
+        self.consensus = consensus
+
+
+# 캠페인별 요소 첫 등장 순위 (캠페인 수 × 요소 수, 등장하지 않으면 -1)
+# 같은 요소가 여러 번 나와도 처음 나온 위치만 사용한다
+def first_positions(element_codes, campaign_starts, n_elements):
+    n_campaigns = len(campaign_starts) - 1
+    positions = np.full((n_campaigns, n_elements), -1, dtype=np.int16)
+    if n_campaigns <= 0 or len(element_codes) == 0:
+        return positions
+
+    campaigns = np.repeat(np.arange(n_campaigns, dtype=np.int64), np.diff(campaign_starts))
+    valid = element_codes >= 0
+    keys = campaigns[valid] * n_elements + element_codes[valid]
+    # (캠페인, 요소)별 첫 행 → 캠페인 안에서 첫 행 순서로 정렬해서 순위 매기기
+    unique_keys, first_rows = np.unique(keys, return_index=True)
+    campaign_of, element_of = np.divmod(unique_keys, n_elements)
+    order = np.lexsort((first_rows, campaign_of))
+    campaign_of, element_of = campaign_of[order], element_of[order]
+    rank = np.arange(len(order)) - np.searchsorted(campaign_of, campaign_of)
+    positions[campaign_of, element_of] = rank
+    return positions
+
+
+# 요소 코드 / 캠페인 경계 → StoryOrder (모든 계산은 캠페인 × 요소 정수 행렬 연산)
+def mine_story_order(element_codes, campaign_starts, elements, top_k=5):
+    n_elements = len(elements)
+    positions = first_positions(element_codes, campaign_starts, n_elements)
+    present = positions >= 0
+    n_campaigns = int(present.any(axis=1).sum())
+    positions, present = positions[present.any(axis=1)], present[present.any(axis=1)]
+    support = present.sum(axis=0)
+
+    # 캠페인별 순서 (순위 → 요소 코드, 남는 자리는 -1)
+    sequences = np.full(positions.shape, -1, dtype=np.int16)
+    campaign_of, element_of = np.nonzero(present)
+    sequences[campaign_of, positions[campaign_of, element_of]] = element_of
+
+    transitions = np.zeros((n_elements, n_elements), dtype=np.int64)
+    if n_elements > 1:
+        a, b = sequences[:, :-1], sequences[:, 1:]
+        linked = (a >= 0) & (b >= 0)
+        np.add.at(transitions, (a[linked], b[linked]), 1)
+    starts = np.bincount(sequences[:, 0][sequences[:, 0] >= 0], minlength=n_elements) if n_campaigns else \
+        np.zeros(n_elements, dtype=np.int64)
+
+    # 선후 관계 (a가 b보다 먼저 나온 캠페인 수) → 이긴 횟수 - 진 횟수로 대표 순서
+    precedence = np.zeros((n_elements, n_elements), dtype=np.int64)
+    for a in range(n_elements):
+        both = present[:, [a]] & present
+        precedence[a] = (both & (positions[:, [a]] < positions)).sum(axis=0)
+    score = (precedence - precedence.T).sum(axis=1)
+    mean_rank = np.where(support > 0, np.where(present, positions, 0).sum(axis=0) / np.maximum(support, 1), np.inf)
+    consensus = [elements[e] for e in np.lexsort((mean_rank, -score)) if support[e] > 0]
+
+    orders = []
+    if n_campaigns:
+        unique_sequences, counts = np.unique(sequences, axis=0, return_counts=True)
+        for i in np.argsort(-counts, kind="stable")[:top_k]:
+            orders.append(([elements[e] for e in unique_sequences[i] if e >= 0], int(counts[i])))
+
+    return StoryOrder(list(elements), n_campaigns, support, starts, transitions, orders, consensus)
@@ -0,0 +1,96 @@
+import math
+import threading
+
+import numpy as np
+
+from search_index import intersect_sorted
+
+
+# treemap 키워드 클릭 → "성공 사례" 카드
+# 키워드가 Product detail 문장에 (토큰 접두어로) 나오는 캠페인을 펀딩 달성률(approach) 내림차순으로 미리 정렬해 두고
+# 클릭할 때는 dict 조회만 한다. 달성률은 적재할 때 "18,225%" 같은 문자열에서 숫자로 한 번만 바꾼다
+
+CASE_ELEMENT = "Product detail"
+# 키워드별로 저장하는 사례 수 (카드는 앞의 몇 개만 표시)
+CASE_TOP_K = 10
+# 캠페인 단위 사례 정보 (캠페인 JSONL의 선택 필드, 코퍼스에 문장 행마다 복사)
+CASE_FIELDS = ["project_name", "url", "project_thumbnail_path", "project_thumbnail_url"]
+
+
+# 펀딩 달성률 → 숫자 (%, 쉼표 제거, 값이 없으면 None, 형식이 틀리면 ValueError)
+def parse_achievement(value):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"달성률 형식이 아닙니다: {value!r}")
+    if isinstance(value, (int, float)):
+        return None if math.isnan(value) else float(value)
+    text = str(value).strip().replace(",", "").removesuffix("%").strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"달성률 형식이 아닙니다: {value!r}") from None
+
+
+def format_achievement(value):
+    return f"{value:,.0f}%"
+
+
+class SuccessCaseIndex:
+    def __init__(self, corpus, keywords=(), element=CASE_ELEMENT, top_k=CASE_TOP_K):
+        self.corpus = corpus
+        self.element_rows = corpus.element_rows(element)
+        self.top_k = top_k
+        starts = corpus.campaign_starts[:-1]
+        df = corpus.df
+        # 캠페인별 달성률 (없으면 NaN → 사례 후보에서 제외)
+        if "approach" in df.columns:
+            values = df["approach"].to_numpy()[starts]
+            if values.dtype == object:
+                # 적재 단계를 거치지 않은 코퍼스 (문자열 그대로) → 인덱스를 만들 때 한 번만 변환
+                values = [parse_achievement(value) for value in values]
+            self.approach = np.asarray(values, dtype=float)
+        else:
+            self.approach = np.full(len(starts), np.nan)
+        self.fields = {field: df[field].to_numpy(dtype=object)[starts] if field in df.columns else None
+                       for field in CASE_FIELDS}
+        self._cases = {keyword: self._rank(keyword) for keyword in keywords}
+        # st.cache_resource로 모든 세션 스레드가 같은 인덱스를 쓰므로 사례 캐시는 lock 안에서만 읽고 쓴다
+        self._lock = threading.Lock()
+
+    # 키워드가 요소 문장에 나오는 캠페인 (bool, 캠페인 순번)
+    def campaign_mask(self, keyword):
+        search_index = self.corpus.search_index
+        rows = intersect_sorted(search_index.search_rows((keyword,)), self.element_rows)
+        mask = np.zeros(search_index.n_campaigns, dtype=bool)
+        mask[search_index.row_campaigns[rows]] = True
+        return mask
+
+    # 달성률 내림차순 (같으면 캠페인 순서) 상위 top_k개 사례
+    def _rank(self, keyword):
+        campaigns = np.flatnonzero(self.campaign_mask(keyword) & ~np.isnan(self.approach))
+        campaigns = campaigns[np.lexsort((campaigns, -self.approach[campaigns]))][:self.top_k]
+        return [self._case(campaign) for campaign in campaigns]
+
+    # thumbnail.json 항목과 같은 키 (+ campaign_id, approach_value)
+    def _case(self, campaign):
+        # 값이 없는 칸은 (categorical 컬럼이면 NaN) None
+        case = {field: None if values is None or not isinstance(values[campaign], str) else values[campaign]
+                for field, values in self.fields.items()}
+        campaign_id = str(self.corpus.campaign_keys[campaign])
+        case["campaign_id"] = campaign_id
+        case["project_name"] = case["project_name"] or campaign_id
+        case["approach_value"] = float(self.approach[campaign])
+        case["approach"] = format_achievement(case["approach_value"])
+        return case
+
+    # 키워드 → 상위 k개 사례 (미리 계산하지 않은 키워드는 처음 찾을 때 추가)
+    # 순위 계산은 lock 안에서 한다 (여러 세션이 같은 키워드를 처음 동시에 클릭해도 한 번만 계산)
+    def lookup(self, keyword, k=3):
+        with self._lock:
+            cases = self._cases.get(keyword)
+            if cases is None:
+                cases = self._cases[keyword] = self._rank(keyword)
+        return cases[:k]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 대시보드 모듈은 저장소 루트의 최상위 모듈
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,119 @@
+import json
+
+import pyarrow.parquet as pq
+import pytest
+
+from ingest import _part_path, _remove_uncommitted_parts, ingest_jsonl, read_checkpoint
+
+
+# 캠페인 JSONL 적재의 이어서 읽기 / 재시작 / 증분 갱신 결과 확인 (파트 디렉터리의 최종 문장 행 기준)
+
+
+def campaign(campaign_id, text, n_sentences=1):
+    return {"campaign_id": campaign_id, "item": "Top", "season": "Summer", "gender": "Female",
+            "sentences": [{"element": "Brand", "sub_element": "Brand identity", "sentence": f"{text} {i}"}
+                          for i in range(n_sentences)]}
+
+
+def write_jsonl(path, campaigns, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        for record in campaigns:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+# 파트 디렉터리 → {캠페인 ID: 정렬된 문장 목록}
+def corpus_sentences(out_dir):
+    table = pq.read_table(str(out_dir))
+    sentences = {}
+    for campaign_id, sentence in zip(table["campaign_id"].to_pylist(), table["sentence"].to_pylist()):
+        sentences.setdefault(campaign_id, []).append(sentence)
+    return {campaign_id: sorted(rows) for campaign_id, rows in sentences.items()}
+
+
+def expected_sentences(campaigns):
+    return {record["campaign_id"]: sorted(s["sentence"] for s in record["sentences"]) for record in campaigns}
+
+
+def test_ingest_writes_every_campaign(tmp_path):
+    campaigns = [campaign(str(i), f"문장{i}", 3) for i in range(20)]
+    write_jsonl(tmp_path / "a.jsonl", campaigns)
+    checkpoint = ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out", batch_rows=10)
+    assert checkpoint["campaigns"] == 20 and checkpoint["rows"] == 60
+    assert checkpoint["parts"] > 1
+    assert corpus_sentences(tmp_path / "out") == expected_sentences(campaigns)
+
+
+def test_appended_lines_are_read_from_checkpoint_offset(tmp_path):
+    first = [campaign(str(i), f"문장{i}") for i in range(10)]
+    added = [campaign(str(i), f"문장{i}") for i in range(10, 15)]
+    write_jsonl(tmp_path / "a.jsonl", first)
+    ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out", batch_rows=4)
+    write_jsonl(tmp_path / "a.jsonl", added, mode='a')
+    checkpoint = ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out", batch_rows=4)
+    assert checkpoint["campaigns"] == 15 and checkpoint["unchanged"] == 0
+    assert corpus_sentences(tmp_path / "out") == expected_sentences(first + added)
+
+
+def test_resume_after_interruption_does_not_duplicate_rows(tmp_path):
+    campaigns = [campaign(str(i), f"문장{i}", 2) for i in range(12)]
+    write_jsonl(tmp_path / "a.jsonl", campaigns)
+
+    def interrupt(checkpoint):
+        if checkpoint["parts"] == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out", batch_rows=4, progress=interrupt)
+    assert read_checkpoint(tmp_path / "out")["parts"] == 2
+
+    checkpoint = ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out", batch_rows=4)
+    assert checkpoint["campaigns"] == 12
+    assert corpus_sentences(tmp_path / "out") == expected_sentences(campaigns)
+
+
+def test_replaced_source_requires_restart_or_update(tmp_path):
+    write_jsonl(tmp_path / "a.jsonl", [campaign(str(i), f"문장{i}") for i in range(5)])
+    ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out")
+    write_jsonl(tmp_path / "a.jsonl", [campaign(str(i), f"다른{i}") for i in range(5)])
+    with pytest.raises(ValueError):
+        ingest_jsonl(tmp_path / "a.jsonl", tmp_path / "out")
+
+
+def test_update_skips_unchanged_and_replaces_changed_campaigns(tmp_path):
+    base = [campaign(str(i), f"문장{i}", 2) for i in range(6)]
+    write_jsonl(tmp_path / "base.jsonl", base)
+    ingest_jsonl(tmp_path / "base.jsonl", tmp_path / "out", batch_rows=4)
+
+    daily = [base[0], campaign("1", "바뀐1", 3), campaign("new", "새 캠페인")]
+    write_jsonl(tmp_path / "daily.jsonl", daily)
+    checkpoint = ingest_jsonl(tmp_path / "daily.jsonl", tmp_path / "out", batch_rows=4, update=True)
+    assert checkpoint["unchanged"] == 1 and checkpoint["replaced"] == 1
+    assert corpus_sentences(tmp_path / "out") == expected_sentences(base[:1] + daily[1:] + base[2:])
+
+
+# 같은 배치 안에서 캠페인이 다시 나오면 (manifest의 이전 내용과 같더라도) 마지막 레코드가 남아야 한다
+@pytest.mark.parametrize("batch_rows", [100, 1])
+def test_update_keeps_last_record_of_repeated_campaign(tmp_path, batch_rows):
+    v1, v2 = campaign("X", "처음"), campaign("X", "바뀐", 2)
+    write_jsonl(tmp_path / "base.jsonl", [v1, campaign("Y", "다른")])
+    ingest_jsonl(tmp_path / "base.jsonl", tmp_path / "out")
+
+    write_jsonl(tmp_path / "daily.jsonl", [v2, v1])
+    ingest_jsonl(tmp_path / "daily.jsonl", tmp_path / "out", batch_rows=batch_rows, update=True)
+    assert corpus_sentences(tmp_path / "out") == expected_sentences([v1, campaign("Y", "다른")])
+
+    # 다시 적재하면 변경 없음
+    unchanged = read_checkpoint(tmp_path / "out")["unchanged"]
+    write_jsonl(tmp_path / "again.jsonl", [v1])
+    checkpoint = ingest_jsonl(tmp_path / "again.jsonl", tmp_path / "out", update=True)
+    assert checkpoint["unchanged"] == unchanged + 1
+
+
+# 파트 번호가 5자리를 넘어도 체크포인트 이후의 파트만 지운다
+def test_remove_uncommitted_parts_beyond_five_digits(tmp_path):
+    for index in (99_998, 99_999, 100_000, 123_456):
+        open(_part_path(tmp_path, index), 'wb').close()
+    open(tmp_path / "part-notes.parquet", 'wb').close()
+    _remove_uncommitted_parts(tmp_path, 100_000)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["part-99998.parquet", "part-99999.parquet",
+                                                          "part-notes.parquet"]
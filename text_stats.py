@@ -0,0 +1,391 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from tokenizer import token_bigrams, tokenize_unique, tokenizer_fingerprint
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 키워드 통계 디스크 캐시 (토큰 설정 × 코퍼스 버전 해시별 파일 하나)
+STATS_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'keyword_stats')
+STATS_FORMAT_VERSION = 4
+
+# 토큰화/카운트 병렬 작업 수 (1이면 현재 프로세스에서 순차 처리)
+STATS_WORKERS = int(os.environ.get("FASHION_STATS_WORKERS", "1"))
+# 작업 수당 샤드 수 (샤드 크기가 고르지 않아도 작업이 고르게 나뉘도록)
+SHARDS_PER_WORKER = 4
+
+# 통계를 미리 합산해 두는 셀 단위 (요소 × item × season × gender)
+CELL_COLUMNS = ["element", "item", "season", "gender"]
+# 필터를 적용하지 않는 선택값
+ALL_VALUE = "All"
+
+
+# 통계 캐시 파일 이름 앞부분 (형식 버전 + 토큰 설정, 조사 제거 여부가 다르면 다른 파일)
+def _stats_prefix():
+    return f"{STATS_FORMAT_VERSION}-{tokenizer_fingerprint()}-"
+
+
+# 행렬 각 행에서 값이 큰 순서로 최대 top_n개 열 번호 (동점이면 열 번호 순)
+# 모든 행을 lexsort 한 번으로 처리한다
+def top_n_per_row(matrix, top_n):
+    matrix = sp.csr_matrix(matrix)
+    matrix.eliminate_zeros()
+    matrix.sort_indices()
+    row_ids = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    order = np.lexsort((matrix.indices, -matrix.data, row_ids))
+    rank = np.arange(len(order)) - matrix.indptr[row_ids[order]]
+    keep = order[rank < top_n]
+    result = [[] for _ in range(matrix.shape[0])]
+    for row, col in zip(row_ids[keep], matrix.indices[keep]):
+        result[row].append(col)
+    return result
+
+
+# 문서별 토큰 목록 → (sparse 카운트 행렬, 정렬된 어휘)
+# 전체 토큰을 한 번에 factorize 해서 열 번호를 만들고 같은 칸의 중복을 합산한다
+def count_matrix(documents):
+    lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    tokens = list(chain.from_iterable(documents))
+    columns, vocab = pd.factorize(pd.Series(tokens, dtype=object), sort=True)
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    matrix = sp.csr_matrix(
+        (np.ones(len(tokens), dtype=np.int32), columns.astype(np.int32), indptr),
+        shape=(len(documents), len(vocab)),
+    )
+    matrix.sum_duplicates()
+    return matrix, np.asarray(vocab, dtype=str)
+
+
+# 문장 목록 → ((unigram 카운트 행렬, 어휘), (bigram 카운트 행렬, 어휘))
+# 고유 문장만 한 번 토큰화하고 같은 토큰으로 unigram / bigram을 모두 센다
+def count_tokens(sentences):
+    codes, tokens = tokenize_unique(sentences)
+    unigrams = count_matrix(tokens)
+    bigrams = count_matrix([token_bigrams(document) for document in tokens])
+    return tuple((matrix[codes], vocab) for matrix, vocab in (unigrams, bigrams))
+
+
+# 문서별 토큰 목록 → 이미 만든 정렬 어휘 기준 카운트 행렬 (어휘에 없는 토큰은 무시)
+# 통계에 없는 새 문서(스토리 초안 등)를 같은 열 번호로 세는 데 사용
+def vocab_count_matrix(documents, vocab):
+    lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    tokens = np.asarray(list(chain.from_iterable(documents)), dtype=str)
+    rows = np.repeat(np.arange(len(documents)), lengths)
+    columns = np.searchsorted(vocab, tokens).clip(max=max(len(vocab) - 1, 0))
+    found = vocab[columns] == tokens if len(vocab) else np.zeros(len(tokens), dtype=bool)
+    matrix = sp.csr_matrix(
+        (np.ones(int(found.sum()), dtype=np.int32), (rows[found], columns[found])),
+        shape=(len(documents), len(vocab)),
+    )
+    matrix.sum_duplicates()
+    return matrix
+
+
+# 카운트 행렬 열 번호를 다른 (더 큰) 정렬 어휘 기준으로 변환
+def remap_columns(matrix, vocab, target_vocab):
+    columns = np.searchsorted(target_vocab, vocab).astype(np.int32)
+    return sp.csr_matrix(
+        (matrix.data, columns[matrix.indices], matrix.indptr),
+        shape=(matrix.shape[0], len(target_vocab)),
+    )
+
+
+# 샤드별 카운트 행렬 병합 (로컬 어휘 → 전체 어휘 열 번호로 변환 후 세로로 합치기)
+# 샤드 어휘는 정렬되어 있고 변환이 순서를 보존하므로 순차 처리 결과와 같다
+def merge_count_matrices(shards):
+    vocab = np.unique(np.concatenate([shard_vocab for _, shard_vocab in shards])) if shards else np.empty(0, dtype=str)
+    matrices = [remap_columns(matrix, shard_vocab, vocab) for matrix, shard_vocab in shards]
+    if not matrices:
+        return sp.csr_matrix((0, 0), dtype=np.int32), vocab
+    return sp.vstack(matrices, format="csr"), vocab
+
+
+# 문장 목록을 캠페인 경계에 맞춰 샤드로 나누고 프로세스 풀에서 count_tokens
+# campaign_starts: 캠페인별 시작 행 번호 (마지막 값 = 전체 문장 수)
+def parallel_count_tokens(sentences, campaign_starts, workers=STATS_WORKERS):
+    if workers is None or workers <= 1 or len(campaign_starts) <= 2:
+        return count_tokens(sentences)
+
+    n_shards = min(workers * SHARDS_PER_WORKER, len(campaign_starts) - 1)
+    # 문장 수 기준으로 고르게 나눈 위치를 가장 가까운 캠페인 경계로 맞춤
+    targets = np.linspace(0, len(sentences), n_shards + 1)
+    bounds = np.unique(campaign_starts[np.searchsorted(campaign_starts, targets)])
+    bounds[-1] = len(sentences)
+    tasks = [sentences[start:end] for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shards = list(executor.map(count_tokens, tasks))
+    return (merge_count_matrices([unigrams for unigrams, _ in shards]),
+            merge_count_matrices([bigrams for _, bigrams in shards]))
+
+
+# 문장 단위 bigram 카운트 엔진
+# 전체 코퍼스에 한 번 fit 한 어휘를 모든 요소/필터 조합에서 재사용한다
+class BigramEngine:
+    def __init__(self, sentence_bigrams, vocab):
+        # (문장 수 × bigram 수) sparse 카운트 행렬
+        self.sentence_bigrams = sentence_bigrams
+        self.vocab = vocab
+
+        # 단어 → bigram 역색인 (단어 수 × bigram 수, 0/1 sparse 행렬)
+        pairs = [bigram.split(" ") for bigram in self.vocab]
+        self.words = sorted({word for pair in pairs for word in pair})
+        self.word_index = {word: i for i, word in enumerate(self.words)}
+        rows = [self.word_index[pair[0]] for pair in pairs] + [self.word_index[pair[1]] for pair in pairs]
+        cols = np.tile(np.arange(len(pairs)), 2)
+        word_bigrams = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.int8), (rows, cols)),
+            shape=(len(self.words), len(pairs)),
+        )
+        # "a a" 같은 bigram은 중복 합산되므로 0/1로 되돌림
+        word_bigrams.data[:] = 1
+        self.word_bigrams = word_bigrams
+
+    @classmethod
+    def fit(cls, sentences):
+        return cls(*count_tokens(sentences)[1])
+
+    # 주어진 문장 행들의 bigram 빈도 (dense 벡터, 길이 = bigram 수)
+    def bigram_counts(self, rows):
+        return np.asarray(self.sentence_bigrams[rows].sum(axis=0)).ravel()
+
+    # 단어별 관련 bigram 상위 top_n개 (모든 단어를 한 번의 sparse 연산으로 계산)
+    def related_bigrams(self, words, bigram_counts, top_n=3):
+        indices = [self.word_index.get(word) for word in words]
+        valid = [i for i in indices if i is not None]
+        if not valid:
+            return {word: [] for word in words}
+
+        scores = self.word_bigrams[valid].multiply(bigram_counts[np.newaxis, :])
+        top_cols = top_n_per_row(scores, top_n)
+
+        result, position = {}, 0
+        for word, index in zip(words, indices):
+            if index is None:
+                result[word] = []
+            else:
+                result[word] = [str(self.vocab[col]) for col in top_cols[position]]
+                position += 1
+        return result
+
+
+# 요소 × item × season × gender 셀별 unigram / bigram 빈도표
+# 문장 단위 행렬(토큰화 결과)과 셀 단위 합계를 함께 저장해서
+# 넓은 필터는 셀 합산으로, 키워드 필터처럼 셀로 나눌 수 없는 조건은 행 합산으로 계산한다
+class KeywordStats:
+    def __init__(self, version, categories, unigram_vocab, sentence_unigrams, bigram_vocab, sentence_bigrams,
+                 row_cells, cell_codes, campaign_keys, campaign_hashes, campaign_starts,
+                 cell_unigrams=None, cell_bigrams=None):
+        self.version = version
+        # 캠페인 ID / 내용 해시 / 시작 행 (증분 갱신 시 재사용할 문장 행 찾기)
+        self.campaign_keys = campaign_keys
+        self.campaign_hashes = campaign_hashes
+        self.campaign_starts = campaign_starts
+        self.categories = categories
+        self.unigram_vocab = unigram_vocab
+        self.sentence_unigrams = sentence_unigrams
+        self.bigrams = BigramEngine(sentence_bigrams, bigram_vocab)
+        self.row_cells = row_cells
+        self.cell_codes = cell_codes
+
+        if cell_unigrams is None or cell_bigrams is None:
+            # 셀 지시 행렬 (셀 수 × 문장 수)로 문장 단위 카운트를 셀별로 합산
+            indicator = sp.csr_matrix(
+                (np.ones(len(row_cells), dtype=np.int32), (row_cells, np.arange(len(row_cells)))),
+                shape=(len(cell_codes), len(row_cells)),
+            )
+            cell_unigrams = (indicator @ sentence_unigrams).tocsr()
+            cell_bigrams = (indicator @ sentence_bigrams).tocsr()
+        self.cell_unigrams = cell_unigrams
+        self.cell_bigrams = cell_bigrams
+
+    @classmethod
+    def build(cls, corpus, workers=STATS_WORKERS):
+        (sentence_unigrams, unigram_vocab), (sentence_bigrams, bigram_vocab) = parallel_count_tokens(
+            corpus.sentences, corpus.campaign_starts, workers)
+        return cls._from_counts(corpus, unigram_vocab, sentence_unigrams, bigram_vocab, sentence_bigrams)
+
+    # 이전 통계에서 내용 해시가 같은 캠페인의 문장 행은 그대로 가져오고
+    # 새 캠페인 / 바뀐 캠페인의 문장만 토큰화해서 전체 통계를 만든다
+    @classmethod
+    def update(cls, previous, corpus, workers=STATS_WORKERS):
+        starts = corpus.campaign_starts
+        lengths = np.diff(starts)
+        previous_index = {key: i for i, key in enumerate(previous.campaign_keys)}
+        source = np.array([previous_index.get(key, -1) for key in corpus.campaign_keys], dtype=np.int64)
+        reused = source >= 0
+        reused[reused] = previous.campaign_hashes[source[reused]] == corpus.campaign_hashes[reused]
+        reused &= np.diff(previous.campaign_starts)[np.maximum(source, 0)] == lengths
+
+        # 재사용 캠페인의 (이전 행 번호) / 새로 셀 행 번호
+        reused_rows = np.repeat(reused, lengths)
+        fresh_rows = np.flatnonzero(~reused_rows)
+        offsets = np.arange(len(corpus)) - np.repeat(starts[:-1], lengths)
+        previous_rows = (np.repeat(previous.campaign_starts[:-1][np.maximum(source, 0)], lengths) + offsets)[reused_rows]
+        fresh_starts = np.concatenate(([0], np.cumsum(lengths[~reused])))
+        fresh = parallel_count_tokens(corpus.sentences[fresh_rows], fresh_starts, workers)
+
+        # 새 행 순서 = 재사용 행 + 새 행을 코퍼스 행 순서로 되돌린 것
+        order = np.argsort(np.concatenate((np.flatnonzero(reused_rows), fresh_rows)), kind="stable")
+        counts = []
+        for (matrix, vocab), (fresh_matrix, fresh_vocab) in zip(
+                ((previous.sentence_unigrams, previous.unigram_vocab),
+                 (previous.bigrams.sentence_bigrams, previous.bigrams.vocab)), fresh):
+            kept = matrix[previous_rows]
+            # 재사용 행에만 남은 어휘와 새 행의 어휘 합집합 (사라진 캠페인에만 있던 단어는 제외)
+            target_vocab = np.union1d(vocab[np.unique(kept.indices)], fresh_vocab)
+            combined = sp.vstack([remap_columns(kept, vocab, target_vocab),
+                                  remap_columns(fresh_matrix, fresh_vocab, target_vocab)], format="csr")
+            counts.append((target_vocab, combined[order]))
+        (unigram_vocab, sentence_unigrams), (bigram_vocab, sentence_bigrams) = counts
+        return cls._from_counts(corpus, unigram_vocab, sentence_unigrams, bigram_vocab, sentence_bigrams)
+
+    @classmethod
+    def _from_counts(cls, corpus, unigram_vocab, sentence_unigrams, bigram_vocab, sentence_bigrams):
+        columns = [col for col in CELL_COLUMNS if col in corpus.codes]
+        row_codes = np.column_stack([
+            corpus.codes[col] if col in corpus.codes else np.zeros(len(corpus), dtype=np.int8)
+            for col in CELL_COLUMNS
+        ]).astype(np.int16)
+        cell_codes, row_cells = np.unique(row_codes, axis=0, return_inverse=True)
+
+        categories = {col: list(corpus.categories[col]) for col in columns}
+        return cls(corpus.version, categories, unigram_vocab, sentence_unigrams, bigram_vocab, sentence_bigrams,
+                   row_cells.ravel(), cell_codes, corpus.campaign_keys, corpus.campaign_hashes,
+                   corpus.campaign_starts)
+
+    @classmethod
+    def load_or_build(cls, corpus, cache_dir=STATS_CACHE_DIR, workers=STATS_WORKERS):
+        path = os.path.join(cache_dir, f"{_stats_prefix()}{corpus.version}.npz")
+        if os.path.exists(path):
+            try:
+                return cls.load(path)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        # 이전 코퍼스 버전의 통계가 있으면 바뀐 캠페인만 다시 계산
+        previous = cls.load_previous(cache_dir, exclude=path)
+        if previous is not None and len(previous.campaign_keys):
+            stats = cls.update(previous, corpus, workers)
+        else:
+            stats = cls.build(corpus, workers)
+        stats.save(path)
+        return stats
+
+    # 캐시 디렉터리에 남아 있는 같은 형식 / 같은 토큰 설정의 통계 (없거나 읽을 수 없으면 None)
+    @classmethod
+    def load_previous(cls, cache_dir=STATS_CACHE_DIR, exclude=None):
+        try:
+            names = sorted(os.listdir(cache_dir))
+        except OSError:
+            return None
+        for name in names:
+            path = os.path.join(cache_dir, name)
+            if name.startswith(_stats_prefix()) and name.endswith(".npz") and path != exclude:
+                try:
+                    return cls.load(path)
+                except (OSError, ValueError, KeyError):
+                    continue
+        return None
+
+    def save(self, path):
+        arrays = {
+            "version": np.array(self.version),
+            "categories": np.array(json.dumps(self.categories, ensure_ascii=False)),
+            "unigram_vocab": self.unigram_vocab,
+            "bigram_vocab": self.bigrams.vocab,
+            "row_cells": self.row_cells,
+            "cell_codes": self.cell_codes,
+            "campaign_keys": self.campaign_keys,
+            "campaign_hashes": self.campaign_hashes,
+            "campaign_starts": self.campaign_starts,
+        }
+        for name in ("sentence_unigrams", "cell_unigrams", "cell_bigrams"):
+            arrays.update(_csr_arrays(name, getattr(self, name)))
+        arrays.update(_csr_arrays("sentence_bigrams", self.bigrams.sentence_bigrams))
+
+        try:
+            cache_dir = os.path.dirname(path)
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, **arrays)
+            os.replace(tmp_path, path)
+            # 같은 토큰 설정의 이전 코퍼스 버전 캐시와 이전 형식 캐시 삭제 (다른 토큰 설정의 캐시는 유지)
+            for name in os.listdir(cache_dir):
+                stale = name.startswith(_stats_prefix()) or not name.startswith(f"{STATS_FORMAT_VERSION}-")
+                if name.endswith(".npz") and stale and os.path.join(cache_dir, name) != path:
+                    os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            # 캐시 저장 실패는 무시 (다음 실행에서 다시 계산)
+            pass
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                str(data["version"]),
+                json.loads(str(data["categories"])),
+                data["unigram_vocab"],
+                _csr_from_arrays(data, "sentence_unigrams"),
+                data["bigram_vocab"],
+                _csr_from_arrays(data, "sentence_bigrams"),
+                data["row_cells"],
+                data["cell_codes"],
+                data["campaign_keys"],
+                data["campaign_hashes"],
+                data["campaign_starts"],
+                _csr_from_arrays(data, "cell_unigrams"),
+                _csr_from_arrays(data, "cell_bigrams"),
+            )
+
+    # 요소 + 필터 조건에 해당하는 셀 번호 (None / "All"은 전체)
+    def select_cells(self, element, item=None, season=None, gender=None):
+        mask = np.ones(len(self.cell_codes), dtype=bool)
+        for i, (col, value) in enumerate(zip(CELL_COLUMNS, (element, item, season, gender))):
+            if value is None or value == ALL_VALUE or col not in self.categories:
+                continue
+            values = self.categories[col]
+            code = values.index(value) if value in values else -2
+            mask &= self.cell_codes[:, i] == code
+        return np.flatnonzero(mask)
+
+    # 셀 합산 빈도 (unigram 벡터, bigram 벡터)
+    def cell_counts(self, cells):
+        return (np.asarray(self.cell_unigrams[cells].sum(axis=0)).ravel(),
+                np.asarray(self.cell_bigrams[cells].sum(axis=0)).ravel())
+
+    # 문장 행 합산 빈도 (unigram 벡터, bigram 벡터)
+    def row_counts(self, rows):
+        return (np.asarray(self.sentence_unigrams[rows].sum(axis=0)).ravel(),
+                self.bigrams.bigram_counts(rows))
+
+    # unigram 빈도 벡터 → 상위 n개 {키워드: 빈도} (동점이면 어휘 순)
+    def top_keywords(self, unigram_counts, n=None):
+        nonzero = np.flatnonzero(unigram_counts)
+        order = nonzero[np.lexsort((nonzero, -unigram_counts[nonzero]))]
+        if n is not None:
+            order = order[:n]
+        return {str(self.unigram_vocab[i]): int(unigram_counts[i]) for i in order}
+
+
+def _csr_arrays(name, matrix):
+    return {
+        f"{name}_data": matrix.data,
+        f"{name}_indices": matrix.indices,
+        f"{name}_indptr": matrix.indptr,
+        f"{name}_shape": np.array(matrix.shape),
+    }
+
+
+def _csr_from_arrays(data, name):
+    return sp.csr_matrix(
+        (data[f"{name}_data"], data[f"{name}_indices"], data[f"{name}_indptr"]),
+        shape=tuple(data[f"{name}_shape"]),
+    )
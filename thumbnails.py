@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+
+from PIL import Image, features
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 카드용 썸네일 변환 결과 저장 경로 (파일 이름 = 원본 내용 해시 + 너비)
+THUMBNAIL_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'thumbnails')
+# 성공 사례 목록 (FASHION_THUMBNAIL_JSON 환경 변수로 다른 파일 지정 가능)
+THUMBNAIL_JSON_PATH = os.environ.get("FASHION_THUMBNAIL_JSON", os.path.join(BASE_DIR, 'resource', 'thumbnail', 'thumbnail.json'))
+
+# 카드 이미지는 100~120px로 표시되므로 고해상도 화면을 고려해 2배 크기로 변환
+THUMBNAIL_WIDTH = 240
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+_MIME_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+
+
+# 썸네일 경로 (상대 경로는 프로젝트 기준)
+def resolve_thumbnail_path(path):
+    if not path:
+        return None
+    if not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    return path if os.path.exists(path) else None
+
+
+def _content_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+# 원본 이미지 → 카드 크기 변환본 경로 (이미 있으면 재사용)
+def build_thumbnail(src_path, width=THUMBNAIL_WIDTH, fmt=THUMBNAIL_FORMAT, out_dir=THUMBNAIL_CACHE_DIR):
+    ext = "webp" if fmt == "WEBP" else "jpg"
+    out_path = os.path.join(out_dir, f"{_content_hash(src_path)}-{width}.{ext}")
+    if os.path.exists(out_path):
+        return out_path
+
+    os.makedirs(out_dir, exist_ok=True)
+    with Image.open(src_path) as image:
+        image = image.convert("RGB")
+        image.thumbnail((width, width * 4), Image.LANCZOS)
+        tmp_path = f"{out_path}.{os.getpid()}.tmp"
+        image.save(tmp_path, format=fmt, quality=THUMBNAIL_QUALITY)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+# 원본 경로 + mtime → 변환본 경로 (원본이 바뀌면 mtime이 달라져 다시 만든다)
+@lru_cache(maxsize=256)
+def _thumbnail_variant(src_path, mtime_ns, width):
+    return build_thumbnail(src_path, width)
+
+
+# 변환본을 base64 data URI로 (메모리 LRU)
+@lru_cache(maxsize=256)
+def _thumbnail_data_uri(src_path, mtime_ns, width):
+    with open(_thumbnail_variant(src_path, mtime_ns, width), 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode('ascii')
+    return f"data:{_MIME_TYPES[THUMBNAIL_FORMAT]};base64,{encoded}"
+
+
+# 캠페인 썸네일 → 로컬 변환본 파일 경로 (로컬 이미지가 없으면 원격 URL)
+def thumbnail_file(case, width=THUMBNAIL_WIDTH):
+    src_path = resolve_thumbnail_path(case.get('project_thumbnail_path'))
+    if src_path is None:
+        return case.get('project_thumbnail_url')
+    try:
+        return _thumbnail_variant(src_path, os.stat(src_path).st_mtime_ns, width)
+    except OSError:
+        return case.get('project_thumbnail_url')
+
+
+# 캠페인 썸네일 → HTML <img src> 값 (로컬 변환본을 인라인, 없으면 원격 URL)
+def thumbnail_src(case, width=THUMBNAIL_WIDTH):
+    src_path = resolve_thumbnail_path(case.get('project_thumbnail_path'))
+    if src_path is None:
+        return case.get('project_thumbnail_url')
+    try:
+        return _thumbnail_data_uri(src_path, os.stat(src_path).st_mtime_ns, width)
+    except OSError:
+        return case.get('project_thumbnail_url')
+
+
+# 배포 전에 썸네일 변환본 미리 만들기
+# python thumbnails.py [thumbnail.json]
+if __name__ == "__main__":
+    json_path = sys.argv[1] if len(sys.argv) > 1 else THUMBNAIL_JSON_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        cases = json.load(f)
+    for case in cases:
+        print(f"{case.get('project_thumbnail_path')} → {thumbnail_file(case)}")
@@ -0,0 +1,67 @@
+import os
+import re
+import unicodedata
+from functools import lru_cache
+
+import pandas as pd
+
+
+# 키워드 통계용 공용 토크나이저
+# unigram / bigram / 키워드 목록이 모두 같은 토큰을 사용하도록 여기서만 토큰을 만든다
+
+# 단어 앞뒤에서 떼어내는 문장 부호
+STRIP_CHARS = ".,!\"'()[]"
+# 공백으로 나뉜 단어에서 앞뒤 문장 부호를 뺀 부분 (단어 안쪽의 부호는 유지)
+# 두 글자 이상인 토큰만 매칭되므로 한 글자 토큰은 따로 거르지 않는다
+_STRIP_CLASS = re.escape(STRIP_CHARS)
+TOKEN_PATTERN = re.compile(rf"[^\s{_STRIP_CLASS}]\S*[^\s{_STRIP_CLASS}]")
+MIN_TOKEN_LENGTH = 2
+
+# 조사 제거 여부 (기본값: 사용 안 함)
+STRIP_PARTICLES = os.environ.get("FASHION_STRIP_PARTICLES", "0") == "1"
+# 토큰 규칙 버전 (규칙을 바꾸면 올린다, 조사 제거 여부와 함께 통계 / 집계 캐시를 구분하는 데 쓴다)
+TOKENIZER_VERSION = 1
+# 단어 끝에서 떼어내는 조사 (긴 것부터 비교, 조사를 뗀 나머지도 두 글자 이상일 때만)
+PARTICLES = sorted([
+    "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "으로", "만",
+    "에서", "에게", "까지", "부터", "처럼", "보다", "이나", "이랑", "랑", "하고",
+], key=len, reverse=True)
+PARTICLE_PATTERN = re.compile(rf"^(.{{{MIN_TOKEN_LENGTH},}}?)(?:{'|'.join(PARTICLES)})$")
+
+TOKEN_CACHE_SIZE = 65536
+
+
+# 문장 정규화 (한글 자모 조합형 → 완성형)
+def normalize(sentence):
+    return unicodedata.normalize("NFC", sentence)
+
+
+# 토큰 설정 식별자 (같은 값이면 같은 문장에서 같은 토큰이 나온다)
+def tokenizer_fingerprint(strip_particles=STRIP_PARTICLES):
+    return f"tok{TOKENIZER_VERSION}{'+particles' if strip_particles else ''}"
+
+
+def strip_particle(token):
+    match = PARTICLE_PATTERN.match(token)
+    return match.group(1) if match else token
+
+
+# 문장 → 토큰 튜플 (같은 문장은 LRU 캐시에서 재사용)
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def tokenize(sentence, strip_particles=STRIP_PARTICLES):
+    tokens = TOKEN_PATTERN.findall(normalize(sentence))
+    if strip_particles:
+        return tuple(strip_particle(token) for token in tokens)
+    return tuple(tokens)
+
+
+# 토큰 튜플 → 인접한 두 토큰의 bigram ("a b")
+def token_bigrams(tokens):
+    return [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+# 문장 목록 → (문장별 고유 문장 번호, 고유 문장별 토큰 튜플)
+# 중복 문장은 한 번만 토큰화한다
+def tokenize_unique(sentences):
+    codes, uniques = pd.factorize(pd.Series(sentences, dtype=object))
+    return codes, [tokenize(sentence) for sentence in uniques]